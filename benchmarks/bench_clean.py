@@ -0,0 +1,92 @@
+"""기사 설명 정리(HTML → 텍스트) 벤치마크
+
+네이버/다음 형태(강조 태그와 엔티티가 섞인 문단), 구글 뉴스 형태(관련 기사 링크 목록),
+태그 없는 텍스트를 섞은 설명 수천 개로 기존 방식(BeautifulSoup 트리 + 매번 컴파일하는 정규식 +
+글자 수 자르기)과 현재 clean_description + truncate_text를 비교합니다.
+
+실행:
+    python -m benchmarks.bench_clean --count 5000
+"""
+import argparse
+import random
+import re
+import time
+
+from bs4 import BeautifulSoup
+
+from benchmarks.bench_dedup import PRESS, make_headline, make_vocabulary
+from news.parsing import clean_description, truncate_text
+
+def legacy_clean(description: str) -> str:
+    """이전 방식 (news.parsing.clean_description 교체 전)"""
+    if not description:
+        return ''
+    soup = BeautifulSoup(description, 'html.parser')
+    description = soup.get_text(separator=' ', strip=True)
+    description = re.sub(r'\s+', ' ', description)
+    return re.sub(r'\S{50,}', '', description).strip()
+
+def legacy_truncate(description: str, max_length: int) -> str:
+    return description[:max_length] + '...' if len(description) > max_length else description
+
+def make_paragraph(rng: random.Random, vocabulary) -> str:
+    sentences = []
+    for _ in range(rng.randint(2, 4)):
+        words = make_headline(rng, vocabulary).split()
+        words[rng.randrange(len(words))] = f'<b>{words[0]}</b>'
+        sentences.append(' '.join(words) + rng.choice(['했다.', '이다.', '밝혔다.']))
+    text = ' '.join(sentences).replace(' ', ' &quot;', 1)
+    return f'<p>{text}&nbsp;&middot; {rng.choice(PRESS)} 기자</p>'
+
+def make_google(rng: random.Random, vocabulary):
+    """(설명, 제목) - 관련 기사 링크 목록"""
+    titles = [make_headline(rng, vocabulary) for _ in range(rng.randint(1, 5))]
+    items = ''.join(
+        f'<li><a href="https://news.google.com/rss/articles/{rng.getrandbits(128):x}?oc=5" target="_blank">'
+        f'{title}</a>&nbsp;&nbsp;<font color="#6f6f6f">{rng.choice(PRESS)}</font></li>'
+        for title in titles
+    )
+    return f'<ol>{items}</ol>', f'{titles[0]} - {rng.choice(PRESS)}'
+
+def build_dataset(count: int, seed: int):
+    rng = random.Random(seed)
+    vocabulary = make_vocabulary(rng)
+    items = []
+    for _ in range(count):
+        kind = rng.random()
+        if kind < 0.4:
+            items.append((make_paragraph(rng, vocabulary), ''))
+        elif kind < 0.8:
+            items.append(make_google(rng, vocabulary))
+        else:
+            items.append((' '.join(make_headline(rng, vocabulary) for _ in range(3)), ''))
+    return items
+
+def run(items, clean, truncate, max_length: int):
+    start = time.perf_counter()
+    results = [truncate(clean(description, title), max_length) for description, title in items]
+    return time.perf_counter() - start, results
+
+def main():
+    parser = argparse.ArgumentParser(description='기사 설명 정리 벤치마크')
+    parser.add_argument('--count', type=int, default=5000)
+    parser.add_argument('--max-length', type=int, default=150)
+    parser.add_argument('--seed', type=int, default=42)
+    args = parser.parse_args()
+    
+    items = build_dataset(args.count, args.seed)
+    runs = [
+        ('BeautifulSoup (기존)', run(items, lambda description, _: legacy_clean(description), legacy_truncate,
+                                     args.max_length)),
+        ('html.parser 정리', run(items, clean_description, truncate_text, args.max_length))
+    ]
+    
+    print(f"설명 {len(items)}개 (최대 길이 {args.max_length}자)")
+    baseline = runs[0][1][0]
+    for name, (elapsed, results) in runs:
+        average = sum(len(result) for result in results) / len(results)
+        print(f"{name:<20} {elapsed * 1000:9.1f}ms  {elapsed / len(items) * 1e6:7.1f}us/건  "
+              f"x{baseline / elapsed:4.1f}  평균 {average:5.1f}자")
+
+if __name__ == '__main__':
+    main()
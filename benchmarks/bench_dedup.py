@@ -0,0 +1,123 @@
+"""유사 기사 중복 검사 벤치마크
+
+합성 헤드라인 수천 개(일부는 언론사 꼬리표, [단독] 머리표, 단어 변형을 넣은 유사 제목)로
+DedupIndex와 기존 방식(정확한 제목 비교), 전체 쌍 비교 방식을 비교합니다.
+
+실행:
+    python -m benchmarks.bench_dedup --count 5000 --similarity 0.85
+"""
+import argparse
+import random
+import time
+
+from news.dedup import DedupIndex, hamming_distance, normalize_title, simhash
+
+SYLLABLES = '가나다라마바사아자차카타파하강남동서북삼성전자반도체금리환율보안해킹정부투자시장플랫폼데이터'
+FIXED_WORDS = ['삼성전자', 'SK하이닉스', '네이버', '카카오', '코스피', '인공지능', '랜섬웨어', '3분기', '영업이익']
+
+PRESS = ['연합뉴스', '조선일보', '매일경제', '한국경제', 'ZDNet Korea', '전자신문', '머니투데이']
+TAGS = ['[단독]', '[속보]', '(종합)', '[포토]']
+
+def make_vocabulary(rng: random.Random, size: int = 3000):
+    words = set(FIXED_WORDS)
+    while len(words) < size:
+        words.add(''.join(rng.choice(SYLLABLES) for _ in range(rng.randint(2, 4))))
+    return sorted(words)
+
+def make_headline(rng: random.Random, vocabulary) -> str:
+    return ' '.join(rng.sample(vocabulary, rng.randint(6, 9)))
+
+def make_variant(rng: random.Random, title: str) -> str:
+    """언론사/머리표/단어 하나 변형"""
+    words = title.split()
+    choice = rng.random()
+    if choice < 0.3:
+        return f"{title} - {rng.choice(PRESS)}"
+    if choice < 0.6:
+        return f"{rng.choice(TAGS)} {title}"
+    if choice < 0.8:
+        words[rng.randrange(len(words))] += rng.choice(['했다', '한다', '…', '?!'])
+        return ' '.join(words)
+    return ', '.join(words[:2]) + ' ' + ' '.join(words[2:]) + f" | {rng.choice(PRESS)}"
+
+def build_dataset(count: int, duplicate_ratio: float, seed: int):
+    """(URL, 제목, 원본 번호) 목록 생성. 같은 원본 번호는 같은 기사"""
+    rng = random.Random(seed)
+    vocabulary = make_vocabulary(rng)
+    originals = [make_headline(rng, vocabulary) for _ in range(int(count * (1 - duplicate_ratio)))]
+    items = [(f'https://news.example.com/{i}', title, i) for i, title in enumerate(originals)]
+    for i in range(count - len(originals)):
+        story = rng.randrange(len(originals))
+        items.append((f'https://other.example.com/{i}?utm_source=rss', make_variant(rng, originals[story]), story))
+    rng.shuffle(items)
+    return items
+
+def run_index(items, similarity: float):
+    index = DedupIndex(similarity=similarity)
+    start = time.perf_counter()
+    decisions = [not index.add_if_new(url, title) for url, title, _ in items]
+    return time.perf_counter() - start, decisions
+
+def run_exact(items):
+    used_urls, used_titles = set(), set()
+    start = time.perf_counter()
+    decisions = []
+    for url, title, _ in items:
+        duplicate = url in used_urls or title in used_titles
+        if not duplicate:
+            used_urls.add(url)
+            used_titles.add(title)
+        decisions.append(duplicate)
+    return time.perf_counter() - start, decisions
+
+def run_pairwise(items, similarity: float):
+    """모든 기존 지문과 비교하는 O(n²) 기준선"""
+    max_distance = int(round((1 - similarity) * 64))
+    kept = []
+    start = time.perf_counter()
+    decisions = []
+    for _, title, _ in items:
+        fingerprint = simhash(normalize_title(title))
+        duplicate = any(hamming_distance(fingerprint, other) <= max_distance for other in kept)
+        if not duplicate:
+            kept.append(fingerprint)
+        decisions.append(duplicate)
+    return time.perf_counter() - start, decisions
+
+def score(items, decisions):
+    """(중복 검출률, 오검출률) - 같은 기사의 두 번째 이후 등장만 중복이 정답"""
+    seen = set()
+    hits = misses = false_positives = firsts = 0
+    for (_, _, story), decision in zip(items, decisions):
+        if story in seen:
+            hits += decision
+            misses += not decision
+        else:
+            seen.add(story)
+            firsts += 1
+            false_positives += decision
+    recall = hits / (hits + misses) if hits + misses else 1.0
+    return recall, false_positives / firsts
+
+def main():
+    parser = argparse.ArgumentParser(description='유사 기사 중복 검사 벤치마크')
+    parser.add_argument('--count', type=int, default=5000)
+    parser.add_argument('--duplicate-ratio', type=float, default=0.3)
+    parser.add_argument('--similarity', type=float, default=0.85)
+    parser.add_argument('--seed', type=int, default=42)
+    parser.add_argument('--skip-pairwise', action='store_true', help='O(n²) 기준선 생략')
+    args = parser.parse_args()
+    
+    items = build_dataset(args.count, args.duplicate_ratio, args.seed)
+    runs = [('정확 일치 (기존)', run_exact(items)), ('DedupIndex', run_index(items, args.similarity))]
+    if not args.skip_pairwise:
+        runs.append(('전체 쌍 비교', run_pairwise(items, args.similarity)))
+    
+    print(f"헤드라인 {len(items)}개 (유사 제목 비율 {args.duplicate_ratio:.0%}, 유사도 기준 {args.similarity})")
+    for name, (elapsed, decisions) in runs:
+        recall, false_positive = score(items, decisions)
+        print(f"{name:<14} {elapsed * 1000:9.1f}ms  {elapsed / len(items) * 1e6:7.1f}us/건  "
+              f"중복 검출률 {recall:6.1%}  오검출률 {false_positive:6.2%}")
+
+if __name__ == '__main__':
+    main()
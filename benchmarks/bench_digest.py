@@ -0,0 +1,203 @@
+"""뉴스 리포트 생성 전체 과정 재현 벤치마크
+
+로컬 스텁 서버(benchmarks/stub_server.py)가 녹화되었거나 합성한 구글/네이버/다음 RSS와
+NewsAPI 응답을 돌려주고, 실제 봇과 같은 경로로 카테고리별 수집(fetch_categorized_news_async),
+요약, 리포트 생성(텍스트/임베드)을 실행하여 단계별 시간, 최대 메모리, 소스별 요청 수를 측정합니다.
+
+시나리오:
+    default: 설정된 카테고리 그대로, 응답 지연 50ms
+    degraded: 느린 응답(꼬리 지연)과 실패가 섞인 소스
+    large: 카테고리 200개 × 키워드 5개, 피드당 기사 50개
+
+baselines.json에 저장된 기준보다 tolerance 비율 이상 느려지거나 메모리를 더 쓰거나
+요청 수가 늘어나면 종료 코드 1로 끝납니다.
+
+실행:
+    python -m benchmarks.bench_digest --scenario default
+    python -m benchmarks.bench_digest --scenario all --update-baseline
+    python -m benchmarks.bench_digest --record  # 실제 응답 녹화 (네트워크 필요)
+"""
+import argparse
+import asyncio
+import json
+import logging
+import os
+import statistics
+import sys
+import time
+import tracemalloc
+from typing import Dict
+
+from benchmarks.stub_server import StubNewsServer, record
+from config import Config
+from news.fetcher import NewsFetcher
+from news.renderer import ReportRenderer
+from news.sources import build_sources
+from news.summarizer import NewsSummarizer
+
+BASELINE_PATH = os.path.join(os.path.dirname(__file__), 'baselines.json')
+
+SCENARIOS = {
+    'default': {'items': 20, 'latency': 0.05},
+    'degraded': {'items': 20, 'latency': 0.15, 'failure_rate': 0.2, 'tail_rate': 0.05, 'tail_latency': 3.0},
+    'large': {'categories': 200, 'keywords': 5, 'items': 50, 'latency': 0.05}
+}
+
+def make_categories(count: int, keywords: int) -> Dict[str, Dict]:
+    """합성 카테고리 (카테고리마다 서로 다른 키워드)"""
+    return {
+        f'카테고리{i:03d}': {'keywords': [f'주제{i:03d}키워드{k}' for k in range(keywords)], 'emoji': '📰'}
+        for i in range(count)
+    }
+
+async def run_once(server: StubNewsServer, categories: Dict[str, Dict], news_per_category: int,
+                   time_budget: float, source_timeout: float) -> Dict:
+    """수집 → 요약 → 리포트 생성 한 번 실행"""
+    fetcher = NewsFetcher('benchmark', sources=build_sources(server.source_configs()),
+                          source_timeout=source_timeout, ranking=Config.RANKING_ENABLED,
+                          ranking_candidates=Config.RANKING_CANDIDATE_FACTOR,
+                          ranking_half_life=Config.RANKING_HALF_LIFE_HOURS)
+    fetcher.base_url = server.newsapi_url
+    summarizer = NewsSummarizer(None)
+    emojis = {name: info.get('emoji', '📰') for name, info in categories.items()}
+    
+    try:
+        started = time.perf_counter()
+        categorized = await fetcher.fetch_categorized_news_async(categories, news_per_category,
+                                                                 time_budget=time_budget)
+        fetched = time.perf_counter()
+        summaries = await summarizer.summarize_report_async(categorized)
+        summarized = time.perf_counter()
+        text = summarizer.create_daily_news_report(categorized, emojis, summaries)
+        embeds = ReportRenderer().render(categorized, emojis, summaries)
+        rendered = time.perf_counter()
+    finally:
+        await fetcher.close()
+        fetcher.parse_pool.shutdown()
+        summarizer.parse_pool.shutdown()
+    
+    return {
+        'fetch_seconds': fetched - started,
+        'summarize_seconds': summarized - fetched,
+        'render_seconds': rendered - summarized,
+        'total_seconds': rendered - started,
+        'articles': sum(len(articles) for articles in categorized.values()),
+        'text_messages': len(text),
+        'embed_messages': len(embeds)
+    }
+
+async def run_scenario(name: str, args) -> Dict:
+    options = dict(SCENARIOS[name])
+    category_count = options.pop('categories', None)
+    keyword_count = options.pop('keywords', 5)
+    categories = make_categories(category_count, keyword_count) if category_count else Config.NEWS_CATEGORIES
+    
+    server = StubNewsServer(**options)
+    await server.start()
+    try:
+        # 첫 실행은 연결/임포트 준비 시간이 섞이므로 버림
+        await run_once(server, categories, args.news_per_category, args.time_budget, args.source_timeout)
+        
+        runs = []
+        server.reset_counts()
+        for _ in range(args.repeat):
+            runs.append(await run_once(server, categories, args.news_per_category, args.time_budget,
+                                       args.source_timeout))
+        requests = sum(server.requests.values()) // args.repeat
+        failures = sum(server.failures.values()) // args.repeat
+        
+        # 메모리는 추적 비용이 시간 측정에 섞이지 않도록 따로 한 번 더 실행
+        tracemalloc.start()
+        try:
+            await run_once(server, categories, args.news_per_category, args.time_budget, args.source_timeout)
+            _, peak = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+    finally:
+        await server.close()
+    
+    result = {key: statistics.median(run[key] for run in runs) for key in runs[0]}
+    result.update(categories=len(categories), requests=requests, failures=failures, peak_mb=peak / 1024 / 1024)
+    return result
+
+# 측정 잡음으로 보는 최소 차이 (아주 짧은 단계가 비율만으로 실패하지 않도록)
+MIN_DELTA = {'fetch_seconds': 0.02, 'summarize_seconds': 0.02, 'render_seconds': 0.02, 'total_seconds': 0.02,
+             'peak_mb': 0.5, 'requests': 2}
+
+def check_regressions(name: str, result: Dict, baseline: Dict, tolerance: float):
+    """기준보다 tolerance 비율 이상 나빠진 항목 목록"""
+    regressions = []
+    for key, min_delta in MIN_DELTA.items():
+        if key not in baseline:
+            continue
+        limit = max(baseline[key] * (1 + tolerance), baseline[key] + min_delta)
+        if result[key] > limit:
+            regressions.append(f"{name}: {key} {result[key]:.4g} > 기준 {baseline[key]:.4g} (허용 {limit:.4g})")
+    return regressions
+
+def print_result(name: str, result: Dict):
+    print(f"[{name}] 카테고리 {result['categories']}개, 기사 {result['articles']}개, "
+          f"요청 {result['requests']}회 (주입 실패 {result['failures']}회)")
+    print(f"  수집 {result['fetch_seconds'] * 1000:8.1f}ms  요약 {result['summarize_seconds'] * 1000:8.1f}ms  "
+          f"렌더링 {result['render_seconds'] * 1000:8.1f}ms  전체 {result['total_seconds'] * 1000:8.1f}ms")
+    print(f"  최대 메모리 {result['peak_mb']:.1f}MB  메시지: 텍스트 {result['text_messages']}개 / "
+          f"임베드 {result['embed_messages']}개")
+
+def main():
+    parser = argparse.ArgumentParser(description='뉴스 리포트 생성 재현 벤치마크')
+    parser.add_argument('--scenario', default='default', choices=sorted(SCENARIOS) + ['all'])
+    parser.add_argument('--repeat', type=int, default=3)
+    parser.add_argument('--news-per-category', type=int, default=Config.NEWS_PER_CATEGORY)
+    parser.add_argument('--time-budget', type=float, default=Config.FETCH_TIME_BUDGET)
+    parser.add_argument('--source-timeout', type=float, default=Config.SOURCE_TIMEOUT)
+    parser.add_argument('--baseline', default=BASELINE_PATH)
+    parser.add_argument('--tolerance', type=float, default=0.25, help='허용하는 기준 대비 증가 비율')
+    parser.add_argument('--update-baseline', action='store_true', help='이번 결과를 기준으로 저장')
+    parser.add_argument('--json', action='store_true', help='결과를 JSON으로 출력')
+    parser.add_argument('--record', action='store_true', help='실제 소스 응답을 fixtures/에 녹화')
+    args = parser.parse_args()
+    
+    logging.basicConfig(level=logging.CRITICAL)
+    
+    if args.record:
+        asyncio.run(record(Config.NEWS_CATEGORIES, Config.NEWSAPI_KEY))
+        return
+    
+    names = sorted(SCENARIOS) if args.scenario == 'all' else [args.scenario]
+    results = {name: asyncio.run(run_scenario(name, args)) for name in names}
+    
+    baselines = {}
+    if os.path.exists(args.baseline):
+        with open(args.baseline, encoding='utf-8') as f:
+            baselines = json.load(f)
+    
+    if args.json:
+        print(json.dumps(results, ensure_ascii=False, indent=2))
+    else:
+        for name, result in results.items():
+            print_result(name, result)
+    
+    if args.update_baseline:
+        baselines.update({
+            name: {key: round(value, 4) if isinstance(value, float) else value for key, value in result.items()}
+            for name, result in results.items()
+        })
+        with open(args.baseline, 'w', encoding='utf-8') as f:
+            json.dump(baselines, f, ensure_ascii=False, indent=2, sort_keys=True)
+            f.write('\n')
+        print(f"기준 저장: {args.baseline}")
+        return
+    
+    regressions = [
+        regression
+        for name, result in results.items() if name in baselines
+        for regression in check_regressions(name, result, baselines[name], args.tolerance)
+    ]
+    if regressions:
+        print('성능 저하:')
+        for regression in regressions:
+            print(f"  {regression}")
+        sys.exit(1)
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,75 @@
+"""기사 관련도 순위 벤치마크
+
+카테고리 키워드가 제목/설명에 섞인 합성 후보 수천 개로 score_articles(키워드 TF-IDF, 최신성,
+출처 수)를 계산하는 시간과 상위 기사 중 키워드를 포함한 비율을 측정합니다.
+
+실행:
+    python -m benchmarks.bench_rank --count 5000
+"""
+import argparse
+import random
+import time
+
+from benchmarks.bench_dedup import PRESS, make_headline, make_vocabulary
+from config import Config
+from news.article import Article
+from news.ranking import rank_articles, score_articles
+
+def build_dataset(count: int, keywords, relevant_ratio: float, seed: int):
+    """(기사 목록, 출처 수 목록) - relevant_ratio 비율의 기사에 키워드 포함"""
+    rng = random.Random(seed)
+    vocabulary = make_vocabulary(rng)
+    now = time.time()
+    articles, coverage = [], []
+    for _ in range(count):
+        title = make_headline(rng, vocabulary)
+        description = ' '.join(make_headline(rng, vocabulary) for _ in range(3))
+        if rng.random() < relevant_ratio:
+            keyword = rng.choice(keywords)
+            if rng.random() < 0.5:
+                title = f'{keyword} {title}'
+            else:
+                description = f'{description} {keyword}'
+        articles.append(Article(
+            title=f'{title} - {rng.choice(PRESS)}',
+            description=f'<b>{description}</b>',
+            url=f'https://example.com/{rng.getrandbits(64):x}',
+            published=now - rng.uniform(0, 48 * 60 * 60)
+        ))
+        coverage.append(1 + int(rng.expovariate(1.5)))
+    return articles, coverage
+
+def main():
+    parser = argparse.ArgumentParser(description='기사 관련도 순위 벤치마크')
+    parser.add_argument('--count', type=int, default=5000)
+    parser.add_argument('--category', default='정보보안', choices=sorted(Config.NEWS_CATEGORIES))
+    parser.add_argument('--relevant-ratio', type=float, default=0.2)
+    parser.add_argument('--limit', type=int, default=Config.NEWS_PER_CATEGORY)
+    parser.add_argument('--repeat', type=int, default=5)
+    parser.add_argument('--seed', type=int, default=42)
+    args = parser.parse_args()
+    
+    info = Config.NEWS_CATEGORIES[args.category]
+    keywords = info['keywords']
+    articles, coverage = build_dataset(args.count, keywords, args.relevant_ratio, args.seed)
+    
+    timings = []
+    for _ in range(args.repeat):
+        start = time.perf_counter()
+        score_articles(articles, keywords, coverage, info.get('ranking'))
+        timings.append(time.perf_counter() - start)
+    elapsed = min(timings)
+    
+    def relevant(article):
+        return any(keyword in article.title or keyword in article.description for keyword in keywords)
+    
+    ranked = rank_articles(articles, keywords, args.limit, coverage, info.get('ranking'))
+    first = articles[:args.limit]
+    
+    print(f"후보 {len(articles)}개 ({args.category}, 키워드 포함 {args.relevant_ratio:.0%})")
+    print(f"점수 계산 {elapsed * 1000:8.1f}ms  {elapsed / len(articles) * 1e6:6.1f}us/건")
+    print(f"상위 {args.limit}개 중 키워드 포함: 순위 {sum(map(relevant, ranked))}개 / "
+          f"수집 순서 {sum(map(relevant, first))}개")
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,271 @@
+"""벤치마크용 로컬 뉴스 서버
+
+구글/네이버/다음 RSS 검색과 NewsAPI /v2/everything 응답을 흉내 냅니다.
+fixtures/<소스>/ 폴더에 녹화된 응답이 있으면 그대로 돌려주고, 없으면 키워드별로
+고정된 합성 기사(소스끼리 일부 겹치는 유사 제목 포함)를 각 서비스 형식으로 만들어 돌려줍니다.
+요청마다 지연 시간, 느린 응답(꼬리 지연), 실패(HTTP 500)를 주입할 수 있습니다.
+"""
+import asyncio
+import hashlib
+import json
+import os
+import random
+from collections import Counter
+from email.utils import formatdate
+from typing import Dict, List, Optional
+from urllib.parse import quote
+from xml.sax.saxutils import escape
+
+import aiohttp
+from aiohttp import web
+
+from benchmarks.bench_dedup import PRESS, make_headline, make_variant, make_vocabulary
+from config import Config
+from news.sources import QueryPlan, RSSFeedSource, build_sources
+
+FIXTURES_DIR = os.path.join(os.path.dirname(__file__), 'fixtures')
+
+def fixture_path(source_key: str, query: str) -> str:
+    """녹화 파일 경로 (검색어의 해시로 파일 이름 생성)"""
+    name = hashlib.sha1(query.encode('utf-8')).hexdigest()[:16]
+    extension = 'json' if source_key == 'newsapi' else 'xml'
+    return os.path.join(FIXTURES_DIR, source_key, f'{name}.{extension}')
+
+class StubNewsServer:
+    """녹화/합성 응답을 돌려주는 로컬 HTTP 서버
+    
+    Args:
+        items: 요청 하나에 돌려줄 기사 수
+        latency: 기본 응답 지연(초)
+        jitter: 지연 변동 비율 (0.5면 latency의 ±50%)
+        tail_rate / tail_latency: 이 비율의 요청은 tail_latency초 동안 지연
+        failure_rate: 이 비율의 요청은 HTTP 500으로 실패
+        overlap: 다른 소스와 같은 기사(유사 제목)를 돌려줄 비율
+        source_latency: 소스별 기본 지연 덮어쓰기 (예: {'naver': 0.8})
+    """
+    
+    def __init__(self, items: int = 20, latency: float = 0.05, jitter: float = 0.5, tail_rate: float = 0.0,
+                 tail_latency: float = 2.0, failure_rate: float = 0.0, overlap: float = 0.3,
+                 source_latency: Optional[Dict[str, float]] = None, use_fixtures: bool = True, seed: int = 42):
+        self.items = items
+        self.latency = latency
+        self.jitter = jitter
+        self.tail_rate = tail_rate
+        self.tail_latency = tail_latency
+        self.failure_rate = failure_rate
+        self.overlap = overlap
+        self.source_latency = source_latency or {}
+        self.use_fixtures = use_fixtures
+        self.seed = seed
+        
+        self.requests = Counter()  # 소스별 요청 수
+        self.failures = Counter()  # 소스별 주입한 실패 수
+        self._rng = random.Random(seed)
+        self._vocabulary = make_vocabulary(random.Random(seed), size=5000)
+        self._runner: Optional[web.AppRunner] = None
+        self.ports: Dict[str, int] = {}  # 소스별 포트 (호스트별 동시 연결 제한이 실제처럼 소스마다 따로 적용되도록)
+    
+    def base_url(self, source_key: str) -> str:
+        return f'http://127.0.0.1:{self.ports[source_key]}'
+    
+    def source_configs(self, source_configs: Optional[List[Dict]] = None) -> List[Dict]:
+        """소스 설정(기본값: Config.NEWS_SOURCES)의 RSS 주소를 이 서버로 바꾼 사본"""
+        configs = []
+        for source_config in source_configs if source_configs is not None else Config.NEWS_SOURCES:
+            source_config = dict(source_config)
+            if source_config.get('type', 'rss') == 'rss':
+                source_key = source_config['key']
+                source_config['url'] = f"{self.base_url(source_key)}/rss/{source_key}?q={{keyword}}"
+            configs.append(source_config)
+        return configs
+    
+    @property
+    def newsapi_url(self) -> str:
+        """NewsFetcher.base_url로 쓸 주소"""
+        return f"{self.base_url('newsapi')}/newsapi/v2"
+    
+    def reset_counts(self):
+        self.requests.clear()
+        self.failures.clear()
+    
+    async def start(self, source_keys: Optional[List[str]] = None):
+        """서버 시작 (소스마다 빈 포트 하나씩 사용)"""
+        app = web.Application()
+        app.router.add_get('/rss/{source}', self._handle_rss)
+        app.router.add_get('/newsapi/v2/everything', self._handle_newsapi)
+        
+        self._runner = web.AppRunner(app, access_log=None)
+        await self._runner.setup()
+        
+        source_keys = source_keys or [source_config['key'] for source_config in Config.NEWS_SOURCES]
+        for source_key in dict.fromkeys(list(source_keys) + ['newsapi']):
+            site = web.TCPSite(self._runner, '127.0.0.1', 0)
+            await site.start()
+            self.ports[source_key] = site._server.sockets[0].getsockname()[1]
+    
+    async def close(self):
+        if self._runner:
+            await self._runner.cleanup()
+            self._runner = None
+    
+    async def _delay(self, source_key: str) -> bool:
+        """지연 주입 후 이번 요청을 실패시킬지 반환"""
+        self.requests[source_key] += 1
+        latency = self.source_latency.get(source_key, self.latency)
+        if self._rng.random() < self.tail_rate:
+            latency = self.tail_latency
+        elif latency:
+            latency *= 1 + self.jitter * (2 * self._rng.random() - 1)
+        if latency > 0:
+            await asyncio.sleep(latency)
+        
+        if self._rng.random() < self.failure_rate:
+            self.failures[source_key] += 1
+            return True
+        return False
+    
+    async def _handle_rss(self, request: web.Request) -> web.Response:
+        source_key = request.match_info['source']
+        keyword = request.query.get('q', '')  # 소스의 검색어 (OR로 묶인 키워드 포함)
+        if await self._delay(source_key):
+            return web.Response(status=500, text='injected failure')
+        
+        body = self._load_fixture(source_key, keyword)
+        if body is None:
+            body = self._render_rss(source_key, keyword).encode('utf-8')
+        return web.Response(body=body, content_type='application/rss+xml', charset='utf-8')
+    
+    async def _handle_newsapi(self, request: web.Request) -> web.Response:
+        query = request.query.get('q', '')
+        if await self._delay('newsapi'):
+            return web.Response(status=500, text='injected failure')
+        
+        body = self._load_fixture('newsapi', query)
+        if body is None:
+            page_size = int(request.query.get('pageSize', self.items))
+            body = json.dumps(self._render_newsapi(query, page_size), ensure_ascii=False).encode('utf-8')
+        return web.Response(body=body, content_type='application/json')
+    
+    def _load_fixture(self, source_key: str, query: str) -> Optional[bytes]:
+        if not self.use_fixtures:
+            return None
+        path = fixture_path(source_key, query)
+        if not os.path.exists(path):
+            return None
+        with open(path, 'rb') as f:
+            return f.read()
+    
+    def _articles(self, source_key: str, keyword: str, count: int) -> List[Dict]:
+        """키워드별로 고정된 기사 목록 (소스끼리 overlap 비율만큼 같은 기사를 다른 제목으로)"""
+        story_rng = random.Random(f'{self.seed}:{keyword}')
+        stories = [make_headline(story_rng, self._vocabulary) for _ in range(count * 2)]
+        rng = random.Random(f'{self.seed}:{source_key}:{keyword}')
+        
+        articles = []
+        for i in range(count):
+            if rng.random() < self.overlap:
+                # 여러 소스가 공유하는 앞쪽 기사를 약간 다른 제목으로
+                story = rng.randrange(count)
+                title = make_variant(rng, f'{keyword} {stories[story]}')
+                url = f'https://{rng.choice(["news", "m.news", "www.news"])}.example.com/{quote(keyword)}/{story}'
+            else:
+                story = count + rng.randrange(count)
+                title = f'{keyword} {stories[story]}'
+                url = f'https://{source_key}.example.com/{quote(keyword)}/{i}'
+            
+            articles.append({
+                'title': title,
+                'url': url,
+                'description': f'<p><b>{keyword}</b> {make_headline(rng, self._vocabulary)} '
+                               f'{make_headline(rng, self._vocabulary)}</p>',
+                'source': rng.choice(PRESS),
+                'published': formatdate(1760000000 + i * 60, usegmt=True)
+            })
+        return articles
+    
+    def _render_rss(self, source_key: str, keyword: str) -> str:
+        items = []
+        for article in self._articles(source_key, keyword, self.items):
+            source = ''
+            if source_key == 'google':
+                source = f'<source url="https://press.example.com">{escape(article["source"])}</source>'
+            items.append(
+                f'<item><title>{escape(article["title"])}</title><link>{escape(article["url"])}</link>'
+                f'<description>{escape(article["description"])}</description>'
+                f'<pubDate>{article["published"]}</pubDate>{source}</item>'
+            )
+        return (
+            '<?xml version="1.0" encoding="UTF-8"?><rss version="2.0"><channel>'
+            f'<title>{escape(keyword)} - {source_key}</title><link>https://{source_key}.example.com</link>'
+            f'<description>{source_key} news search</description>{"".join(items)}</channel></rss>'
+        )
+    
+    def _render_newsapi(self, query: str, page_size: int) -> Dict:
+        articles = self._articles('newsapi', query, page_size)
+        return {
+            'status': 'ok',
+            'totalResults': len(articles),
+            'articles': [
+                {
+                    'source': {'id': None, 'name': article['source']},
+                    'author': '',
+                    'title': article['title'],
+                    'description': article['description'],
+                    'url': article['url'],
+                    'urlToImage': '',
+                    'publishedAt': article['published'],
+                    'content': ''
+                }
+                for article in articles
+            ]
+        }
+
+async def record(categories: Dict[str, Dict], api_key: str = '', source_configs: Optional[List[Dict]] = None,
+                 timeout: float = 15, newsapi_url: str = 'https://newsapi.org/v2') -> int:
+    """실제 소스 응답을 fixtures/ 폴더에 녹화 (네트워크 필요)
+    
+    RSS 소스는 봇과 같은 검색 계획(QueryPlan, plan_queries)으로 만든 검색어별 피드를,
+    NewsAPI는 카테고리 키워드 OR 검색 결과를 검색어를 키로 저장합니다.
+    
+    Returns:
+        저장한 응답 수
+    """
+    plan = QueryPlan(info.get('keywords', []) for info in categories.values())
+    queries = [' OR '.join(info.get('keywords', [])) for info in categories.values()]
+    
+    async with aiohttp.ClientSession(timeout=aiohttp.ClientTimeout(total=timeout)) as session:
+        async def save(source_key: str, query: str, url: str, params: Optional[Dict] = None):
+            try:
+                async with session.get(url, params=params) as response:
+                    response.raise_for_status()
+                    body = await response.read()
+            except Exception as e:
+                print(f"녹화 실패 ({source_key}, {query}): {e}")
+                return False
+            
+            path = fixture_path(source_key, query)
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            with open(path, 'wb') as f:
+                f.write(body)
+            return True
+        
+        tasks = []
+        for source in build_sources(source_configs if source_configs is not None else Config.NEWS_SOURCES):
+            if isinstance(source, RSSFeedSource):
+                # 카테고리 사이에 겹치는 검색어는 한 번만 녹화
+                planned = {
+                    tuple(query): None
+                    for info in categories.values()
+                    for query in source.plan_queries(info.get('keywords', []), plan.shared)
+                }
+                tasks.extend(save(source.key, source.query_text(list(query)), source.build_url(list(query)))
+                             for query in planned)
+            elif api_key:
+                tasks.extend(save(source.key, query, f'{newsapi_url}/everything',
+                                  {'apiKey': api_key, 'q': query, 'language': source.language,
+                                   'sortBy': 'publishedAt', 'pageSize': 20})
+                             for query in queries)
+        saved = sum(await asyncio.gather(*tasks))
+    
+    print(f"녹화 완료: {saved}/{len(tasks)}개 응답 ({FIXTURES_DIR})")
+    return saved
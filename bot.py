@@ -1,139 +1,655 @@
+import time
+PROCESS_STARTED = time.monotonic()  # 시작 시간 측정 기준 (모듈 임포트 시간 포함)
+
 import discord
 from discord.ext import commands
+import importlib
+import io
+import re
+import asyncio
 import logging
 from datetime import datetime
+from typing import Dict, List, Optional, Set, Tuple
 
 from config import Config
-from news.fetcher import NewsFetcher
-from news.summarizer import NewsSummarizer
-from utils.scheduler import NewsScheduler
-
-# 로깅 설정
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-    handlers=[
-        logging.FileHandler('bot.log', encoding='utf-8'),
-        logging.StreamHandler()
-    ]
-)
+from news.fetcher import NewsFetcher, SOURCE_FETCH_SECONDS, ARTICLES
+from news.summarizer import NewsSummarizer, SUMMARIZE_SECONDS
+from news.parsing import ParsePool
+from news.cache import FeedCache, DigestCache, SummaryCache
+from news.history import SentHistory
+from news.subscriptions import SubscriptionStore
+from news.store import ArticleStore
+from news.health import SourceHealth, CLOSED, HALF_OPEN
+from news.renderer import ReportRenderer, BREAKING_TITLE, BREAKING_FOOTER
+from news.dedup import DedupIndex
+from news.article import Article
+from utils.scheduler import NewsScheduler, JOB_SECONDS
+from utils.dispatcher import MessageDispatcher, PRIORITY_SCHEDULED, PRIORITY_MANUAL
+from utils.metrics import MetricsServer, LoopLagMonitor, gauge, histogram
+from utils.profiling import LoopBlockWatchdog, profile_call
+from utils.logs import setup_logging, new_digest_id, span
+
+# 로깅 설정 (파일/콘솔 쓰기는 별도 스레드에서 처리)
+log_listener = setup_logging(Config.LOG_PATH, Config.LOG_LEVEL, json_format=Config.LOG_FORMAT == 'json',
+                             max_bytes=Config.LOG_MAX_MB * 1024 * 1024, backup_count=Config.LOG_BACKUP_COUNT,
+                             when=Config.LOG_ROTATE_WHEN)
 logger = logging.getLogger(__name__)
 
+STARTUP_SECONDS = gauge('newsbot_startup_seconds', '프로세스 시작부터 시작 단계별 완료까지 걸린 시간', ['stage'])
+STARTUP_LABELS = {'import': '모듈 로딩', 'login': '로그인', 'init': '초기화', 'ready': '준비', 'warmup': '예열'}
+REPORT_BUILD_SECONDS = histogram('newsbot_report_build_seconds', '리포트 생성 단계별 시간 (pool: 수집, render: 요약/렌더링)',
+                                 ['stage'])
+
 # 디스코드 봇 설정
 intents = discord.Intents.default()
 intents.message_content = True
-bot = commands.Bot(command_prefix='!', intents=intents)
+
+class NewsBot(commands.Bot):
+    """시작 시 공유 리소스를 한 번만 만들고 종료 시 정리하는 봇"""
+    
+    async def setup_hook(self):
+        # 로그인 직후 게이트웨이 연결 전에 한 번만 실행 (재연결 때는 on_ready만 다시 실행됨)
+        await initialize()
+    
+    async def close(self):
+        if warmup_task:
+            warmup_task.cancel()
+        if scheduler:
+            scheduler.shutdown()
+        if metrics_server:
+            await metrics_server.close()
+        if loop_monitor:
+            await loop_monitor.close()
+        if loop_watchdog:
+            await loop_watchdog.close()
+        if dispatcher:
+            await dispatcher.close()
+        if news_fetcher:
+            await news_fetcher.close()
+        if parse_pool:
+            parse_pool.shutdown()
+        await super().close()
+
+# 오래 기다려야 하는 요청 한도 초과는 라이브러리 안에서 기다리지 않고 디스패처로 전달
+bot = NewsBot(command_prefix='!', intents=intents, max_ratelimit_timeout=Config.DISPATCH_MAX_RATELIMIT_WAIT)
 
 # 글로벌 객체
 news_fetcher = None
 news_summarizer = None
+parse_pool = None
+sent_history = None
+digest_cache = None
+subscription_store = None
+report_renderer = None
+dispatcher = None
 scheduler = None
+metrics_server = None
+loop_monitor = None
+loop_watchdog = None
+article_store = None
+warmup_task = None
+breaking_last_push: Dict[int, float] = {}  # 채널별 마지막 속보 전송 시각
+startup_times: Dict[str, float] = {}  # 시작 단계별 완료 시각 (프로세스 시작 기준, 초)
+
+def mark_startup(stage: str):
+    """시작 단계 완료 시각 기록 (단계마다 처음 한 번만)"""
+    if stage not in startup_times:
+        startup_times[stage] = time.monotonic() - PROCESS_STARTED
+        STARTUP_SECONDS.set(startup_times[stage], stage=stage)
+        logger.info(f"시작 단계 완료: {stage} ({startup_times[stage]:.2f}초)")
+
+async def initialize():
+    """공유 리소스 초기화, 스케줄러 시작 (봇 프로세스에서 한 번만 실행)
+    
+    SQLite 저장소는 스레드에서 동시에 열고, 세션/파싱 워커 예열은 게이트웨이 연결과 동시에 진행합니다.
+    """
+    global news_fetcher, news_summarizer, parse_pool, sent_history, digest_cache, subscription_store, report_renderer, dispatcher, scheduler, \
+        metrics_server, loop_monitor, loop_watchdog, article_store, warmup_task
+    
+    mark_startup('login')
+    
+    # 로컬 저장소 (스키마 생성/WAL 설정 등 디스크 작업은 스레드에서 동시에)
+    feed_cache, source_health, summary_cache, sent_history, subscription_store, article_store = await asyncio.gather(
+        asyncio.to_thread(FeedCache, Config.FEED_CACHE_PATH, max_bytes=Config.FEED_CACHE_MAX_MB * 1024 * 1024,
+                          default_ttl=Config.FEED_CACHE_TTL, ttl_overrides=Config.FEED_CACHE_TTL_OVERRIDES),
+        asyncio.to_thread(SourceHealth, Config.SOURCE_HEALTH_PATH, window=Config.SOURCE_HEALTH_WINDOW,
+                          failure_threshold=Config.SOURCE_FAILURE_THRESHOLD,
+                          base_backoff=Config.SOURCE_BACKOFF_BASE, max_backoff=Config.SOURCE_BACKOFF_MAX),
+        asyncio.to_thread(SummaryCache, Config.SUMMARY_CACHE_PATH,
+                          memory_size=Config.SUMMARY_CACHE_MEMORY_SIZE,
+                          max_entries=Config.SUMMARY_CACHE_MAX_ENTRIES,
+                          max_age=Config.SUMMARY_CACHE_MAX_AGE_DAYS * 24 * 60 * 60),
+        asyncio.to_thread(SentHistory, Config.HISTORY_PATH, retention_days=Config.HISTORY_RETENTION_DAYS),
+        asyncio.to_thread(SubscriptionStore, Config.SUBSCRIPTIONS_PATH),
+        asyncio.to_thread(ArticleStore, Config.ARTICLE_STORE_PATH, retention_hours=Config.ARTICLE_RETENTION_HOURS)
+        if Config.INGEST_ENABLED else asyncio.sleep(0)
+    )
+    
+    # 뉴스 수집기 및 요약기 초기화 (파싱 프로세스 풀 공유)
+    parse_pool = ParsePool(max_workers=Config.PARSE_WORKERS,
+                           use_processes=Config.PARSE_USE_PROCESS_POOL,
+                           batch_size=Config.PARSE_BATCH_SIZE)
+    news_fetcher = NewsFetcher(Config.NEWSAPI_KEY, timeout=Config.HTTP_TIMEOUT,
+                               limit_per_host=Config.HTTP_LIMIT_PER_HOST, parse_pool=parse_pool,
+                               feed_cache=feed_cache, dedup_similarity=Config.DEDUP_SIMILARITY,
+                               source_health=source_health, source_timeout=Config.SOURCE_TIMEOUT,
+                               hedge_requests=Config.HEDGE_REQUESTS, hedge_min_delay=Config.HEDGE_MIN_DELAY,
+                               ranking=Config.RANKING_ENABLED, ranking_candidates=Config.RANKING_CANDIDATE_FACTOR,
+                               ranking_half_life=Config.RANKING_HALF_LIFE_HOURS)
+    news_summarizer = NewsSummarizer(Config.OPENAI_API_KEY, parse_pool=parse_pool,
+                                     model=Config.OPENAI_MODEL,
+                                     max_concurrency=Config.OPENAI_MAX_CONCURRENCY,
+                                     batch_size=Config.OPENAI_BATCH_SIZE,
+                                     article_timeout=Config.OPENAI_ARTICLE_TIMEOUT,
+                                     max_retries=Config.OPENAI_MAX_RETRIES,
+                                     summary_cache=summary_cache)
+    digest_cache = DigestCache(ttl=Config.DIGEST_CACHE_TTL, max_entries=Config.DIGEST_CACHE_MAX_ENTRIES)
+    report_renderer = ReportRenderer(use_embeds=Config.REPORT_FORMAT == 'embed')
+    dispatcher = MessageDispatcher(workers=Config.DISPATCH_WORKERS,
+                                   channel_rate=Config.DISPATCH_CHANNEL_RATE,
+                                   channel_burst=Config.DISPATCH_CHANNEL_BURST,
+                                   global_rate=Config.DISPATCH_GLOBAL_RATE,
+                                   global_burst=Config.DISPATCH_GLOBAL_BURST,
+                                   max_retries=Config.DISPATCH_MAX_RETRIES)
+    dispatcher.start()
+    
+    # 이벤트 루프 지연 측정/막힘 감시 및 지표 엔드포인트 시작
+    loop_monitor = LoopLagMonitor()
+    loop_monitor.start()
+    if Config.LOOP_BLOCK_THRESHOLD > 0:
+        loop_watchdog = LoopBlockWatchdog(threshold=Config.LOOP_BLOCK_THRESHOLD)
+        loop_watchdog.start()
+    if Config.METRICS_PORT:
+        metrics_server = MetricsServer(Config.METRICS_HOST, Config.METRICS_PORT)
+        try:
+            await metrics_server.start()
+        except OSError as e:
+            logger.error(f"지표 엔드포인트 시작 실패: {e}")
+    
+    # 스케줄러 초기화 및 시작 (채널이 필요한 작업은 봇이 준비될 때까지 기다림)
+    scheduler = NewsScheduler(state_path=Config.SCHEDULER_STATE_PATH, misfire_grace=Config.SCHEDULE_MISFIRE_GRACE)
+    scheduler.start()
+    
+    # 구독 채널별로 뉴스 전송 스케줄링 (재시작으로 놓친 전송은 유예 시간 안이면 바로 실행)
+    await sync_news_jobs()
+    
+    # 소스별 백그라운드 수집
+    if article_store:
+        schedule_ingest_jobs()
+    
+    # 스케줄된 작업 확인
+    scheduler.print_jobs()
+    
+    mark_startup('init')
+    warmup_task = asyncio.create_task(warm_up())
+
+async def warm_up():
+    """첫 리포트가 기다리지 않도록 HTTP 세션, 파싱 워커, 지연 로딩 모듈을 미리 준비"""
+    results = await asyncio.gather(
+        news_fetcher.warm_up(),
+        parse_pool.warm_up(),
+        asyncio.to_thread(importlib.import_module, 'news.ranking'),
+        return_exceptions=True
+    )
+    for result in results:
+        if isinstance(result, Exception):
+            logger.warning(f"예열 중 오류 (처음 사용할 때 다시 준비합니다): {result}")
+    mark_startup('warmup')
 
 @bot.event
 async def on_ready():
-    """봇이 준비되었을 때 실행"""
-    global news_fetcher, news_summarizer, scheduler
+    """게이트웨이 연결(재연결 포함)이 준비되었을 때 실행"""
+    if 'ready' in startup_times:
+        logger.info(f'{bot.user} 게이트웨이에 다시 연결되었습니다.')
+        return
     
     logger.info(f'{bot.user} 봇이 로그인했습니다!')
     logger.info(f'봇 ID: {bot.user.id}')
     logger.info('------')
     
-    # 설정 검증
-    try:
-        Config.validate()
-    except ValueError as e:
-        logger.error(f"설정 오류: {e}")
-        return
+    # 기본 뉴스 채널(NEWS_CHANNEL_ID)은 전체 카테고리 구독으로 등록 (채널 정보는 준비된 뒤에 조회 가능)
+    if Config.NEWS_CHANNEL_ID and not await asyncio.to_thread(subscription_store.get, Config.NEWS_CHANNEL_ID):
+        channel = bot.get_channel(Config.NEWS_CHANNEL_ID)
+        if channel:
+            await asyncio.to_thread(subscription_store.subscribe, channel.guild.id, channel.id,
+                                    list(Config.NEWS_CATEGORIES), Config.NEWS_SEND_TIME)
+            await sync_news_jobs()
+        else:
+            logger.error(f"채널을 찾을 수 없습니다. ID: {Config.NEWS_CHANNEL_ID}")
+    
+    mark_startup('ready')
+    logger.info("봇이 완전히 준비되었습니다!")
+
+def get_category_emojis() -> Dict[str, str]:
+    """카테고리별 이모지 딕셔너리"""
+    return {
+        name: info['emoji'] 
+        for name, info in Config.NEWS_CATEGORIES.items()
+    }
+
+def subscribed_categories(sub: Dict) -> Tuple[str, ...]:
+    """구독 카테고리 중 설정에 있는 카테고리 (설정 순서 유지, 설정에서 빠진 카테고리만 구독했으면 전체 카테고리)"""
+    return tuple(name for name in Config.NEWS_CATEGORIES if name in sub['categories']) or tuple(Config.NEWS_CATEGORIES)
+
+def union_categories(subscriptions: List[Dict]) -> Tuple[str, ...]:
+    """구독들이 받는 카테고리 합집합 (설정 순서 유지)"""
+    wanted = {name for sub in subscriptions for name in subscribed_categories(sub)}
+    return tuple(name for name in Config.NEWS_CATEGORIES if name in wanted)
+
+async def get_candidate_pool(category_names: Tuple[str, ...], refresh: bool = False) -> Dict:
+    """카테고리별 후보 기사 (카테고리당 한 번만 수집하여 모든 채널이 공유)
     
-    # 뉴스 수집기 및 요약기 초기화
-    news_fetcher = NewsFetcher(Config.NEWSAPI_KEY)
-    news_summarizer = NewsSummarizer(Config.OPENAI_API_KEY)
+    채널마다 이미 보낸 기사를 빼고도 개수가 채워지도록 NEWS_PER_CATEGORY보다 넉넉히 수집합니다.
+    수집 제한 시간(FETCH_TIME_BUDGET)을 넘기면 그때까지 모은 기사만 사용합니다.
     
-    # 스케줄러 초기화 및 시작
-    scheduler = NewsScheduler()
-    scheduler.start()
+    Returns:
+        {'articles': 카테고리별 기사, 'cut_sources': 시간 초과로 제외된 소스 이름}
+    """
+    categories = {name: Config.NEWS_CATEGORIES[name] for name in category_names}
     
-    # 매일 정해진 시간에 뉴스 전송 스케줄링
-    scheduler.schedule_daily_news(send_daily_news, Config.NEWS_SEND_TIME, Config.TIMEZONE)
+    limit = Config.NEWS_PER_CATEGORY * Config.FANOUT_CANDIDATE_FACTOR
     
-    # 스케줄된 작업 확인
-    scheduler.print_jobs()
+    async def builder():
+        cut_sources = set()
+        with REPORT_BUILD_SECONDS.time(stage='pool'), span('fetch', logger, categories=len(categories)):
+            # 백그라운드 수집 중이면 저장된 기사 사용 (저장된 기사가 없는 카테고리만 바로 수집)
+            articles = await asyncio.to_thread(load_stored_articles, categories, limit) if article_store else {}
+            missing = {name: info for name, info in categories.items() if not articles.get(name)}
+            if missing:
+                articles.update(await news_fetcher.fetch_categorized_news_async(
+                    missing, limit, time_budget=Config.FETCH_TIME_BUDGET, cut_sources=cut_sources
+                ))
+        return {'articles': {name: articles[name] for name in categories}, 'cut_sources': tuple(sorted(cut_sources))}
     
-    logger.info("봇이 완전히 준비되었습니다!")
+    key = ('pool', category_names)
+    if refresh:
+        return await digest_cache.refresh(key, builder)
+    return await digest_cache.get_or_build(key, builder)
+
+def load_stored_articles(categories: Dict[str, Dict], limit: int,
+                         exclude: Optional[Set[str]] = None) -> Dict[str, List[Article]]:
+    """저장소의 최근 기사를 카테고리별로 limit개씩 조회 (카테고리 사이에서도 중복 제거)
+    
+    관련도 순위를 사용하면 후보를 넉넉히 모아 점수가 높은 기사를 고릅니다.
+    SQLite 조회와 순위 계산을 하므로 이벤트 루프에서는 asyncio.to_thread로 호출합니다.
+    
+    Args:
+        exclude: 제외할 기사의 URL 해시 (채널로 이미 보낸 기사 등)
+    """
+    exclude = exclude or set()
+    from news.ranking import select_ranked
+    
+    dedup_index = DedupIndex(similarity=Config.DEDUP_SIMILARITY)
+    max_age = Config.INGEST_MAX_AGE_HOURS * 60 * 60
+    wanted = limit * Config.RANKING_CANDIDATE_FACTOR
+    result = {}
+    
+    for name, info in categories.items():
+        if not Config.RANKING_ENABLED:
+            result[name] = []
+            for article in article_store.recent(name, max_age, limit=limit * 5):
+                if article.url_hash not in exclude and dedup_index.add_if_new(article.url, article.title):
+                    result[name].append(article)
+                    if len(result[name]) >= limit:
+                        break
+            continue
+        
+        # 카테고리 안에서 후보를 모으고, 고른 기사만 다른 카테고리에서 제외
+        candidate_index = DedupIndex(similarity=Config.DEDUP_SIMILARITY)
+        candidates = []
+        for article in article_store.recent(name, max_age, limit=wanted * 5):
+            if article.url_hash in exclude:
+                continue
+            if candidate_index.add_if_new(article.url, article.title, article.source):
+                candidates.append(article)
+                if len(candidates) >= wanted:
+                    break
+        result[name] = select_ranked(candidates, info, limit, candidate_index, dedup_index,
+                                     half_life_hours=Config.RANKING_HALF_LIFE_HOURS)
+    return result
+
+async def select_for_channel(pool: Dict, category_names, channel_id: int,
+                             top_up: bool = True) -> Dict[str, List[Article]]:
+    """후보 기사 중 채널로 아직 보내지 않은 기사를 카테고리별로 선택
+    
+    공유 후보가 채널로 이미 보낸 기사라서 모자란 카테고리는, 보낸 기사를 제외하고 채널용으로 더 가져와 채웁니다.
+    (top_up=False면 공유 후보 안에서만 선택)
+    """
+    sent = await asyncio.to_thread(sent_history.load_sent, channel_id)
+    limit = Config.NEWS_PER_CATEGORY
+    selected = {
+        name: [article for article in pool['articles'].get(name, []) if article.url_hash not in sent][:limit]
+        for name in category_names
+    }
+    
+    # 후보 자체가 적은 카테고리는 다시 가져와도 같으므로, 보낸 기사를 빼서 모자라진 카테고리만 채움
+    short = {
+        name: Config.NEWS_CATEGORIES[name] for name, articles in selected.items()
+        if len(articles) < limit and len(pool['articles'].get(name, [])) > len(articles)
+    }
+    if top_up and short:
+        exclude = sent | {article.url_hash for articles in selected.values() for article in articles}
+        extra = await fetch_excluding(short, limit, exclude)
+        for name in short:
+            selected[name] = (selected[name] + extra.get(name, []))[:limit]
+        logger.info(f"이미 보낸 기사를 제외하고 채널용으로 추가 수집: {', '.join(short)} (채널: {channel_id})")
+    return selected
+
+async def fetch_excluding(categories: Dict[str, Dict], limit: int, exclude: Set[str]) -> Dict[str, List[Article]]:
+    """exclude에 없는 기사를 카테고리별로 limit개씩 가져옴 (저장된 기사 우선, 없는 카테고리만 바로 수집)"""
+    articles = await asyncio.to_thread(load_stored_articles, categories, limit, exclude) if article_store else {}
+    missing = {name: info for name, info in categories.items() if not articles.get(name)}
+    if missing:
+        articles.update(await news_fetcher.fetch_categorized_news_async(
+            missing, limit, exclude=exclude, time_budget=Config.FETCH_TIME_BUDGET
+        ))
+    return articles
+
+def can_embed(channel) -> bool:
+    """채널에 임베드를 보낼 수 있는지 (임베드 링크 권한이 없으면 텍스트 모드로 전송)"""
+    guild = getattr(channel, 'guild', None)
+    return guild is None or channel.permissions_for(guild.me).embed_links
+
+def to_send_kwargs(payload: Dict) -> Dict:
+    """렌더러 payload를 channel.send 인자로 변환"""
+    kwargs = {'content': payload.get('content')}
+    if payload.get('embeds'):
+        kwargs['embeds'] = [discord.Embed.from_dict(embed) for embed in payload['embeds']]
+    return kwargs
+
+async def render_report(categorized_news: Dict[str, List[Article]], use_embeds: bool = True,
+                        cut_sources: Tuple[str, ...] = ()) -> List[Dict]:
+    """뉴스 리포트 메시지 생성 (같은 기사 구성은 한 번만 생성)
+    
+    요약이 제한 시간(SUMMARY_TIME_BUDGET)을 넘기면 남은 기사는 기본 요약을 사용합니다.
+    """
+    use_embeds = use_embeds and report_renderer.use_embeds
+    signature = tuple(
+        (name, tuple(article.url_hash for article in articles))
+        for name, articles in categorized_news.items()
+    )
+    
+    async def build():
+        with REPORT_BUILD_SECONDS.time(stage='render'):
+            with span('summarize', logger, articles=sum(len(articles) for articles in categorized_news.values())):
+                summaries = await news_summarizer.summarize_report_async(categorized_news,
+                                                                         time_budget=Config.SUMMARY_TIME_BUDGET)
+            notes = [f"⏱ 응답이 늦어 일부 소스를 제외했습니다: {', '.join(cut_sources)}"] if cut_sources else None
+            payloads = report_renderer.render(categorized_news, get_category_emojis(), summaries, use_embeds, notes)
+            return [to_send_kwargs(payload) for payload in payloads]
+    
+    return await digest_cache.get_or_build(('render', use_embeds, cut_sources, signature), build)
+
+async def build_channel_report(channel, category_names: Tuple[str, ...]):
+    """채널용 뉴스 리포트 생성 (수집 → 선택 → 요약)
+    
+    Returns:
+        (카테고리별 기사, 전송할 메시지 목록)
+    """
+    pool = await get_candidate_pool(category_names)
+    categorized_news = await select_for_channel(pool, category_names, channel.id)
+    messages = await render_report(categorized_news, can_embed(channel), pool['cut_sources'])
+    return categorized_news, messages
 
-async def send_daily_news():
-    """매일 아침 뉴스를 전송하는 함수"""
+async def deliver_report(channel, categorized_news: Dict[str, List[Article]], messages: List[Dict],
+                         priority: int = PRIORITY_MANUAL):
+    """채널로 리포트 전송 후 전송 기록 저장 (요청 한도에 맞춰 디스패처가 전송)"""
+    with span('send', logger, channel_id=channel.id, messages=len(messages)):
+        await dispatcher.send(channel, messages, priority=priority)
+    
+    await asyncio.to_thread(sent_history.record, channel.id, categorized_news)
+
+async def prefetch_scheduled_news(send_time: str):
+    """뉴스 전송 전에 후보 기사와 리포트를 미리 준비하는 함수"""
+    new_digest_id('prefetch')
     try:
-        logger.info("일일 뉴스 전송 시작...")
+        subscriptions = await asyncio.to_thread(subscription_store.by_send_time, send_time)
+        if not subscriptions:
+            return
         
-        # 뉴스를 전송할 채널 가져오기
-        channel = bot.get_channel(Config.NEWS_CHANNEL_ID)
+        logger.info(f"{send_time} 전송분 뉴스 리포트 미리 준비 시작...")
+        pool = await get_candidate_pool(union_categories(subscriptions), refresh=True)
         
+        # 공유 후보로 만들 수 있는 리포트만 미리 생성 (채널별 추가 수집은 전송할 때)
+        selections = [
+            await select_for_channel(pool, subscribed_categories(sub), sub['channel_id'], top_up=False)
+            for sub in subscriptions
+        ]
+        await asyncio.gather(*(
+            render_report(categorized, cut_sources=pool['cut_sources']) for categorized in selections
+        ))
+        logger.info(f"{send_time} 전송분 뉴스 리포트 준비 완료")
+    except Exception as e:
+        logger.error(f"뉴스 리포트 준비 중 오류: {e}", exc_info=True)
+
+async def send_scheduled_news(channel_id: int):
+    """구독 채널 하나로 뉴스를 전송하는 함수
+    
+    채널마다 따로 예약되어 조금씩 다른 시각에 실행되지만, 후보 기사는 같은 전송 시간의 구독 전체로
+    한 번만 수집(미리 준비된 캐시 사용)하고 같은 구성의 리포트도 한 번만 생성합니다.
+    """
+    await bot.wait_until_ready()
+    new_digest_id('daily')
+    try:
+        sub = await asyncio.to_thread(subscription_store.get, channel_id)
+        if not sub:
+            return
+        
+        channel = bot.get_channel(channel_id)
         if not channel:
-            logger.error(f"채널을 찾을 수 없습니다. ID: {Config.NEWS_CHANNEL_ID}")
+            logger.error(f"채널을 찾을 수 없습니다. ID: {channel_id}")
             return
         
-        # 카테고리별 뉴스 수집
-        categorized_news = news_fetcher.fetch_categorized_news(
-            Config.NEWS_CATEGORIES,
-            Config.NEWS_PER_CATEGORY
-        )
+        logger.info(f"일일 뉴스 전송 시작... ({sub['send_time']}, 채널: {channel_id})")
         
-        # 이모지 딕셔너리 생성
-        category_emojis = {
-            name: info['emoji'] 
-            for name, info in Config.NEWS_CATEGORIES.items()
-        }
+        # 후보 기사 수집 (미리 준비된 캐시 사용)
+        subscriptions = await asyncio.to_thread(subscription_store.by_send_time, sub['send_time'])
+        pool = await get_candidate_pool(union_categories(subscriptions))
         
-        # 뉴스 리포트 생성
-        messages = news_summarizer.create_daily_news_report(
-            categorized_news,
-            category_emojis
-        )
+        categorized = await select_for_channel(pool, subscribed_categories(sub), channel_id)
+        messages = await render_report(categorized, can_embed(channel), pool['cut_sources'])
+        await deliver_report(channel, categorized, messages, priority=PRIORITY_SCHEDULED)
+        logger.info(f"일일 뉴스 전송 완료! (채널: {channel_id})")
         
-        # 메시지 전송
-        for message in messages:
-            await channel.send(message)
-        
-        logger.info(f"일일 뉴스 전송 완료! ({len(messages)}개 메시지)")
+        stats = dispatcher.stats()
+        logger.info(f"전송 통계: 대기 {stats['queue_depth']}건, 재시도 {stats['retries']}회, "
+                    f"지연 p50 {stats['latency_p50'] * 1000:.0f}ms / p95 {stats['latency_p95'] * 1000:.0f}ms")
+    
+    except Exception as e:
+        logger.error(f"뉴스 전송 중 오류 (채널: {channel_id}): {e}", exc_info=True)
+
+async def ingest_source(source_key: str):
+    """소스 하나에서 전체 카테고리 기사를 수집해 저장 (속보 카테고리에 새 기사가 있으면 속보 확인)"""
+    try:
+        results = await news_fetcher.fetch_source_async(source_key, Config.NEWS_CATEGORIES,
+                                                        Config.NEWS_PER_CATEGORY * Config.FANOUT_CANDIDATE_FACTOR)
+        if results is None:
+            return
         
+        new_articles = {
+            name: await asyncio.to_thread(article_store.add_many, name, source_key, articles)
+            for name, articles in results.items()
+        }
+        if Config.BREAKING_NEWS_ENABLED and any(new_articles.get(name) for name in Config.BREAKING_CATEGORIES):
+            await push_breaking_news()
     except Exception as e:
-        logger.error(f"뉴스 전송 중 오류: {e}", exc_info=True)
+        logger.error(f"백그라운드 수집 중 오류 ({source_key}): {e}", exc_info=True)
+
+def is_breaking(article: Article) -> bool:
+    """제목에 속보 키워드가 있는지"""
+    title = article.title.lower()
+    return any(keyword.lower() in title for keyword in Config.BREAKING_KEYWORDS)
+
+async def render_breaking(categorized_news: Dict[str, List[Article]], use_embeds: bool = True) -> List[Dict]:
+    """속보 메시지 생성"""
+    summaries = await news_summarizer.summarize_report_async(categorized_news, time_budget=Config.SUMMARY_TIME_BUDGET)
+    renderer = ReportRenderer(use_embeds=report_renderer.use_embeds, title=BREAKING_TITLE, footer=BREAKING_FOOTER)
+    payloads = renderer.render(categorized_news, get_category_emojis(), summaries, use_embeds and renderer.use_embeds)
+    return [to_send_kwargs(payload) for payload in payloads]
+
+async def push_breaking_news():
+    """속보 카테고리의 최근 기사 중 키워드가 맞는 기사를 구독 채널로 전송
+    
+    채널마다 BREAKING_MIN_INTERVAL초에 한 번, 최대 BREAKING_MAX_ARTICLES개만 보내고,
+    보낸 기사는 전송 기록에 남겨 다음 일일 뉴스에서 다시 보내지 않습니다.
+    """
+    await bot.wait_until_ready()
+    new_digest_id('breaking')
+    max_age = Config.BREAKING_MAX_AGE_MINUTES * 60
+    candidates = {}
+    for name in Config.BREAKING_CATEGORIES:
+        if name in Config.NEWS_CATEGORIES:
+            articles = await asyncio.to_thread(article_store.recent, name, max_age)
+            candidates[name] = [article for article in articles if is_breaking(article)]
+    if not any(candidates.values()):
+        return
+    
+    now = time.monotonic()
+    deliveries = []
+    for sub in await asyncio.to_thread(subscription_store.list_all):
+        channel_id = sub['channel_id']
+        names = [name for name in candidates if candidates[name] and name in sub['categories']]
+        last_push = breaking_last_push.get(channel_id)
+        if not names or (last_push is not None and now - last_push < Config.BREAKING_MIN_INTERVAL):
+            continue
+        
+        channel = bot.get_channel(channel_id)
+        if not channel:
+            continue
+        
+        sent = await asyncio.to_thread(sent_history.load_sent, channel_id)
+        selected, remaining = {}, Config.BREAKING_MAX_ARTICLES
+        for name in names:
+            articles = [article for article in candidates[name] if article.url_hash not in sent]
+            if articles and remaining > 0:
+                selected[name] = articles[:remaining]
+                remaining -= len(selected[name])
+        if selected:
+            breaking_last_push[channel_id] = now
+            deliveries.append((channel, selected))
+    
+    reports = await asyncio.gather(*(
+        render_breaking(selected, can_embed(channel)) for channel, selected in deliveries
+    ))
+    results = await asyncio.gather(*(
+        deliver_report(channel, selected, messages, priority=PRIORITY_SCHEDULED)
+        for (channel, selected), messages in zip(deliveries, reports)
+    ), return_exceptions=True)
+    
+    for (channel, selected), result in zip(deliveries, results):
+        if isinstance(result, Exception):
+            logger.error(f"속보 전송 중 오류 (채널: {channel.id}): {result}")
+        else:
+            logger.info(f"속보 전송: {sum(len(articles) for articles in selected.values())}개 (채널: {channel.id})")
+
+def schedule_ingest_jobs():
+    """소스별 백그라운드 수집 작업 등록 (소스마다 시작 시간을 조금씩 나누고 실행마다 지터를 더함)"""
+    for index, source in enumerate(news_fetcher.sources):
+        interval = Config.INGEST_INTERVAL_OVERRIDES.get(source.key, Config.INGEST_INTERVAL)
+        scheduler.schedule_interval(ingest_source, interval, job_id=f'ingest_{source.key}',
+                                    name=f'백그라운드 수집 ({source.label}, {interval}초마다)',
+                                    args=(source.key,), start_delay=index * 5, jitter=Config.INGEST_JITTER)
+
+async def sync_news_jobs():
+    """구독 채널별 전송 작업과 전송 시간별 미리 준비 작업 등록 (구독이 없어진 작업은 제거)
+    
+    같은 시간의 채널 전송은 채널마다 고정된 지연(SEND_STAGGER_SECONDS 이내)을 두어 나눠 실행합니다.
+    """
+    daily_jobs, prefetch_jobs = [], []
+    
+    for sub in await asyncio.to_thread(subscription_store.list_all):
+        daily_jobs.append(f"daily_news_{sub['channel_id']}")
+        scheduler.schedule_daily_news(send_scheduled_news, sub['send_time'], Config.TIMEZONE,
+                                      job_id=daily_jobs[-1], args=(sub['channel_id'],),
+                                      stagger=Config.SEND_STAGGER_SECONDS)
+    
+    # 전송 몇 분 전에 리포트를 미리 준비
+    if Config.DIGEST_PREFETCH_MINUTES > 0:
+        for send_time in await asyncio.to_thread(subscription_store.send_times):
+            prefetch_jobs.append(f"prefetch_news_{send_time.replace(':', '')}")
+            scheduler.schedule_prefetch(prefetch_scheduled_news, send_time, Config.DIGEST_PREFETCH_MINUTES,
+                                        Config.TIMEZONE, job_id=prefetch_jobs[-1], args=(send_time,))
+    
+    scheduler.remove_jobs_with_prefix('daily_news_', keep=tuple(daily_jobs))
+    scheduler.remove_jobs_with_prefix('prefetch_news_', keep=tuple(prefetch_jobs))
 
 @bot.command(name='뉴스')
 async def manual_news(ctx):
     """수동으로 뉴스를 요청하는 명령어"""
-    await ctx.send("뉴스를 수집하고 있습니다... 잠시만 기다려주세요 ⏳")
+    # 구독 중인 채널은 구독 카테고리, 아니면 전체 카테고리
+    sub = await asyncio.to_thread(subscription_store.get, ctx.channel.id)
+    category_names = subscribed_categories(sub) if sub else tuple(Config.NEWS_CATEGORIES)
+    new_digest_id('manual')
+    
+    if digest_cache.get(('pool', category_names)) is None:
+        await ctx.send("뉴스를 수집하고 있습니다... 잠시만 기다려주세요 ⏳")
     
     try:
-        # 카테고리별 뉴스 수집
-        categorized_news = news_fetcher.fetch_categorized_news(
-            Config.NEWS_CATEGORIES,
-            Config.NEWS_PER_CATEGORY
-        )
-        
-        # 이모지 딕셔너리 생성
-        category_emojis = {
-            name: info['emoji'] 
-            for name, info in Config.NEWS_CATEGORIES.items()
-        }
-        
-        # 뉴스 리포트 생성
-        messages = news_summarizer.create_daily_news_report(
-            categorized_news,
-            category_emojis
-        )
+        # 캐시된 리포트 사용 (없으면 생성)
+        categorized_news, messages = await build_channel_report(ctx.channel, category_names)
         
         # 메시지 전송
-        for message in messages:
-            await ctx.send(message)
+        await deliver_report(ctx.channel, categorized_news, messages)
         
         logger.info(f"수동 뉴스 요청 처리 완료 (요청자: {ctx.author})")
-        
+    
     except Exception as e:
         await ctx.send(f"뉴스를 가져오는 중 오류가 발생했습니다: {e}")
         logger.error(f"수동 뉴스 요청 오류: {e}", exc_info=True)
 
+@bot.command(name='구독')
+@commands.guild_only()
+@commands.has_permissions(manage_channels=True)
+async def subscribe_news(ctx, *args):
+    """현재 채널에 매일 뉴스 구독 등록 (예: !구독 08:30 IT AI)"""
+    send_time = Config.NEWS_SEND_TIME
+    categories = []
+    
+    for arg in args:
+        if re.fullmatch(r'\d{1,2}:\d{2}', arg):
+            hour, minute = map(int, arg.split(':'))
+            if hour > 23 or minute > 59:
+                await ctx.send(f"시간 형식이 올바르지 않습니다: {arg}")
+                return
+            send_time = f"{hour:02d}:{minute:02d}"
+        elif arg in Config.NEWS_CATEGORIES:
+            categories.append(arg)
+        else:
+            await ctx.send(f"알 수 없는 카테고리입니다: {arg}\n"
+                           f"사용 가능한 카테고리: {', '.join(Config.NEWS_CATEGORIES)}")
+            return
+    
+    categories = [name for name in Config.NEWS_CATEGORIES if name in categories] or list(Config.NEWS_CATEGORIES)
+    await asyncio.to_thread(subscription_store.subscribe, ctx.guild.id, ctx.channel.id, categories, send_time)
+    await sync_news_jobs()
+    
+    await ctx.send(f"✅ 이 채널에 매일 {send_time}에 뉴스를 전송합니다. (카테고리: {', '.join(categories)})")
+
+@bot.command(name='구독해제')
+@commands.guild_only()
+@commands.has_permissions(manage_channels=True)
+async def unsubscribe_news(ctx):
+    """현재 채널의 뉴스 구독 해제"""
+    if await asyncio.to_thread(subscription_store.unsubscribe, ctx.channel.id):
+        await sync_news_jobs()
+        await ctx.send("이 채널의 뉴스 구독을 해제했습니다.")
+    else:
+        await ctx.send("이 채널은 뉴스를 구독하고 있지 않습니다.")
+
+@bot.command(name='구독목록')
+@commands.guild_only()
+async def list_subscriptions(ctx):
+    """현재 서버의 뉴스 구독 목록"""
+    subscriptions = await asyncio.to_thread(subscription_store.list_all, ctx.guild.id)
+    
+    if subscriptions:
+        message = "📬 **이 서버의 뉴스 구독:**\n\n"
+        for sub in subscriptions:
+            message += f"• <#{sub['channel_id']}> - 매일 {sub['send_time']} ({', '.join(sub['categories'])})\n"
+        await ctx.send(message)
+    else:
+        await ctx.send("이 서버에는 뉴스 구독이 없습니다. `!구독`으로 등록하세요.")
+
 @bot.command(name='테스트뉴스')
 async def test_news(ctx):
     """테스트용 단일 카테고리 뉴스"""
@@ -142,11 +658,12 @@ async def test_news(ctx):
     try:
         # IT 뉴스만 수집
         it_keywords = Config.NEWS_CATEGORIES['IT']['keywords']
-        articles = news_fetcher.fetch_news_by_keywords(it_keywords, page_size=5)
+        articles = await news_fetcher.fetch_news_by_keywords_async(it_keywords, page_size=5)
         
         if articles:
             emoji = Config.NEWS_CATEGORIES['IT']['emoji']
-            summary = news_summarizer.create_news_summary('IT', articles, emoji)
+            summaries = await news_summarizer.summarize_articles_async(articles, max_length=150)
+            summary = news_summarizer.create_news_summary('IT', articles, emoji, summaries)
             await ctx.send(summary)
         else:
             await ctx.send("뉴스를 찾을 수 없습니다.")
@@ -170,6 +687,112 @@ async def show_schedule(ctx):
     else:
         await ctx.send("스케줄된 작업이 없습니다.")
 
+@bot.command(name='소스상태')
+async def show_source_status(ctx):
+    """뉴스 소스별 수집 상태 (최근 수집 기준)"""
+    health = news_fetcher.source_health if news_fetcher else None
+    if not health:
+        await ctx.send("소스 상태 정보가 없습니다.")
+        return
+    
+    lines = ["🩺 **뉴스 소스 상태:**\n"]
+    for source in news_fetcher.sources:
+        summary = health.summary(source.key)
+        if summary['state'] == CLOSED:
+            state = "🟢 정상"
+        elif summary['state'] == HALF_OPEN:
+            state = "🟡 확인 중"
+        else:
+            retry_at = datetime.fromtimestamp(summary['open_until']).strftime('%H:%M')
+            state = f"🔴 차단 (다음 확인: {retry_at})"
+        
+        lines.append(f"• **{source.label}** - {state}")
+        if summary['runs']:
+            lines.append(f"  최근 {summary['runs']}회: 평균 {summary['avg_yield']:.1f}개, "
+                         f"오류 {summary['error_rate']:.0%}, 결과 없음 {summary['empty_rate']:.0%}, "
+                         f"평균 {summary['avg_latency']:.2f}초")
+        else:
+            lines.append("  수집 기록 없음")
+    
+    await ctx.send('\n'.join(lines))
+
+def format_timing(summary: Dict) -> str:
+    """히스토그램 요약을 '평균/p95 (n회)' 형태로 변환"""
+    if not summary['count']:
+        return "기록 없음"
+    return f"평균 {summary['avg']:.2f}초 / p95 {summary['p95']:.2f}초 ({summary['count']}회)"
+
+@bot.command(name='상태')
+async def show_status(ctx):
+    """봇 성능 지표 요약 (소스별 수집 시간, 기사 수, 요약, 전송, 예약 작업, 이벤트 루프 지연)"""
+    lines = ["📊 **봇 상태**\n"]
+    
+    if loop_monitor:
+        lag = loop_monitor.lag.summary()
+        lines.append(f"**이벤트 루프 지연:** 평균 {lag['avg'] * 1000:.1f}ms / p95 {lag['p95'] * 1000:.1f}ms / "
+                     f"최대 {lag['max'] * 1000:.0f}ms")
+    
+    lines.append("\n**소스별 수집 시간:**")
+    for labels in SOURCE_FETCH_SECONDS.label_values():
+        lines.append(f"• {labels['source']}: {format_timing(SOURCE_FETCH_SECONDS.summary(**labels))}")
+    
+    lines.append(f"\n**기사 수:** 수집 {ARTICLES.value(stage='raw'):.0f}개 → 이미 전송 제외 "
+                 f"{ARTICLES.value(stage='excluded'):.0f}개, 중복 제거 {ARTICLES.value(stage='duplicate'):.0f}개 → "
+                 f"사용 {ARTICLES.value(stage='unique'):.0f}개")
+    
+    if news_summarizer:
+        cache = news_summarizer.summary_cache.stats()
+        mode = 'openai' if news_summarizer.use_openai else 'basic'
+        lines.append(f"**요약:** {format_timing(SUMMARIZE_SECONDS.summary(mode=mode))}, "
+                     f"캐시 적중률 {cache['hit_rate']:.0%}")
+    
+    if dispatcher:
+        stats = dispatcher.stats()
+        lines.append(f"**전송:** p50 {stats['latency_p50'] * 1000:.0f}ms / p95 {stats['latency_p95'] * 1000:.0f}ms, "
+                     f"대기 {stats['queue_depth']}건, 재시도 {stats['retries']}회, 실패 {stats['failed']}개")
+    
+    if startup_times:
+        lines.append("**시작 시간:** " + ', '.join(
+            f"{STARTUP_LABELS.get(stage, stage)} {seconds:.1f}초" for stage, seconds in startup_times.items()
+        ))
+    
+    if article_store:
+        counts = await asyncio.to_thread(article_store.counts)
+        lines.append(f"**백그라운드 수집:** 저장된 기사 {sum(counts.values())}개 "
+                     f"({', '.join(f'{name} {count}' for name, count in counts.items())})")
+    
+    if JOB_SECONDS.label_values():
+        lines.append("\n**예약 작업 실행 시간:**")
+        for labels in JOB_SECONDS.label_values():
+            lines.append(f"• {labels['job']}: {format_timing(JOB_SECONDS.summary(**labels))}")
+    
+    await ctx.send('\n'.join(lines))
+
+@bot.command(name='프로파일')
+@commands.has_permissions(administrator=True)
+@commands.max_concurrency(1)
+async def profile_report(ctx):
+    """전체 카테고리 리포트를 캐시 없이 한 번 생성하며 프로파일링하고 결과를 파일로 전송"""
+    await ctx.send("리포트 생성을 프로파일링하고 있습니다... ⏳")
+    
+    async def build():
+        cut_sources = set()
+        categorized_news = await news_fetcher.fetch_categorized_news_async(
+            Config.NEWS_CATEGORIES, Config.NEWS_PER_CATEGORY,
+            time_budget=Config.FETCH_TIME_BUDGET, cut_sources=cut_sources
+        )
+        summaries = await news_summarizer.summarize_report_async(categorized_news,
+                                                                 time_budget=Config.SUMMARY_TIME_BUDGET)
+        return report_renderer.render(categorized_news, get_category_emojis(), summaries)
+    
+    payloads, report = await profile_call(build(), top=Config.PROFILE_TOP)
+    
+    summary = f"✅ 프로파일링 완료 (메시지 {len(payloads)}개 분량)"
+    if loop_watchdog:
+        summary += f", 지금까지 이벤트 루프 막힘 {loop_watchdog.blocks}회 (bot.log에 스택 기록)"
+    await ctx.send(summary, file=discord.File(io.BytesIO(report.encode('utf-8')), filename='profile.txt'))
+    logger.info(f"프로파일링 완료 (요청자: {ctx.author})")
+
 @bot.command(name='도움말')
 async def help_command(ctx):
     """봇 사용법 안내"""
@@ -180,10 +803,16 @@ async def help_command(ctx):
 • `!뉴스` - 현재 뉴스를 즉시 가져옵니다
 • `!테스트뉴스` - IT 뉴스 5개를 테스트로 가져옵니다
 • `!스케줄` - 예약된 뉴스 전송 일정을 확인합니다
+• `!구독 [HH:MM] [카테고리...]` - 이 채널에 매일 뉴스를 받습니다 (예: `!구독 08:30 IT AI`)
+• `!구독해제` - 이 채널의 뉴스 구독을 해제합니다
+• `!구독목록` - 이 서버의 뉴스 구독 목록을 확인합니다
+• `!소스상태` - 뉴스 소스별 수집 상태를 확인합니다
+• `!상태` - 수집/요약/전송 시간 등 봇 성능 지표를 확인합니다
+• `!프로파일` - (관리자) 리포트 생성을 프로파일링하여 결과 파일을 받습니다
 • `!도움말` - 이 도움말을 표시합니다
 
 **자동 뉴스:**
-매일 아침 {}에 다음 카테고리의 뉴스를 자동으로 전송합니다:
+구독한 채널로 매일 설정한 시간(기본 {})에 다음 카테고리의 뉴스를 자동으로 전송합니다:
 • 💻 IT 뉴스 TOP 10
 • 🤖 AI 관련 뉴스 TOP 10
 • 🔒 정보보안 뉴스 TOP 10
@@ -208,22 +837,25 @@ def main():
         Config.validate()
         
         # 봇 실행
+        mark_startup('import')
         logger.info("봇을 시작합니다...")
-        bot.run(Config.DISCORD_TOKEN)
-        
+        # discord.py 로그도 루트 로거(큐)로 기록
+        bot.run(Config.DISCORD_TOKEN, log_handler=None)
+    
     except ValueError as e:
         logger.error(f"설정 오류: {e}")
         print("\n❌ 설정 오류가 발생했습니다!")
         print(f"오류 내용: {e}")
         print("\n.env 파일을 확인하고 필수 값들을 설정해주세요.")
         print("(.env.example 파일을 참고하세요)")
-        
+    
     except Exception as e:
         logger.error(f"봇 실행 중 오류: {e}", exc_info=True)
-        
+    
     finally:
         if scheduler:
             scheduler.shutdown()
+        log_listener.stop()
 
 if __name__ == '__main__':
     main()
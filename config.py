@@ -9,7 +9,7 @@ class Config:
     
     # Discord 설정
     DISCORD_TOKEN = os.getenv('DISCORD_TOKEN')
-    NEWS_CHANNEL_ID = int(os.getenv('NEWS_CHANNEL_ID', 0))
+    NEWS_CHANNEL_ID = int(os.getenv('NEWS_CHANNEL_ID', 0))  # 기본 구독 채널 (선택사항, 나머지는 !구독으로 등록)
     
     # NewsAPI 설정
     NEWSAPI_KEY = os.getenv('NEWSAPI_KEY')
@@ -17,32 +17,185 @@ class Config:
     
     # OpenAI 설정 (선택사항)
     OPENAI_API_KEY = os.getenv('OPENAI_API_KEY', '')
+    OPENAI_MODEL = os.getenv('OPENAI_MODEL', 'gpt-3.5-turbo')
+    OPENAI_MAX_CONCURRENCY = int(os.getenv('OPENAI_MAX_CONCURRENCY', 4))  # 동시 요약 요청 수
+    OPENAI_BATCH_SIZE = int(os.getenv('OPENAI_BATCH_SIZE', 1))  # 한 요청에 묶을 기사 수 (1이면 기사별 요청)
+    OPENAI_ARTICLE_TIMEOUT = float(os.getenv('OPENAI_ARTICLE_TIMEOUT', 15))  # 기사당 기한(초), 초과 시 기본 요약
+    OPENAI_MAX_RETRIES = int(os.getenv('OPENAI_MAX_RETRIES', 3))  # 요청 한도 초과 시 재시도 횟수
     
     # 뉴스 전송 시간 설정
     NEWS_SEND_TIME = os.getenv('NEWS_SEND_TIME', '09:00')
     # 타임존 설정 (컨테이너/클라우드 환경에서 정확한 스케줄)
     TIMEZONE = os.getenv('TIMEZONE', 'Asia/Seoul')
     
+    # 뉴스 리포트 캐시 설정 (!뉴스 반복 요청은 캐시로 응답)
+    DIGEST_CACHE_TTL = int(os.getenv('DIGEST_CACHE_TTL', 900))  # 캐시 유지 시간(초)
+    DIGEST_CACHE_MAX_ENTRIES = int(os.getenv('DIGEST_CACHE_MAX_ENTRIES', 512))  # 후보 기사/리포트 최대 보관 수
+    DIGEST_PREFETCH_MINUTES = int(os.getenv('DIGEST_PREFETCH_MINUTES', 5))  # 전송 몇 분 전에 미리 준비 (0이면 사용 안 함)
+    
+    # 예약 작업 설정
+    SCHEDULE_MISFIRE_GRACE = int(os.getenv('SCHEDULE_MISFIRE_GRACE', 900))  # 예정 시각을 놓쳐도 실행할 최대 지연(초), 재시작 후에도 적용
+    SEND_STAGGER_SECONDS = int(os.getenv('SEND_STAGGER_SECONDS', 60))  # 같은 시간 채널 전송을 나눠 실행할 범위(초)
+    INGEST_JITTER = int(os.getenv('INGEST_JITTER', 30))  # 백그라운드 수집 주기에 더할 무작위 지연(초)
+    
+    # 리포트 형식 ('embed': 카테고리별 임베드로 묶어 전송, 'text': 일반 텍스트 메시지)
+    REPORT_FORMAT = os.getenv('REPORT_FORMAT', 'embed')
+    
+    # 메시지 전송 설정 (Discord 요청 한도: 채널당 5초에 5개, 전체 초당 50개)
+    DISPATCH_WORKERS = int(os.getenv('DISPATCH_WORKERS', 8))  # 동시에 전송하는 채널 수
+    DISPATCH_CHANNEL_RATE = float(os.getenv('DISPATCH_CHANNEL_RATE', 1.0))  # 채널별 초당 메시지 수
+    DISPATCH_CHANNEL_BURST = int(os.getenv('DISPATCH_CHANNEL_BURST', 5))  # 채널별 연속 전송 가능 수
+    DISPATCH_GLOBAL_RATE = float(os.getenv('DISPATCH_GLOBAL_RATE', 45.0))  # 전체 초당 메시지 수
+    DISPATCH_GLOBAL_BURST = int(os.getenv('DISPATCH_GLOBAL_BURST', 50))  # 전체 연속 전송 가능 수
+    DISPATCH_MAX_RETRIES = int(os.getenv('DISPATCH_MAX_RETRIES', 3))  # 요청 한도 초과/서버 오류 시 재시도 횟수
+    DISPATCH_MAX_RATELIMIT_WAIT = float(os.getenv('DISPATCH_MAX_RATELIMIT_WAIT', 10.0))  # 이보다 길게 기다려야 하면 디스패처가 재시도
+    
+    # 리포트 생성 제한 시간 (느린 소스 하나가 전체 전송을 늦추지 않도록)
+    FETCH_TIME_BUDGET = float(os.getenv('FETCH_TIME_BUDGET', 45))  # 전체 수집 제한 시간(초), 넘기면 모은 기사까지만 사용
+    SOURCE_TIMEOUT = float(os.getenv('SOURCE_TIMEOUT', 15))  # 카테고리마다 소스 하나에 쓸 수 있는 최대 시간(초)
+    SUMMARY_TIME_BUDGET = float(os.getenv('SUMMARY_TIME_BUDGET', 30))  # 전체 요약 제한 시간(초), 넘기면 기본 요약 사용
+    HEDGE_REQUESTS = os.getenv('HEDGE_REQUESTS', 'false').lower() == 'true'  # 응답이 느린 호스트에 중복 요청
+    HEDGE_MIN_DELAY = float(os.getenv('HEDGE_MIN_DELAY', 1.0))  # p95 응답 시간이 이보다 빠른 호스트는 중복 요청 안 함
+    
+    # 성능 지표 엔드포인트 (Prometheus 형식, /metrics) - 포트를 0으로 설정하면 사용 안 함
+    METRICS_HOST = os.getenv('METRICS_HOST', '127.0.0.1')
+    METRICS_PORT = int(os.getenv('METRICS_PORT', 9108))
+    
+    # 진단 (!프로파일, 이벤트 루프 막힘 감시)
+    LOOP_BLOCK_THRESHOLD = float(os.getenv('LOOP_BLOCK_THRESHOLD', 0.5))  # 이벤트 루프가 이 시간(초) 넘게 막히면 스택 기록 (0이면 사용 안 함)
+    PROFILE_TOP = int(os.getenv('PROFILE_TOP', 40))  # !프로파일 보고서에 표시할 함수 수
+    
+    # 로그 설정 (크기 또는 시간 기준으로 파일 교체, json이면 파일에 한 줄씩 JSON으로 기록)
+    LOG_PATH = os.getenv('LOG_PATH', 'bot.log')
+    LOG_LEVEL = os.getenv('LOG_LEVEL', 'INFO')
+    LOG_FORMAT = os.getenv('LOG_FORMAT', 'text')  # 'text' 또는 'json'
+    LOG_MAX_MB = int(os.getenv('LOG_MAX_MB', 10))  # 파일 하나의 최대 크기
+    LOG_BACKUP_COUNT = int(os.getenv('LOG_BACKUP_COUNT', 5))  # 보관할 이전 파일 수
+    LOG_ROTATE_WHEN = os.getenv('LOG_ROTATE_WHEN', '')  # 시간 기준 교체 (예: midnight, 설정하면 크기 기준 대신 사용)
+    
+    # 로컬 데이터 저장 폴더 (캐시 등, 재시작 후에도 유지되도록 볼륨에 연결 권장)
+    DATA_DIR = os.getenv('DATA_DIR', 'data')
+    
     # 뉴스 카테고리 설정
+    # ranking: 관련도 순위 가중치 (keyword: 키워드 유사도, recency: 최신성, coverage: 같은 기사를 다룬 출처 수)
     NEWS_CATEGORIES = {
         'IT': {
             'keywords': ['IT기업', '테크기업', '소프트웨어', '클라우드', '반도체'],
-            'emoji': '💻'
+            'emoji': '💻',
+            'ranking': {'keyword': 0.5, 'recency': 0.3, 'coverage': 0.2}
         },
         'AI': {
             'keywords': ['인공지능', 'ChatGPT', '머신러닝', '생성형AI', 'LLM'],
-            'emoji': '🤖'
+            'emoji': '🤖',
+            'ranking': {'keyword': 0.5, 'recency': 0.3, 'coverage': 0.2}
         },
         '정보보안': {
             'keywords': ['사이버보안', '해킹', '랜섬웨어', '개인정보유출', '정보보호'],
-            'emoji': '🔒'
+            'emoji': '🔒',
+            'ranking': {'keyword': 0.4, 'recency': 0.4, 'coverage': 0.2}
         },
         '경제': {
             'keywords': ['증시', '코스피', '환율', '금리', '부동산'],
-            'emoji': '💰'
+            'emoji': '💰',
+            'ranking': {'keyword': 0.3, 'recency': 0.4, 'coverage': 0.3}
         }
     }
     
+    # 뉴스 소스 설정 (이 순서대로 수집하며, 카테고리별 개수가 채워지면 나머지 소스는 건너뜀)
+    # query_operator: 검색어 OR 연산자 (카테고리 키워드를 max_query_keywords개씩 요청 하나로 묶음, 없으면 키워드마다 요청)
+    NEWS_SOURCES = [
+        {
+            'type': 'rss',
+            'key': 'google',
+            'name': '구글 뉴스',
+            'label': '구글',
+            'url': 'https://news.google.com/rss/search?q={keyword}&hl=ko&gl=KR&ceid=KR:ko',
+            'description_field': 'summary',
+            'use_entry_source': True,
+            'query_operator': ' OR ',
+            'max_query_keywords': 5
+        },
+        {
+            'type': 'rss',
+            'key': 'naver',
+            'name': '네이버 뉴스',
+            'label': '네이버',
+            'url': 'https://news.naver.com/main/search/search.naver?where=rss&query={keyword}',
+            'query_operator': ' | ',
+            'max_query_keywords': 3
+        },
+        {
+            'type': 'rss',
+            'key': 'daum',
+            'name': '다음 뉴스',
+            'label': '다음',
+            'url': 'https://search.daum.net/search?w=news&q={keyword}&rtupcoll=NNS&DA=STC&enc=utf8&output=rss',
+            'query_operator': ' | ',
+            'max_query_keywords': 3
+        },
+        {
+            'type': 'newsapi',
+            'key': 'newsapi',
+            'name': 'NewsAPI',
+            'label': 'NewsAPI',
+            'language': 'ko'
+        }
+    ]
+    
+    # 관련도 순위 설정 (기본값: 끔)
+    # 켜면 카테고리마다 모든 소스에 동시에 요청해 후보를 모으므로 리포트마다 요청 수가 늘어남
+    # 끄면 소스 순서대로 수집하다 기사 수가 채워지면 나머지 소스는 요청하지 않음
+    RANKING_ENABLED = os.getenv('RANKING_ENABLED', 'false').lower() == 'true'
+    RANKING_CANDIDATE_FACTOR = int(os.getenv('RANKING_CANDIDATE_FACTOR', 3))  # 카테고리당 선택할 기사 수의 몇 배를 후보로 모을지
+    RANKING_HALF_LIFE_HOURS = float(os.getenv('RANKING_HALF_LIFE_HOURS', 12))  # 최신성 점수가 절반이 되는 시간
+    
+    # 중복 기사 판정 기준 (정규화한 제목의 SimHash 유사도, 1.0이면 같은 제목만 중복)
+    DEDUP_SIMILARITY = float(os.getenv('DEDUP_SIMILARITY', 0.9))
+    
+    # 요약 캐시 설정 (같은 기사는 한 번만 요약)
+    SUMMARY_CACHE_PATH = os.path.join(DATA_DIR, 'summary_cache.db')
+    SUMMARY_CACHE_MEMORY_SIZE = int(os.getenv('SUMMARY_CACHE_MEMORY_SIZE', 512))  # 메모리에 둘 요약 수
+    SUMMARY_CACHE_MAX_ENTRIES = int(os.getenv('SUMMARY_CACHE_MAX_ENTRIES', 5000))  # 디스크에 둘 최대 요약 수
+    SUMMARY_CACHE_MAX_AGE_DAYS = int(os.getenv('SUMMARY_CACHE_MAX_AGE_DAYS', 7))
+    
+    # 소스 상태 설정 (계속 실패하거나 결과가 없는 소스는 일정 시간 건너뜀)
+    SOURCE_HEALTH_PATH = os.path.join(DATA_DIR, 'source_health.db')
+    SOURCE_HEALTH_WINDOW = int(os.getenv('SOURCE_HEALTH_WINDOW', 20))  # 소스별로 보관할 최근 수집 결과 수
+    SOURCE_FAILURE_THRESHOLD = int(os.getenv('SOURCE_FAILURE_THRESHOLD', 3))  # 차단할 연속 실패(오류/0개) 횟수
+    SOURCE_BACKOFF_BASE = int(os.getenv('SOURCE_BACKOFF_BASE', 600))  # 첫 차단 시간(초), 다시 실패하면 두 배씩
+    SOURCE_BACKOFF_MAX = int(os.getenv('SOURCE_BACKOFF_MAX', 6 * 60 * 60))  # 최대 차단 시간(초)
+    
+    # 구독 설정 (서버/채널별 카테고리와 전송 시간)
+    SUBSCRIPTIONS_PATH = os.path.join(DATA_DIR, 'subscriptions.db')
+    FANOUT_CANDIDATE_FACTOR = int(os.getenv('FANOUT_CANDIDATE_FACTOR', 2))  # 채널별 선택을 위해 카테고리당 몇 배수 수집할지
+    
+    # 전송 기록 설정 (채널별로 이미 보낸 기사는 다시 보내지 않음)
+    HISTORY_PATH = os.path.join(DATA_DIR, 'history.db')
+    HISTORY_RETENTION_DAYS = int(os.getenv('HISTORY_RETENTION_DAYS', 7))
+    SCHEDULER_STATE_PATH = os.path.join(DATA_DIR, 'scheduler.db')  # 예약 작업 마지막 실행 기록
+    
+    # 백그라운드 수집 설정 (켜면 소스별 주기로 미리 수집해 두고, 리포트는 저장된 기사로 생성)
+    INGEST_ENABLED = os.getenv('INGEST_ENABLED', 'false').lower() == 'true'
+    INGEST_INTERVAL = int(os.getenv('INGEST_INTERVAL', 600))  # 소스별 기본 수집 주기(초)
+    INGEST_INTERVAL_OVERRIDES = {  # 소스별 수집 주기(초)
+        'newsapi': 1800,  # 무료 플랜 요청 한도
+    }
+    INGEST_MAX_AGE_HOURS = int(os.getenv('INGEST_MAX_AGE_HOURS', 24))  # 리포트에 사용할 기사의 최대 수집 경과 시간
+    ARTICLE_STORE_PATH = os.path.join(DATA_DIR, 'articles.db')
+    ARTICLE_RETENTION_HOURS = int(os.getenv('ARTICLE_RETENTION_HOURS', 48))
+    
+    # 속보 전송 설정 (백그라운드 수집 필요, 지정한 카테고리의 새 기사 중 키워드가 제목에 있으면 구독 채널로 바로 전송)
+    BREAKING_NEWS_ENABLED = os.getenv('BREAKING_NEWS_ENABLED', 'false').lower() == 'true'
+    BREAKING_CATEGORIES = [name.strip() for name in os.getenv('BREAKING_CATEGORIES', '정보보안').split(',') if name.strip()]
+    BREAKING_KEYWORDS = [
+        keyword.strip()
+        for keyword in os.getenv('BREAKING_KEYWORDS', '랜섬웨어,해킹,개인정보유출,제로데이,긴급 패치').split(',')
+        if keyword.strip()
+    ]
+    BREAKING_MIN_INTERVAL = int(os.getenv('BREAKING_MIN_INTERVAL', 1800))  # 채널별 속보 전송 최소 간격(초)
+    BREAKING_MAX_ARTICLES = int(os.getenv('BREAKING_MAX_ARTICLES', 3))  # 한 번에 보낼 최대 기사 수
+    BREAKING_MAX_AGE_MINUTES = int(os.getenv('BREAKING_MAX_AGE_MINUTES', 60))  # 이보다 오래전에 수집된 기사는 속보로 보내지 않음
+    
     # 언어 설정
     NEWS_LANGUAGE = 'ko'  # 한국어 뉴스
     NEWS_LANGUAGE_EN = 'en'  # 영어 뉴스
@@ -50,13 +203,28 @@ class Config:
     # 뉴스 개수
     NEWS_PER_CATEGORY = 5
     
+    # HTTP 수집 설정
+    HTTP_TIMEOUT = int(os.getenv('HTTP_TIMEOUT', 10))  # 요청당 최대 대기 시간(초)
+    HTTP_LIMIT_PER_HOST = int(os.getenv('HTTP_LIMIT_PER_HOST', 4))  # 호스트별 동시 연결 수
+    
+    # 파싱/정리 작업 설정 (피드 XML 파싱, 기사 설명 HTML 정리)
+    PARSE_WORKERS = int(os.getenv('PARSE_WORKERS', 2))  # 프로세스 풀 크기
+    PARSE_USE_PROCESS_POOL = os.getenv('PARSE_USE_PROCESS_POOL', 'true').lower() == 'true'  # false면 현재 프로세스에서 처리
+    PARSE_BATCH_SIZE = int(os.getenv('PARSE_BATCH_SIZE', 16))  # 작업 하나에 보낼 항목 수
+    
+    # 피드 캐시 설정 (ETag/Last-Modified 조건부 요청)
+    FEED_CACHE_PATH = os.path.join(DATA_DIR, 'feed_cache.db')
+    FEED_CACHE_MAX_MB = int(os.getenv('FEED_CACHE_MAX_MB', 20))  # 최대 크기, 초과 시 LRU 삭제
+    FEED_CACHE_TTL = int(os.getenv('FEED_CACHE_TTL', 300))  # 요청 없이 재사용할 시간(초)
+    FEED_CACHE_TTL_OVERRIDES = {  # 소스별 TTL(초)
+        'google': 600,
+    }
+    
     @staticmethod
     def validate():
         """필수 설정 검증"""
         if not Config.DISCORD_TOKEN:
             raise ValueError("DISCORD_TOKEN이 설정되지 않았습니다.")
-        if not Config.NEWS_CHANNEL_ID:
-            raise ValueError("NEWS_CHANNEL_ID가 설정되지 않았습니다.")
         if not Config.NEWSAPI_KEY:
             raise ValueError("NEWSAPI_KEY가 설정되지 않았습니다.")
         return True
@@ -0,0 +1,117 @@
+import calendar
+import math
+import re
+import sys
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Dict, Optional
+
+from news.dedup import url_hash
+
+UNKNOWN_SOURCE = '출처 불명'
+
+_RFC822 = re.compile(r'(\d{1,2}) ([A-Z][a-z]{2}) (\d{4}) (\d{2}):(\d{2})(?::(\d{2}))? ?([+-]\d{4}|GMT|UTC|Z)?')
+_MONTHS = {month: index for index, month in enumerate(
+    ['Jan', 'Feb', 'Mar', 'Apr', 'May', 'Jun', 'Jul', 'Aug', 'Sep', 'Oct', 'Nov', 'Dec'], 1)}
+
+def parse_published(value: str) -> float:
+    """발행 시각 문자열(RSS의 RFC 822, NewsAPI의 ISO 8601)을 유닉스 시각으로 변환 (실패하면 nan)"""
+    if not value:
+        return math.nan
+    
+    # RSS 형식은 정규식으로 바로 계산 (email.utils보다 몇 배 빠름)
+    match = _RFC822.search(value)
+    if match and match.group(2) in _MONTHS:
+        day, month, year, hour, minute, second, zone = match.groups()
+        offset = 0
+        if zone and zone[0] in '+-':
+            offset = (int(zone[1:3]) * 3600 + int(zone[3:]) * 60) * (1 if zone[0] == '+' else -1)
+        return calendar.timegm((int(year), _MONTHS[month], int(day), int(hour), int(minute), int(second or 0))) - offset
+    
+    try:
+        if value[:4].isdigit():
+            published = datetime.fromisoformat(value.replace('Z', '+00:00'))
+        else:
+            published = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return math.nan
+    if published.tzinfo is None:
+        published = published.replace(tzinfo=timezone.utc)
+    return published.timestamp()
+
+class Article:
+    """소스와 관계없이 같은 형태로 정규화한 기사
+    
+    소스 어댑터(news.sources)에서 한 번만 만들고 이후 수집/중복 제거/요약/렌더링에서 그대로 사용합니다.
+    __slots__로 기사마다 딕셔너리를 두지 않고, 출처 이름은 intern하여 같은 문자열을 공유합니다.
+    
+    Attributes:
+        source: 언론사/소스 이름 (항상 문자열)
+        published: 발행 시각 (UTC 유닉스 시각, 모르면 nan)
+        url_hash: 정규화된 URL의 해시 (전송 기록/저장소 키)
+    """
+    
+    __slots__ = ('title', 'description', 'url', 'source', 'published', 'author', 'image', 'url_hash')
+    
+    def __init__(self, title: str, description: str = '', url: str = '', source: str = UNKNOWN_SOURCE,
+                 published: float = math.nan, author: str = '', image: str = ''):
+        self.title = title or ''
+        self.description = description or ''
+        self.url = url or ''
+        self.source = sys.intern(source or UNKNOWN_SOURCE)
+        self.published = published
+        self.author = author or ''
+        self.image = image or ''
+        self.url_hash = url_hash(self.url)
+    
+    def __repr__(self):
+        return f"Article({self.title!r}, source={self.source!r})"
+    
+    @property
+    def published_at(self) -> Optional[datetime]:
+        """발행 시각 (UTC datetime, 모르면 None)"""
+        if math.isnan(self.published):
+            return None
+        return datetime.fromtimestamp(self.published, tz=timezone.utc)
+    
+    @classmethod
+    def from_newsapi(cls, item: Dict) -> 'Article':
+        """NewsAPI 응답의 기사 항목으로 생성 (source는 {'id': ..., 'name': ...} 형태)"""
+        source = item.get('source') or {}
+        return cls(
+            title=item.get('title'),
+            description=item.get('description'),
+            url=item.get('url'),
+            source=source.get('name') if isinstance(source, dict) else source,
+            published=parse_published(item.get('publishedAt') or ''),
+            author=item.get('author'),
+            image=item.get('urlToImage')
+        )
+    
+    def to_dict(self) -> Dict:
+        """저장용 딕셔너리 (JSON 직렬화 가능)"""
+        return {
+            'title': self.title,
+            'description': self.description,
+            'url': self.url,
+            'source': self.source,
+            'published': None if math.isnan(self.published) else self.published,
+            'author': self.author,
+            'image': self.image
+        }
+    
+    @classmethod
+    def from_dict(cls, data: Dict) -> 'Article':
+        """to_dict()로 저장한 딕셔너리에서 복원 (이전 형식의 publishedAt/urlToImage 키도 허용)"""
+        if 'published' not in data:
+            return cls.from_newsapi(data)
+        published = data.get('published')
+        return cls(
+            title=data.get('title'),
+            description=data.get('description'),
+            url=data.get('url'),
+            source=data.get('source'),
+            published=math.nan if published is None else published,
+            author=data.get('author'),
+            image=data.get('image')
+        )
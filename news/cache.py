@@ -0,0 +1,351 @@
+import json
+import time
+import asyncio
+import hashlib
+import logging
+import threading
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Dict, Hashable, List, Optional, Tuple
+
+from utils.storage import connect, transaction
+
+logger = logging.getLogger(__name__)
+
+class FeedCache:
+    """피드 URL별 HTTP 캐시 (ETag/Last-Modified + 파싱 결과, 디스크 저장)
+    
+    - TTL 이내의 항목은 네트워크 요청 없이 그대로 사용합니다.
+    - TTL이 지난 항목은 조건부 요청 헤더를 만들고, 304 응답이면 저장된 파싱 결과를 재사용합니다.
+    - 전체 크기가 max_bytes를 넘으면 가장 오래 사용하지 않은 항목부터 삭제합니다.
+    
+    조회/저장은 SQLite 쿼리와 JSON 변환을 하므로 이벤트 루프에서는 asyncio.to_thread로 호출합니다.
+    (연결 하나를 여러 스레드가 쓰므로 메서드마다 잠금)
+    """
+    
+    def __init__(self, path: str, max_bytes: int = 20 * 1024 * 1024, default_ttl: int = 300,
+                 ttl_overrides: Optional[Dict[str, int]] = None):
+        self.max_bytes = max_bytes
+        self.default_ttl = default_ttl
+        self.ttl_overrides = ttl_overrides or {}
+        self._lock = threading.Lock()
+        
+        self.conn = connect(path)
+        self.conn.execute('''
+            CREATE TABLE IF NOT EXISTS feed_cache (
+                url TEXT PRIMARY KEY,
+                source TEXT NOT NULL,
+                etag TEXT,
+                last_modified TEXT,
+                entries TEXT NOT NULL,
+                size INTEGER NOT NULL,
+                fetched_at REAL NOT NULL,
+                accessed_at REAL NOT NULL
+            )
+        ''')
+        self.conn.execute('CREATE INDEX IF NOT EXISTS idx_feed_cache_accessed ON feed_cache (accessed_at)')
+    
+    def ttl_for(self, source: str) -> int:
+        """소스별 TTL(초) 반환"""
+        return self.ttl_overrides.get(source, self.default_ttl)
+    
+    def get(self, url: str) -> Optional[Dict]:
+        """캐시 항목 조회 (사용 시각 갱신)"""
+        with self._lock:
+            row = self.conn.execute(
+                'SELECT source, etag, last_modified, entries, fetched_at FROM feed_cache WHERE url = ?',
+                (url,)
+            ).fetchone()
+            
+            if row is None:
+                return None
+            
+            self.conn.execute('UPDATE feed_cache SET accessed_at = ? WHERE url = ?', (time.time(), url))
+        return {
+            'source': row['source'],
+            'etag': row['etag'],
+            'last_modified': row['last_modified'],
+            'entries': json.loads(row['entries']),
+            'fetched_at': row['fetched_at']
+        }
+    
+    def is_fresh(self, cached: Dict) -> bool:
+        """TTL 이내의 항목인지 확인"""
+        return time.time() - cached['fetched_at'] < self.ttl_for(cached['source'])
+    
+    def conditional_headers(self, cached: Optional[Dict]) -> Dict[str, str]:
+        """조건부 요청 헤더 생성"""
+        headers = {}
+        if cached:
+            if cached['etag']:
+                headers['If-None-Match'] = cached['etag']
+            if cached['last_modified']:
+                headers['If-Modified-Since'] = cached['last_modified']
+        return headers
+    
+    def touch(self, url: str):
+        """304 응답 후 항목을 다시 신선한 상태로 표시"""
+        now = time.time()
+        with self._lock:
+            self.conn.execute('UPDATE feed_cache SET fetched_at = ?, accessed_at = ? WHERE url = ?', (now, now, url))
+    
+    def store(self, url: str, source: str, etag: Optional[str], last_modified: Optional[str],
+              entries: List[Dict]):
+        """새로 받은 피드의 파싱 결과 저장"""
+        self.store_many(source, [(url, etag, last_modified, entries)])
+    
+    def store_many(self, source: str, feeds: List[Tuple[str, Optional[str], Optional[str], List[Dict]]]):
+        """새로 받은 피드 여러 개를 트랜잭션 하나로 저장
+        
+        Args:
+            feeds: (url, etag, last_modified, 파싱된 엔트리) 목록
+        """
+        if not feeds:
+            return
+        now = time.time()
+        rows = []
+        for url, etag, last_modified, entries in feeds:
+            payload = json.dumps(entries, ensure_ascii=False)
+            rows.append((url, source, etag, last_modified, payload, len(payload.encode('utf-8')), now, now))
+        
+        with self._lock, transaction(self.conn):
+            self.conn.executemany(
+                'INSERT OR REPLACE INTO feed_cache '
+                '(url, source, etag, last_modified, entries, size, fetched_at, accessed_at) '
+                'VALUES (?, ?, ?, ?, ?, ?, ?, ?)',
+                rows
+            )
+            self._evict()
+    
+    def _evict(self):
+        """전체 크기가 제한을 넘으면 LRU 순서로 삭제"""
+        total = self.conn.execute('SELECT COALESCE(SUM(size), 0) FROM feed_cache').fetchone()[0]
+        if total <= self.max_bytes:
+            return
+        
+        removed = 0
+        for row in self.conn.execute('SELECT url, size FROM feed_cache ORDER BY accessed_at').fetchall():
+            if total <= self.max_bytes:
+                break
+            self.conn.execute('DELETE FROM feed_cache WHERE url = ?', (row['url'],))
+            total -= row['size']
+            removed += 1
+        
+        logger.info(f"피드 캐시 정리: {removed}개 항목 삭제")
+    
+    def close(self):
+        """데이터베이스 연결 종료"""
+        with self._lock:
+            self.conn.close()
+
+class DigestCache:
+    """완성된 뉴스 리포트 캐시 (TTL + 요청 합치기)
+    
+    같은 키로 동시에 여러 요청이 오면 진행 중인 하나의 생성 작업 결과를 함께 기다립니다.
+    요청한 쪽이 취소되어도 생성 작업은 계속 진행되어 다른 요청과 캐시에 사용됩니다.
+    TTL이 지난 항목은 새 결과를 저장할 때 삭제하고, max_entries를 넘으면 먼저 저장한 항목부터 삭제합니다.
+    """
+    
+    def __init__(self, ttl: int = 600, max_entries: int = 512):
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self._entries: 'OrderedDict[Hashable, Tuple[float, Any]]' = OrderedDict()  # 저장 순서 = 만료 순서
+        self._inflight: Dict[Hashable, asyncio.Task] = {}
+    
+    def get(self, key: Hashable) -> Optional[Any]:
+        """TTL 이내의 캐시 값 반환 (없으면 None, 만료된 항목은 삭제)"""
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        if entry[0] > time.monotonic():
+            return entry[1]
+        del self._entries[key]
+        return None
+    
+    async def get_or_build(self, key: Hashable, builder: Callable[[], Awaitable[Any]]) -> Any:
+        """캐시 값이 있으면 반환하고, 없으면 생성 (동시 요청은 하나의 생성 작업 공유)"""
+        value = self.get(key)
+        if value is not None:
+            logger.info(f"리포트 캐시 사용: {key}")
+            return value
+        return await self._build(key, builder)
+    
+    async def refresh(self, key: Hashable, builder: Callable[[], Awaitable[Any]]) -> Any:
+        """캐시 여부와 관계없이 새로 생성 (미리 준비용)"""
+        return await self._build(key, builder)
+    
+    def invalidate(self, key: Optional[Hashable] = None):
+        """캐시 삭제 (key가 없으면 전체)"""
+        if key is None:
+            self._entries.clear()
+        else:
+            self._entries.pop(key, None)
+    
+    async def _build(self, key: Hashable, builder: Callable[[], Awaitable[Any]]) -> Any:
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(builder())
+            self._inflight[key] = task
+            task.add_done_callback(lambda done: self._finish(key, done))
+        else:
+            logger.info(f"진행 중인 리포트 생성 대기: {key}")
+        return await asyncio.shield(task)
+    
+    def _finish(self, key: Hashable, task: asyncio.Task):
+        """생성 작업 완료 시 결과 저장"""
+        self._inflight.pop(key, None)
+        if not task.cancelled() and task.exception() is None:
+            self._entries.pop(key, None)
+            self._entries[key] = (time.monotonic() + self.ttl, task.result())
+            self._prune()
+    
+    def _prune(self):
+        """만료된 항목과 max_entries를 넘는 오래된 항목 삭제"""
+        now = time.monotonic()
+        while self._entries:
+            oldest_key, (expires_at, _) = next(iter(self._entries.items()))
+            if expires_at > now and len(self._entries) <= self.max_entries:
+                break
+            del self._entries[oldest_key]
+
+class SummaryCache:
+    """기사 요약 캐시 (메모리 LRU + 디스크 저장)
+    
+    키는 요약 방식/모델과 제목, 설명을 합친 내용의 해시이므로 같은 기사는
+    !뉴스, !테스트뉴스, 일일 전송 어디서 요약하든 한 번만 계산합니다.
+    디스크 항목은 max_age가 지나거나 max_entries를 넘으면 오래 사용하지 않은 순서로 삭제합니다.
+    
+    디스크를 사용하면 조회/저장이 SQLite 쿼리를 하므로 이벤트 루프에서는 asyncio.to_thread로 호출합니다.
+    (연결과 메모리 LRU를 여러 스레드가 쓰므로 메서드마다 잠금)
+    """
+    
+    def __init__(self, path: Optional[str] = None, memory_size: int = 512, max_entries: int = 5000,
+                 max_age: int = 7 * 24 * 60 * 60):
+        self.memory_size = memory_size
+        self.max_entries = max_entries
+        self.max_age = max_age
+        self._memory: 'OrderedDict[str, str]' = OrderedDict()
+        self._stats = {'memory_hits': 0, 'disk_hits': 0, 'misses': 0}
+        self._lock = threading.Lock()
+        
+        self.conn = None
+        if path:
+            self.conn = connect(path)
+            self.conn.execute('''
+                CREATE TABLE IF NOT EXISTS summary_cache (
+                    key TEXT PRIMARY KEY,
+                    summary TEXT NOT NULL,
+                    created_at REAL NOT NULL,
+                    accessed_at REAL NOT NULL
+                )
+            ''')
+            self.conn.execute('CREATE INDEX IF NOT EXISTS idx_summary_cache_accessed ON summary_cache (accessed_at)')
+    
+    @staticmethod
+    def make_key(mode: str, title: str, description: str, max_length: int) -> str:
+        """요약 방식 + 기사 내용으로 캐시 키 생성"""
+        content = '\x1f'.join((mode, str(max_length), title or '', description or ''))
+        return hashlib.sha256(content.encode('utf-8')).hexdigest()
+    
+    def get(self, key: str) -> Optional[str]:
+        """단일 조회"""
+        return self.get_many([key]).get(key)
+    
+    def get_many(self, keys: List[str]) -> Dict[str, str]:
+        """여러 키 조회 (메모리에 없는 키는 디스크에서 한 번에 조회)"""
+        with self._lock:
+            return self._get_many(keys)
+    
+    def _get_many(self, keys: List[str]) -> Dict[str, str]:
+        """get_many()와 같지만 잠금을 이미 잡은 상태에서 호출"""
+        found = {}
+        missing = []
+        
+        for key in keys:
+            if key in self._memory:
+                self._memory.move_to_end(key)
+                found[key] = self._memory[key]
+                self._stats['memory_hits'] += 1
+            else:
+                missing.append(key)
+        
+        if missing and self.conn:
+            now = time.time()
+            rows = []
+            for start in range(0, len(missing), 500):  # SQLite 변수 개수 제한
+                chunk = missing[start:start + 500]
+                placeholders = ','.join('?' * len(chunk))
+                rows.extend(self.conn.execute(
+                    f'SELECT key, summary FROM summary_cache WHERE key IN ({placeholders}) AND created_at >= ?',
+                    (*chunk, now - self.max_age)
+                ).fetchall())
+            
+            if rows:
+                with transaction(self.conn):
+                    self.conn.executemany('UPDATE summary_cache SET accessed_at = ? WHERE key = ?',
+                                          [(now, row['key']) for row in rows])
+            for row in rows:
+                found[row['key']] = row['summary']
+                self._remember(row['key'], row['summary'])
+                self._stats['disk_hits'] += 1
+        
+        self._stats['misses'] += len(keys) - len(found)
+        return found
+    
+    def put(self, key: str, summary: str):
+        """단일 저장"""
+        self.put_many({key: summary})
+    
+    def put_many(self, items: Dict[str, str]):
+        """여러 요약 저장"""
+        if not items:
+            return
+        
+        with self._lock:
+            for key, summary in items.items():
+                self._remember(key, summary)
+            
+            if self.conn:
+                self._store(items)
+    
+    def _store(self, items: Dict[str, str]):
+        """디스크에 저장 (오래된 항목 삭제까지 트랜잭션 하나로 커밋)"""
+        now = time.time()
+        with transaction(self.conn):
+            self.conn.executemany(
+                'INSERT OR REPLACE INTO summary_cache (key, summary, created_at, accessed_at) VALUES (?, ?, ?, ?)',
+                [(key, summary, now, now) for key, summary in items.items()]
+            )
+            self._evict()
+    
+    def stats(self) -> Dict[str, float]:
+        """적중/미적중 통계"""
+        with self._lock:
+            stats = dict(self._stats)
+        lookups = stats['memory_hits'] + stats['disk_hits'] + stats['misses']
+        stats['hit_rate'] = (stats['memory_hits'] + stats['disk_hits']) / lookups if lookups else 0.0
+        stats['memory_entries'] = len(self._memory)
+        return stats
+    
+    def _remember(self, key: str, summary: str):
+        """메모리 LRU에 저장"""
+        self._memory[key] = summary
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.memory_size:
+            self._memory.popitem(last=False)
+    
+    def _evict(self):
+        """오래된 항목과 개수 초과 항목 삭제"""
+        self.conn.execute('DELETE FROM summary_cache WHERE created_at < ?', (time.time() - self.max_age,))
+        count = self.conn.execute('SELECT COUNT(*) FROM summary_cache').fetchone()[0]
+        if count > self.max_entries:
+            self.conn.execute(
+                'DELETE FROM summary_cache WHERE key IN '
+                '(SELECT key FROM summary_cache ORDER BY accessed_at LIMIT ?)',
+                (count - self.max_entries,)
+            )
+    
+    def close(self):
+        """데이터베이스 연결 종료"""
+        if self.conn:
+            with self._lock:
+                self.conn.close()
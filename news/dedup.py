@@ -0,0 +1,210 @@
+import re
+import sys
+import hashlib
+from array import array
+from functools import lru_cache
+from itertools import combinations
+from typing import Dict, List, Optional, Set
+from urllib.parse import urlsplit, parse_qsl, urlencode
+
+# 추적용 쿼리 파라미터 (같은 기사라도 유입 경로마다 달라짐)
+TRACKING_PARAMS = {
+    'fbclid', 'gclid', 'dclid', 'msclkid', 'igshid', 'mc_cid', 'mc_eid',
+    'ref', 'ref_src', 'referrer', 'from', 'cmpid', 'oc', 'sns', 'share'
+}
+TRACKING_PREFIXES = ('utm_', 'ga_', 'pk_')
+
+_TITLE_SUFFIX_RE = re.compile(r'\s+[-|–—]\s+[^-|–—\s]+(?:\s[^-|–—\s]+)?$')  # " - 언론사" 형태의 꼬리표
+_TITLE_TAG_RE = re.compile(r'^(\s*[\[\(【<][^\]\)】>]{1,10}[\]\)】>])+')  # [단독], (종합) 등 머리표
+_NON_WORD_RE = re.compile(r'[^\w]+')
+
+def normalize_url(url: str) -> str:
+    """비교용 URL 정규화 (스킴/www/추적 파라미터/프래그먼트/끝 슬래시 제거)"""
+    if not url:
+        return ''
+    
+    parts = urlsplit(url.strip())
+    host = parts.netloc.lower()
+    if host.startswith('www.'):
+        host = host[4:]
+    if host.startswith('m.'):
+        host = host[2:]
+    
+    query = [
+        (key, value) for key, value in parse_qsl(parts.query, keep_blank_values=True)
+        if key.lower() not in TRACKING_PARAMS and not key.lower().startswith(TRACKING_PREFIXES)
+    ]
+    query.sort()
+    
+    normalized = host + parts.path.rstrip('/')
+    if query:
+        normalized += '?' + urlencode(query)
+    return normalized
+
+def url_hash(url: str) -> str:
+    """정규화된 URL의 해시 (저장/비교용 키)"""
+    return hashlib.sha1(normalize_url(url).encode('utf-8')).hexdigest()[:16]
+
+def normalize_title(title: str) -> str:
+    """비교용 제목 정규화 (언론사 꼬리표, [단독] 같은 머리표, 기호, 공백 제거)"""
+    if not title:
+        return ''
+    
+    # 꼬리표 앞부분이 충분히 길 때만 제거 ("삼성 - 애플 분쟁" 같은 제목 보호)
+    match = _TITLE_SUFFIX_RE.search(title)
+    if match and match.start() >= 10:
+        title = title[:match.start()]
+    title = _TITLE_TAG_RE.sub('', title)
+    return _NON_WORD_RE.sub('', title).lower()
+
+# 바이트 값 → 8개 비트를 16비트 칸에 펼친 정수
+_SPREAD_BYTE = [
+    sum(1 << (bit * 16) for bit in range(8) if value >> bit & 1)
+    for value in range(256)
+]
+
+@lru_cache(maxsize=65536)
+def _spread_hash(feature: str, bits: int = 64) -> int:
+    """특징 해시의 각 비트를 16비트 칸에 하나씩 펼친 정수 (여러 특징을 더하면 비트별 개수가 됨)"""
+    digest = hashlib.blake2b(feature.encode('utf-8'), digest_size=bits // 8).digest()
+    spread = 0
+    for index, byte in enumerate(reversed(digest)):
+        spread |= _SPREAD_BYTE[byte] << (index * 128)
+    return spread
+
+def simhash(text: str, ngram: int = 3, bits: int = 64) -> int:
+    """문자 n-gram 기반 SimHash 지문 계산"""
+    if not text:
+        return 0
+    
+    if len(text) <= ngram:
+        features = [text]
+    else:
+        features = [text[i:i + ngram] for i in range(len(text) - ngram + 1)]
+    
+    # 펼친 해시를 모두 더하면 16비트 칸마다 해당 비트가 1인 특징 수가 들어 있음
+    counts = array('H', sum(_spread_hash(feature, bits) for feature in features).to_bytes(bits * 2, 'little'))
+    if sys.byteorder == 'big':
+        counts.byteswap()
+    
+    # 비트별 다수결로 지문 결정
+    threshold = len(features) / 2
+    fingerprint = 0
+    for bit, count in enumerate(counts):
+        if count > threshold:
+            fingerprint |= 1 << bit
+    return fingerprint
+
+def hamming_distance(a: int, b: int) -> int:
+    """두 지문 간 다른 비트 수"""
+    return bin(a ^ b).count('1')
+
+class DedupIndex:
+    """URL 정규화 + SimHash 블록 버킷 기반 유사 기사 중복 검사
+    
+    지문을 (허용 거리 + 2)개 블록으로 나누고, 그중 2개 블록 조합마다 버킷 테이블을 둡니다.
+    해밍 거리가 허용 거리 이하인 두 지문은 비둘기집 원리에 따라 적어도 2개 블록이 완전히
+    같으므로, 같은 버킷에 있는 후보만 비교하면 됩니다. (평균 O(1) 조회)
+    
+    add_if_new에 출처를 함께 넘기면 같은 기사로 판정된 항목마다 출처를 모아
+    coverage()로 몇 개 출처가 같은 기사를 다뤘는지 확인할 수 있습니다.
+    
+    Args:
+        similarity: 같은 기사로 볼 제목 유사도 (0~1, 1이면 정규화된 제목이 같은 경우만)
+    """
+    
+    BITS = 64
+    
+    def __init__(self, similarity: float = 0.9):
+        self.similarity = similarity
+        self.max_distance = min(max(0, int(round((1 - similarity) * self.BITS))), self.BITS - 2)
+        
+        # 블록 경계 계산 (가능한 한 같은 너비로 분할)
+        block_count = self.max_distance + 2
+        width, extra = divmod(self.BITS, block_count)
+        blocks = []
+        start = 0
+        for i in range(block_count):
+            end = start + width + (1 if i < extra else 0)
+            blocks.append((start, (1 << (end - start)) - 1, end - start))
+            start = end
+        
+        # 블록 2개 조합마다 하나의 버킷 테이블
+        self._tables = [(blocks[a], blocks[b]) for a, b in combinations(range(block_count), 2)]
+        
+        # 정규화 URL/제목/지문 → 처음 등록한 기사의 키
+        self._urls: Dict[str, str] = {}
+        self._titles: Dict[str, str] = {}
+        self._fingerprints: Dict[int, str] = {}
+        self._sources: Dict[str, Set[str]] = {}  # 기사 키 → 같은 기사를 준 출처
+        self._buckets: List[Dict[int, List[int]]] = [{} for _ in self._tables]
+    
+    def __len__(self):
+        return len(self._urls)
+    
+    def _bucket_keys(self, fingerprint: int) -> List[int]:
+        return [
+            (fingerprint >> start_a & mask_a) << width_b | (fingerprint >> start_b & mask_b)
+            for (start_a, mask_a, _), (start_b, mask_b, width_b) in self._tables
+        ]
+    
+    def _find_similar(self, fingerprint: int) -> Optional[int]:
+        """허용 거리 이내의 기존 지문 찾기"""
+        for table, key in enumerate(self._bucket_keys(fingerprint)):
+            for candidate in self._buckets[table].get(key, ()):
+                if hamming_distance(fingerprint, candidate) <= self.max_distance:
+                    return candidate
+        return None
+    
+    def _prepare(self, url: str, title: str):
+        normalized_title = normalize_title(title)
+        fingerprint = simhash(normalized_title) if normalized_title else None
+        return normalize_url(url), normalized_title, fingerprint
+    
+    def _match(self, normalized_url: str, normalized_title: str, fingerprint: Optional[int]) -> Optional[str]:
+        """같은 기사로 등록된 항목의 키 (없으면 None)"""
+        if normalized_url and normalized_url in self._urls:
+            return self._urls[normalized_url]
+        if not normalized_title:
+            return None
+        if normalized_title in self._titles:
+            return self._titles[normalized_title]
+        similar = self._find_similar(fingerprint)
+        return self._fingerprints[similar] if similar is not None else None
+    
+    def _insert(self, normalized_url: str, normalized_title: str, fingerprint: Optional[int]) -> str:
+        key = normalized_url or normalized_title
+        if normalized_url:
+            self._urls[normalized_url] = key
+        if normalized_title:
+            self._titles[normalized_title] = key
+            self._fingerprints.setdefault(fingerprint, key)
+            for table, bucket_key in enumerate(self._bucket_keys(fingerprint)):
+                self._buckets[table].setdefault(bucket_key, []).append(fingerprint)
+        return key
+    
+    def is_duplicate(self, url: str, title: str) -> bool:
+        """이미 등록된 기사와 URL 또는 제목이 (거의) 같은지 확인"""
+        return self._match(*self._prepare(url, title)) is not None
+    
+    def add(self, url: str, title: str):
+        """기사를 색인에 등록"""
+        self._insert(*self._prepare(url, title))
+    
+    def add_if_new(self, url: str, title: str, source: Optional[str] = None) -> bool:
+        """중복이 아니면 등록하고 True, 중복이면 False 반환 (source는 같은 기사의 출처 수 집계용)"""
+        prepared = self._prepare(url, title)
+        key = self._match(*prepared)
+        if key is None:
+            key = self._insert(*prepared)
+            if source:
+                self._sources[key] = {source}
+            return True
+        if source and key:
+            self._sources.setdefault(key, set()).add(source)
+        return False
+    
+    def coverage(self, url: str, title: str) -> int:
+        """등록된 기사를 다룬 출처 수 (출처 없이 등록했으면 1)"""
+        key = self._match(*self._prepare(url, title))
+        return max(1, len(self._sources.get(key, ()))) if key is not None else 0
@@ -1,22 +1,206 @@
-import requests
+import asyncio
+import aiohttp
+import json
+import time
 from datetime import datetime, timedelta
-from typing import List, Dict, Optional
+from typing import List, Dict, Mapping, Optional, Set, Tuple
 import logging
-import feedparser
-from urllib.parse import quote
+from collections import deque
+from urllib.parse import urlsplit
+
+from news.parsing import ParsePool, parse_feed_batch
+from news.cache import FeedCache
+from news.health import SourceHealth
+from news.sources import FeedSource, QueryPlan, build_sources
+from news.article import Article
+from news.dedup import DedupIndex
+from config import Config
+from utils.metrics import counter, histogram
 
 logger = logging.getLogger(__name__)
 
+SOURCE_FETCH_SECONDS = histogram('newsbot_source_fetch_seconds', '카테고리 하나에 대한 소스별 수집 시간', ['source'])
+SOURCE_ERRORS = counter('newsbot_source_errors_total', '소스별 수집 오류/시간 초과 수', ['source', 'reason'])
+ARTICLES = counter('newsbot_articles_total',
+                   '수집 단계별 기사 수 (raw: 소스에서 받은 기사, excluded: 이미 전송, duplicate: 중복 제거, unique: 사용)',
+                   ['stage'])
+HEDGED_REQUESTS = counter('newsbot_hedged_requests_total', '응답 지연으로 중복 요청한 수', ['host'])
+
 class NewsFetcher:
     """뉴스를 수집하는 클래스"""
     
-    def __init__(self, api_key: str):
+    def __init__(self, api_key: str, timeout: int = 10, limit_per_host: int = 4,
+                 parse_pool: Optional[ParsePool] = None, feed_cache: Optional[FeedCache] = None,
+                 sources: Optional[List[FeedSource]] = None, dedup_similarity: float = 0.9,
+                 source_health: Optional[SourceHealth] = None, source_timeout: Optional[float] = None,
+                 hedge_requests: bool = False, hedge_min_delay: float = 1.0, ranking: bool = False,
+                 ranking_candidates: int = 3, ranking_half_life: float = 12):
         self.api_key = api_key
         self.base_url = 'https://newsapi.org/v2'
+        self.timeout = timeout
+        self.limit_per_host = limit_per_host
+        self.parse_pool = parse_pool or ParsePool(max_workers=0)
+        self.feed_cache = feed_cache
+        self.sources = sources if sources is not None else build_sources(Config.NEWS_SOURCES)
+        self.dedup_similarity = dedup_similarity
+        self.source_health = source_health
+        self.source_timeout = source_timeout  # 카테고리마다 소스 하나에 쓸 수 있는 최대 시간(초)
+        
+        # 응답이 느린 호스트에는 같은 요청을 한 번 더 보내 먼저 온 응답 사용
+        self.hedge_requests = hedge_requests
+        self.hedge_min_delay = hedge_min_delay  # 이보다 빠른 호스트에는 중복 요청하지 않음
+        self.hedged_count = 0
+        
+        # 관련도 순위 (카테고리마다 후보를 넉넉히 모아 키워드/최신성/출처 수로 점수를 매겨 상위 기사 선택)
+        self.ranking = ranking
+        self.ranking_candidates = max(1, ranking_candidates)  # 후보 수 = 선택할 기사 수 × 이 값
+        self.ranking_half_life = ranking_half_life  # 최신성 점수가 절반이 되는 시간
+        self._latencies: Dict[str, deque] = {}  # 호스트별 최근 응답 시간
+        self._session: Optional[aiohttp.ClientSession] = None
+    
+    async def _get_session(self) -> aiohttp.ClientSession:
+        """공유 aiohttp 세션 반환 (최초 호출 시 생성)"""
+        if self._session is None or self._session.closed:
+            # 호스트별 동시 연결 수 제한
+            connector = aiohttp.TCPConnector(limit_per_host=self.limit_per_host, ttl_dns_cache=300)
+            # 연결 풀에서 차례를 기다리는 시간은 제외 (전체 시간은 source_timeout/time_budget으로 제한)
+            self._session = aiohttp.ClientSession(
+                connector=connector,
+                timeout=aiohttp.ClientTimeout(total=None, sock_connect=self.timeout, sock_read=self.timeout)
+            )
+        return self._session
+    
+    async def warm_up(self):
+        """공유 세션을 미리 생성 (봇 시작 시 게이트웨이 연결과 동시에 실행)"""
+        await self._get_session()
+    
+    async def close(self):
+        """공유 세션 종료"""
+        if self._session and not self._session.closed:
+            await self._session.close()
+        self._session = None
+    
+    async def _request(self, url: str, params: Optional[Dict] = None,
+                       headers: Optional[Dict] = None) -> Optional[Tuple[int, bytes, Mapping[str, str]]]:
+        """GET 요청 후 (상태 코드, 본문, 응답 헤더) 반환 (실패 시 None)
+        
+        중복 요청(hedge_requests)을 사용하면, 호스트의 최근 p95 응답 시간이 지나도록 응답이 없을 때
+        같은 요청을 한 번 더 보내고 먼저 성공한 응답을 사용합니다.
+        """
+        host = urlsplit(url).netloc
+        delay = self._hedge_delay(host)
+        if delay is None:
+            return await self._request_once(url, params, headers, host)
+        
+        first = asyncio.ensure_future(self._request_once(url, params, headers, host))
+        second = None
+        try:
+            done, _ = await asyncio.wait({first}, timeout=delay)
+            if done:
+                return first.result()
+            
+            self.hedged_count += 1
+            HEDGED_REQUESTS.inc(host=host)
+            logger.info(f"응답 지연으로 중복 요청 ({host}, {delay:.2f}초 경과)")
+            second = asyncio.ensure_future(self._request_once(url, params, headers, host))
+            for next_done in asyncio.as_completed({first, second}):
+                result = await next_done
+                if result is not None:
+                    return result
+            return None
+        finally:
+            first.cancel()
+            if second:
+                second.cancel()
+    
+    def _hedge_delay(self, host: str) -> Optional[float]:
+        """중복 요청을 보낼 대기 시간 (응답 시간 기록이 부족하거나 충분히 빠른 호스트는 None)"""
+        latencies = self._latencies.get(host)
+        if not self.hedge_requests or not latencies or len(latencies) < 20:
+            return None
+        
+        p95 = sorted(latencies)[int(len(latencies) * 0.95)]
+        return p95 if p95 >= self.hedge_min_delay else None
+    
+    async def _request_once(self, url: str, params: Optional[Dict], headers: Optional[Dict],
+                            host: str) -> Optional[Tuple[int, bytes, Mapping[str, str]]]:
+        started = time.monotonic()
+        try:
+            session = await self._get_session()
+            async with session.get(url, params=params, headers=headers) as response:
+                response.raise_for_status()
+                result = response.status, await response.read(), response.headers.copy()
+        except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+            logger.error(f"요청 오류 ({url}): {e}")
+            return None
+        
+        self._latencies.setdefault(host, deque(maxlen=100)).append(time.monotonic() - started)
+        return result
+    
+    async def _download(self, url: str, params: Optional[Dict] = None) -> Optional[bytes]:
+        """URL 본문을 비동기로 다운로드 (실패 시 None)"""
+        result = await self._request(url, params=params)
+        return result[1] if result else None
+    
+    async def fetch_feed(self, source_key: str, url: str) -> Tuple[Optional[List[Dict]], Optional[Dict]]:
+        """피드 조회 (캐시 → 조건부 요청)
+        
+        Returns:
+            (캐시에서 얻은 엔트리, 새로 받은 응답) 중 하나만 채워진 튜플.
+            새 응답은 {'body', 'etag', 'last_modified'} 형태이며 호출자가 묶음으로 파싱합니다.
+        """
+        # 캐시 조회(SQLite + JSON 변환)는 이벤트 루프를 막지 않도록 스레드에서
+        cached = await asyncio.to_thread(self.feed_cache.get, url) if self.feed_cache else None
+        if cached and self.feed_cache.is_fresh(cached):
+            return cached['entries'], None
+        
+        headers = self.feed_cache.conditional_headers(cached) if self.feed_cache else None
+        result = await self._request(url, headers=headers)
+        
+        if result is None:
+            # 요청 실패 시 오래된 캐시라도 사용
+            return (cached['entries'] if cached else None), None
         
+        status, body, response_headers = result
+        if status == 304 and cached:
+            await asyncio.to_thread(self.feed_cache.touch, url)
+            return cached['entries'], None
+        
+        return None, {
+            'body': body,
+            'etag': response_headers.get('ETag'),
+            'last_modified': response_headers.get('Last-Modified')
+        }
+    
+    async def complete_feeds(self, source: FeedSource, results: List[Tuple[str, Tuple]]) -> List[List[Dict]]:
+        """fetch_feed 결과 묶음을 엔트리 목록으로 완성
+        
+        새로 받은 피드만 한 번에 프로세스 풀에서 파싱하고, 캐시에도 한 번에 저장합니다.
+        실패한 피드는 빈 목록으로 반환합니다.
+        """
+        downloaded = [(index, response) for index, (_, (_, response)) in enumerate(results) if response]
+        parsed = await self.parse_pool.map(parse_feed_batch, [
+            (response['body'], source.description_field) for _, response in downloaded
+        ])
+        
+        feeds = [cached or [] for _, (cached, _) in results]
+        for (index, response), entries in zip(downloaded, parsed):
+            feeds[index] = entries
+        
+        # 묶음 하나를 트랜잭션 하나로 저장 (스레드에서)
+        if self.feed_cache and downloaded:
+            await asyncio.to_thread(self.feed_cache.store_many, source.key, [
+                (results[index][0], response['etag'], response['last_modified'], feeds[index])
+                for index, response in downloaded
+            ])
+        
+        return feeds
+    
     def fetch_news_by_keywords(self, keywords: List[str], language: str = 'ko', 
                                from_date: Optional[str] = None, page_size: int = 10) -> List[Dict]:
         """키워드 기반으로 뉴스 수집"""
+        import requests  # 동기 호출에서만 사용하므로 처음 쓸 때 불러옴
+        
         try:
             # 어제 날짜 계산
             if not from_date:
@@ -48,7 +232,7 @@ class NewsFetcher:
             else:
                 logger.error(f"뉴스 수집 실패: {data.get('message', 'Unknown error')}")
                 return []
-                
+        
         except requests.exceptions.RequestException as e:
             logger.error(f"API 요청 오류: {e}")
             return []
@@ -56,9 +240,46 @@ class NewsFetcher:
             logger.error(f"뉴스 수집 중 오류: {e}")
             return []
     
+    async def fetch_news_by_keywords_async(self, keywords: List[str], language: str = 'ko',
+                                           from_date: Optional[str] = None, page_size: int = 10) -> List[Dict]:
+        """키워드 기반으로 뉴스 비동기 수집 (공유 세션 사용)"""
+        if not from_date:
+            yesterday = datetime.now() - timedelta(days=1)
+            from_date = yesterday.strftime('%Y-%m-%d')
+        
+        query = ' OR '.join(keywords)
+        params = {
+            'apiKey': self.api_key,
+            'q': query,
+            'language': language,
+            'from': from_date,
+            'sortBy': 'publishedAt',
+            'pageSize': page_size
+        }
+        
+        body = await self._download(f'{self.base_url}/everything', params=params)
+        if body is None:
+            return []
+        
+        try:
+            data = json.loads(body)
+        except ValueError as e:
+            logger.error(f"뉴스 응답 파싱 오류: {e}")
+            return []
+        
+        if data.get('status') == 'ok':
+            articles = data.get('articles', [])
+            logger.info(f"수집된 뉴스: {len(articles)}개 (키워드: {query})")
+            return articles
+        else:
+            logger.error(f"뉴스 수집 실패: {data.get('message', 'Unknown error')}")
+            return []
+    
     def fetch_top_headlines(self, category: str = None, country: str = 'kr', 
                            page_size: int = 10) -> List[Dict]:
         """주요 헤드라인 뉴스 수집"""
+        import requests
+        
         try:
             url = f'{self.base_url}/top-headlines'
             params = {
@@ -82,7 +303,7 @@ class NewsFetcher:
             else:
                 logger.error(f"헤드라인 수집 실패: {data.get('message', 'Unknown error')}")
                 return []
-                
+        
         except requests.exceptions.RequestException as e:
             logger.error(f"API 요청 오류: {e}")
             return []
@@ -90,204 +311,244 @@ class NewsFetcher:
             logger.error(f"헤드라인 수집 중 오류: {e}")
             return []
     
-    def fetch_categorized_news(self, categories: Dict[str, Dict], news_per_category: int = 10) -> Dict[str, List[Dict]]:
-        """카테고리별 뉴스 수집 (중복 제거)"""
+    async def fetch_categorized_news_async(self, categories: Dict[str, Dict], news_per_category: int = 10,
+                                           exclude: Optional[Set[str]] = None, time_budget: Optional[float] = None,
+                                           cut_sources: Optional[Set[str]] = None) -> Dict[str, List[Article]]:
+        """카테고리별 뉴스 비동기 수집 (중복 제거)
+        
+        카테고리는 동시에 수집하고, 각 카테고리 안에서는 설정된 소스 순서대로 기사를 받아
+        중복 없는 기사가 news_per_category개 모이면 남은 요청을 취소하고 다음 소스는 건너뜁니다.
+        관련도 순위를 사용하면 모든 소스에서 동시에 후보를 모은 뒤 점수가 높은 기사를 고릅니다.
+        
+        검색 요청은 소스 문법에 맞게 키워드를 묶고(QueryPlan), 같은 요청은 카테고리 사이에서 한 번만 보냅니다.
+        
+        소스 하나가 source_timeout초를, 전체 수집이 time_budget초를 넘기면 진행 중인 요청을 취소하고
+        그때까지 모은 기사만 반환합니다.
+        
+        Args:
+            exclude: 제외할 기사의 URL 해시 (이미 전송한 기사 등)
+            time_budget: 전체 수집 제한 시간(초, None이면 제한 없음)
+            cut_sources: 시간 초과로 중단/생략한 소스 이름을 담을 집합
+        """
+        # 이미 사용한 기사 추적 (정규화 URL + 유사 제목)
+        dedup_index = DedupIndex(similarity=self.dedup_similarity)
+        deadline = asyncio.get_running_loop().time() + time_budget if time_budget else None
+        cut_sources = cut_sources if cut_sources is not None else set()
+        plan = QueryPlan(category_info.get('keywords', []) for category_info in categories.values())
+        source_runs: Dict[str, List[Dict]] = {}  # 소스별 카테고리 수집 결과 (수집 한 번에 한 번만 상태 기록)
+        
+        if self.ranking:
+            candidates = await asyncio.gather(*(
+                self._collect_candidates(category_info.get('keywords', []),
+                                         news_per_category * self.ranking_candidates,
+                                         exclude or set(), deadline, cut_sources, plan, source_runs)
+                for category_info in categories.values()
+            ))
+            # 카테고리 순서대로 고르며 앞 카테고리가 고른 기사만 뒤 카테고리에서 제외
+            collected = [
+                self._rank(articles, category_info, news_per_category, candidate_index, dedup_index)
+                for (articles, candidate_index), category_info in zip(candidates, categories.values())
+            ]
+        else:
+            collected = await asyncio.gather(*(
+                self._collect_category(category_info.get('keywords', []), news_per_category, dedup_index,
+                                       exclude or set(), deadline, cut_sources, plan, source_runs)
+                for category_info in categories.values()
+            ))
+        
+        await self._record_health(source_runs)
+        
         result = {}
-        used_urls = set()  # 이미 사용한 URL 추적
-        used_titles = set()  # 이미 사용한 제목 추적 (유사 제목 방지)
+        for category_name, unique_articles in zip(categories, collected):
+            result[category_name] = unique_articles
+            logger.info(f"{category_name} 뉴스 수집 완료: {len(unique_articles)}개")
         
-        for category_name, category_info in categories.items():
-            keywords = category_info.get('keywords', [])
-            unique_articles = []
-            all_sources_articles = []
-            
-            # 1. 네이버 RSS에서 뉴스 수집
-            naver_articles = self.fetch_naver_rss_news(keywords, limit=news_per_category)
-            all_sources_articles.extend(naver_articles)
-            
-            # 2. 다음 뉴스 RSS에서 수집
-            daum_articles = self.fetch_daum_rss_news(keywords, limit=news_per_category)
-            all_sources_articles.extend(daum_articles)
-            
-            # 3. 구글 뉴스 RSS에서 수집
-            google_articles = self.fetch_google_rss_news(keywords, limit=news_per_category)
-            all_sources_articles.extend(google_articles)
-            
-            # 4. NewsAPI에서 추가 수집 (보충용)
-            if len(all_sources_articles) < news_per_category * 2:
-                api_articles = self.fetch_news_by_keywords(keywords, language='ko', 
-                                                          page_size=news_per_category)
-                all_sources_articles.extend(api_articles)
+        if cut_sources:
+            logger.warning(f"시간 초과로 제외된 소스: {', '.join(sorted(cut_sources))}")
+        return result
+    
+    async def _collect_category(self, keywords: List[str], limit: int, dedup_index: DedupIndex,
+                                exclude: Set[str], deadline: Optional[float], cut_sources: Set[str],
+                                plan: QueryPlan, source_runs: Dict[str, List[Dict]]) -> List[Article]:
+        """소스 순서대로 기사를 받아 limit개가 모이거나 기한이 지나면 중단"""
+        loop = asyncio.get_running_loop()
+        unique_articles = []
+        
+        for source in self.sources:
+            # 계속 실패하거나 결과가 없는 소스는 차단 시간 동안 건너뜀
+            if self.source_health and not self.source_health.allow(source.key):
+                continue
             
-            # 중복 제거
-            for article in all_sources_articles:
-                url = article.get('url', '')
-                title = article.get('title', '')
-                
-                # URL 중복 체크
-                if url and url in used_urls:
+            # 소스별 제한 시간 (전체 기한이 먼저 오면 남은 시간까지)
+            timeout = self.source_timeout
+            if deadline is not None:
+                remaining = deadline - loop.time()
+                if remaining <= 0:
+                    cut_sources.add(source.label)
                     continue
-                
-                # 제목 중복 체크 (완전히 같은 제목)
-                if title and title in used_titles:
-                    continue
-                
-                # 유니크한 기사만 추가
-                unique_articles.append(article)
-                if url:
-                    used_urls.add(url)
-                if title:
-                    used_titles.add(title)
-                
-                # 필요한 개수만큼 모으면 중단
-                if len(unique_articles) >= news_per_category:
-                    break
+                timeout = min(timeout, remaining) if timeout else remaining
             
-            result[category_name] = unique_articles[:news_per_category]
-            logger.info(f"{category_name} 뉴스 수집 완료: {len(unique_articles)}개")
+            run = await self._run_source(source, keywords, limit, dedup_index, exclude, unique_articles, timeout,
+                                         plan, budget_limited=timeout != self.source_timeout)
+            if run['timed_out']:
+                cut_sources.add(source.label)
+            source_runs.setdefault(source.key, []).append(run)
             
-        return result
+            if len(unique_articles) >= limit:
+                break
+        
+        return unique_articles
     
-    def fetch_naver_rss_news(self, keywords: List[str], limit: int = 10) -> List[Dict]:
-        """네이버 뉴스 RSS에서 뉴스 수집"""
-        all_articles = []
-        
-        # 각 키워드로 RSS 검색
-        for keyword in keywords[:3]:  # 너무 많은 요청 방지 위해 최대 3개 키워드만 사용
-            try:
-                # 네이버 뉴스 검색 RSS URL
-                encoded_keyword = quote(keyword)
-                rss_url = f'https://news.naver.com/main/search/search.naver?where=rss&query={encoded_keyword}'
-                
-                # RSS 파싱
-                feed = feedparser.parse(rss_url)
-                
-                # 엔트리를 기사로 변환
-                for entry in feed.entries[:limit]:
-                    article = {
-                        'title': entry.get('title', '제목 없음'),
-                        'description': entry.get('description', ''),
-                        'url': entry.get('link', ''),
-                        'source': '네이버 뉴스',
-                        'publishedAt': entry.get('published', ''),
-                        'author': '',
-                        'urlToImage': ''
-                    }
-                    
-                    # 중복 제거 (같은 URL이 있으면 스킵)
-                    if not any(a.get('url') == article['url'] for a in all_articles):
-                        all_articles.append(article)
-                    
-                    if len(all_articles) >= limit:
-                        break
-                
-                logger.info(f"네이버 RSS 수집: {len(all_articles)}개 (키워드: {keyword})")
-                
-                if len(all_articles) >= limit:
-                    break
-                    
-            except Exception as e:
-                logger.error(f"네이버 RSS 수집 중 오류 (키워드: {keyword}): {e}")
-                continue
+    async def _collect_candidates(self, keywords: List[str], limit: int, exclude: Set[str], deadline: Optional[float],
+                                  cut_sources: Set[str], plan: QueryPlan,
+                                  source_runs: Dict[str, List[Dict]]) -> Tuple[List[Article], DedupIndex]:
+        """모든 소스에서 동시에 최대 limit개씩 후보 수집
+        
+        Returns:
+            (후보 목록, 카테고리 안에서 중복 제거와 출처 수 집계에 쓴 색인)
+        """
+        candidate_index = DedupIndex(similarity=self.dedup_similarity)
+        loop = asyncio.get_running_loop()
+        timeout = self.source_timeout
+        if deadline is not None:
+            remaining = deadline - loop.time()
+            if remaining <= 0:
+                cut_sources.update(source.label for source in self.sources)
+                return [], candidate_index
+            timeout = min(timeout, remaining) if timeout else remaining
+        budget_limited = timeout != self.source_timeout
         
-        return all_articles[:limit]
+        sources = [
+            source for source in self.sources
+            if not self.source_health or self.source_health.allow(source.key)
+        ]
+        per_source = [[] for _ in sources]
+        runs = await asyncio.gather(*(
+            self._run_source(source, keywords, limit, candidate_index, exclude, articles, timeout, plan,
+                             budget_limited)
+            for source, articles in zip(sources, per_source)
+        ))
+        
+        for source, run in zip(sources, runs):
+            if run['timed_out']:
+                cut_sources.add(source.label)
+            source_runs.setdefault(source.key, []).append(run)
+        
+        # 설정된 소스 순서대로 합침 (점수가 같으면 앞선 소스 우선)
+        return [article for articles in per_source for article in articles], candidate_index
     
-    def fetch_daum_rss_news(self, keywords: List[str], limit: int = 10) -> List[Dict]:
-        """다음 뉴스 RSS에서 뉴스 수집"""
-        all_articles = []
-        
-        # 각 키워드로 RSS 검색
-        for keyword in keywords[:3]:
-            try:
-                # 다음 뉴스 검색 RSS URL
-                encoded_keyword = quote(keyword)
-                rss_url = f'https://search.daum.net/search?w=news&q={encoded_keyword}&rtupcoll=NNS&DA=STC&enc=utf8&output=rss'
-                
-                # RSS 파싱
-                feed = feedparser.parse(rss_url)
-                
-                # 엔트리를 기사로 변환
-                for entry in feed.entries[:limit]:
-                    article = {
-                        'title': entry.get('title', '제목 없음'),
-                        'description': entry.get('description', ''),
-                        'url': entry.get('link', ''),
-                        'source': '다음 뉴스',
-                        'publishedAt': entry.get('published', ''),
-                        'author': '',
-                        'urlToImage': ''
-                    }
-                    
-                    # 중복 제거
-                    if not any(a.get('url') == article['url'] for a in all_articles):
-                        all_articles.append(article)
-                    
-                    if len(all_articles) >= limit:
-                        break
-                
-                logger.info(f"다음 RSS 수집: {len(all_articles)}개 (키워드: {keyword})")
-                
-                if len(all_articles) >= limit:
-                    break
-                    
-            except Exception as e:
-                logger.error(f"다음 RSS 수집 중 오류 (키워드: {keyword}): {e}")
-                continue
+    def _rank(self, articles: List[Article], category_info: Dict, limit: int, candidate_index: DedupIndex,
+              dedup_index: DedupIndex) -> List[Article]:
+        """다른 카테고리가 고르지 않은 후보를 관련도 순으로 정렬하여 상위 limit개 반환
+        
+        가중치는 카테고리 설정의 'ranking'을 사용하고, 고른 기사는 dedup_index에 등록합니다.
+        """
+        from news.ranking import select_ranked  # numpy는 순위를 쓸 때 처음 불러옴
         
-        return all_articles[:limit]
+        return select_ranked(articles, category_info, limit, candidate_index, dedup_index,
+                             half_life_hours=self.ranking_half_life)
     
-    def fetch_google_rss_news(self, keywords: List[str], limit: int = 10) -> List[Dict]:
-        """구글 뉴스 RSS에서 뉴스 수집"""
-        all_articles = []
-        
-        # 각 키워드로 RSS 검색
-        for keyword in keywords[:3]:
-            try:
-                # 구글 뉴스 RSS URL (한국어, 한국)
-                encoded_keyword = quote(keyword)
-                rss_url = f'https://news.google.com/rss/search?q={encoded_keyword}&hl=ko&gl=KR&ceid=KR:ko'
-                
-                # RSS 파싱
-                feed = feedparser.parse(rss_url)
-                
-                # 엔트리를 기사로 변환
-                for entry in feed.entries[:limit]:
-                    article = {
-                        'title': entry.get('title', '제목 없음'),
-                        'description': entry.get('summary', ''),
-                        'url': entry.get('link', ''),
-                        'source': entry.get('source', {}).get('title', '구글 뉴스'),
-                        'publishedAt': entry.get('published', ''),
-                        'author': '',
-                        'urlToImage': ''
-                    }
-                    
-                    # 중복 제거
-                    if not any(a.get('url') == article['url'] for a in all_articles):
-                        all_articles.append(article)
-                    
-                    if len(all_articles) >= limit:
-                        break
-                
-                logger.info(f"구글 RSS 수집: {len(all_articles)}개 (키워드: {keyword})")
-                
-                if len(all_articles) >= limit:
-                    break
-                    
-            except Exception as e:
-                logger.error(f"구글 RSS 수집 중 오류 (키워드: {keyword}): {e}")
-                continue
+    async def _run_source(self, source: FeedSource, keywords: List[str], limit: int, dedup_index: DedupIndex,
+                          exclude: Set[str], unique_articles: List[Article], timeout: Optional[float],
+                          plan: QueryPlan, budget_limited: bool = False) -> Dict:
+        """소스 하나를 제한 시간 안에서 수집하고 지표 기록
+        
+        budget_limited면 timeout이 전체 수집 기한(time_budget)의 남은 시간이라는 뜻이며,
+        이때 시간 초과는 소스 장애가 아니므로 budget_cut으로 표시하고 실패로 보지 않습니다.
+        
+        Returns:
+            단계별 기사 수(yielded/excluded/duplicate/added)와 ok, timed_out, budget_cut, latency
+        """
+        run = {'yielded': 0, 'excluded': 0, 'duplicate': 0, 'added': 0, 'ok': True, 'timed_out': False,
+               'budget_cut': False}
+        started = time.monotonic()
+        try:
+            await asyncio.wait_for(
+                self._consume_source(source, keywords, limit, dedup_index, exclude, unique_articles, run, plan),
+                timeout=timeout
+            )
+        except asyncio.TimeoutError:
+            run['timed_out'] = True
+            if budget_limited:
+                run['budget_cut'] = True
+            else:
+                run['ok'] = False
+                SOURCE_ERRORS.inc(source=source.key, reason='timeout')
+            logger.warning(f"{source.label} 수집 시간 초과 ({timeout:.1f}초), 받은 기사까지만 사용")
+        except Exception as e:
+            run['ok'] = False
+            SOURCE_ERRORS.inc(source=source.key, reason='error')
+            logger.error(f"{source.label} 수집 중 오류: {e}")
         
-        return all_articles[:limit]
+        run['latency'] = time.monotonic() - started
+        SOURCE_FETCH_SECONDS.observe(run['latency'], source=source.key)
+        ARTICLES.inc(run['yielded'], stage='raw')
+        ARTICLES.inc(run['excluded'], stage='excluded')
+        ARTICLES.inc(run['duplicate'], stage='duplicate')
+        ARTICLES.inc(run['added'], stage='unique')
+        return run
     
-    def format_article(self, article: Dict) -> Dict:
-        """기사 정보 포맷팅"""
-        return {
-            'title': article.get('title', '제목 없음'),
-            'description': article.get('description', ''),
-            'url': article.get('url', ''),
-            'source': article.get('source', {}).get('name', '출처 불명'),
-            'published_at': article.get('publishedAt', ''),
-            'author': article.get('author', ''),
-            'image': article.get('urlToImage', '')
-        }
+    async def fetch_source_async(self, source_key: str, categories: Dict[str, Dict],
+                                 news_per_category: int = 10) -> Optional[Dict[str, List[Article]]]:
+        """소스 하나에서 카테고리별 기사를 동시에 수집 (백그라운드 수집용)
+        
+        피드 캐시의 ETag/Last-Modified로 조건부 요청하므로 바뀌지 않은 피드는 다시 받지 않습니다.
+        소스가 차단된 상태면 None을 반환합니다.
+        """
+        source = next((source for source in self.sources if source.key == source_key), None)
+        if source is None:
+            raise ValueError(f"알 수 없는 소스: {source_key}")
+        if self.source_health and not self.source_health.allow(source.key):
+            return None
+        if not categories:
+            return {}
+        
+        results = {name: [] for name in categories}
+        plan = QueryPlan(info.get('keywords', []) for info in categories.values())
+        runs = await asyncio.gather(*(
+            self._run_source(source, info.get('keywords', []), news_per_category,
+                             DedupIndex(similarity=self.dedup_similarity), set(), results[name], self.source_timeout,
+                             plan)
+            for name, info in categories.items()
+        ))
+        
+        await self._record_health({source.key: runs})
+        return results
+    
+    async def _record_health(self, source_runs: Dict[str, List[Dict]]):
+        """수집 한 번에서 소스별로 카테고리 결과를 합쳐 상태에 한 번만 기록하고 저장
+        
+        카테고리마다 기록하면 한 번의 장애가 카테고리 수만큼 연속 실패로 집계되어 바로 차단되므로
+        하나라도 성공하면 성공, 기사 수는 합계, 시간은 가장 오래 걸린 카테고리 기준으로 기록합니다.
+        전체 수집 기한으로 잘린 결과(budget_cut)는 소스 상태와 무관하므로 제외합니다.
+        """
+        if not self.source_health:
+            return
+        
+        for source_key, runs in source_runs.items():
+            runs = [run for run in runs if not run['budget_cut']]
+            if runs:
+                self.source_health.record(source_key, any(run['ok'] for run in runs),
+                                          sum(run['yielded'] for run in runs), max(run['latency'] for run in runs))
+        await self.source_health.flush()
+    
+    async def _consume_source(self, source: FeedSource, keywords: List[str], limit: int, dedup_index: DedupIndex,
+                              exclude: Set[str], unique_articles: List[Article], run: Dict, plan: QueryPlan):
+        """소스의 기사를 unique_articles에 추가 (중간에 취소되어도 이미 추가한 기사는 유지)"""
+        stream = source.stream(self, keywords, limit=limit, plan=plan)
+        try:
+            async for article in stream:
+                run['yielded'] += 1
+                if exclude and article.url_hash in exclude:
+                    run['excluded'] += 1
+                    continue
+                if dedup_index.add_if_new(article.url, article.title, article.source):
+                    unique_articles.append(article)
+                    run['added'] += 1
+                else:
+                    run['duplicate'] += 1
+                if len(unique_articles) >= limit:
+                    break
+        finally:
+            # 남은 요청 취소
+            await stream.aclose()
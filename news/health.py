@@ -0,0 +1,168 @@
+import json
+import time
+import asyncio
+import logging
+import threading
+from collections import deque
+from typing import Dict, List, Optional, Set, Tuple
+
+from utils.storage import connect, transaction
+
+logger = logging.getLogger(__name__)
+
+# 차단기 상태
+CLOSED = 'closed'  # 정상 (요청함)
+OPEN = 'open'  # 차단 (다음 확인 시간까지 건너뜀)
+HALF_OPEN = 'half_open'  # 확인 중 (한 번만 시험 요청)
+
+class SourceHealth:
+    """뉴스 소스별 수집 결과 추적과 차단기 (SQLite에 저장되어 재시작 후에도 유지)
+    
+    소스를 한 번 수집할 때마다 (성공 여부, 받은 기사 수, 걸린 시간)을 최근 window개까지 기록합니다.
+    오류가 나거나 기사가 0개인 수집이 failure_threshold번 연속되면 소스를 차단하고,
+    차단 시간이 지나면 한 번 시험 수집하여 결과가 있으면 다시 사용합니다.
+    다시 실패하면 차단 시간을 두 배로 늘립니다. (최대 max_backoff초)
+    
+    상태는 메모리에서 바로 갱신하고, 디스크에는 수집이 끝날 때 flush()로 바뀐 소스만 스레드에서 저장합니다.
+    
+    Args:
+        path: 데이터베이스 파일 경로 (None이면 메모리에만 저장)
+        window: 소스별로 보관할 최근 수집 결과 수
+        failure_threshold: 차단할 연속 실패 횟수
+        base_backoff: 첫 차단 시간(초)
+        max_backoff: 최대 차단 시간(초)
+    """
+    
+    PROBE_TIMEOUT = 120  # 시험 수집이 이 시간(초) 안에 끝나지 않으면 다시 시험 허용
+    
+    def __init__(self, path: Optional[str] = None, window: int = 20, failure_threshold: int = 3,
+                 base_backoff: float = 600, max_backoff: float = 6 * 60 * 60):
+        self.window = window
+        self.failure_threshold = max(1, failure_threshold)
+        self.base_backoff = base_backoff
+        self.max_backoff = max_backoff
+        self._states: Dict[str, Dict] = {}
+        self._dirty: Set[str] = set()  # 저장하지 않은 상태 변경이 있는 소스
+        self._lock = threading.Lock()
+        
+        self.conn = connect(path) if path else None
+        if self.conn:
+            self.conn.execute('''
+                CREATE TABLE IF NOT EXISTS source_health (
+                    source_key TEXT PRIMARY KEY,
+                    state TEXT NOT NULL,
+                    failures INTEGER NOT NULL,
+                    trips INTEGER NOT NULL,
+                    open_until REAL NOT NULL,
+                    history TEXT NOT NULL
+                )
+            ''')
+            for row in self.conn.execute('SELECT * FROM source_health').fetchall():
+                self._states[row['source_key']] = {
+                    'state': row['state'],
+                    'failures': row['failures'],
+                    'trips': row['trips'],
+                    'open_until': row['open_until'],
+                    'probe_started': 0.0,
+                    'history': deque((tuple(item) for item in json.loads(row['history'])), maxlen=self.window)
+                }
+    
+    def _state(self, source_key: str) -> Dict:
+        state = self._states.get(source_key)
+        if state is None:
+            state = self._states[source_key] = {
+                'state': CLOSED,
+                'failures': 0,
+                'trips': 0,
+                'open_until': 0.0,
+                'probe_started': 0.0,
+                'history': deque(maxlen=self.window)
+            }
+        return state
+    
+    def allow(self, source_key: str) -> bool:
+        """소스를 이번에 수집해도 되는지 확인 (차단 시간이 지났으면 시험 수집 한 번 허용)"""
+        state = self._state(source_key)
+        if state['state'] == CLOSED:
+            return True
+        
+        now = time.time()
+        if now < state['open_until']:
+            return False
+        
+        # 동시에 여러 카테고리가 수집해도 시험 수집은 하나만
+        if state['state'] == HALF_OPEN and now - state['probe_started'] < self.PROBE_TIMEOUT:
+            return False
+        
+        state['state'] = HALF_OPEN
+        state['probe_started'] = now
+        logger.info(f"소스 시험 수집: {source_key}")
+        return True
+    
+    def record(self, source_key: str, ok: bool, yielded: int, latency: float):
+        """수집 결과 기록 후 차단기 상태 갱신 (디스크에는 flush()로 저장)"""
+        state = self._state(source_key)
+        state['history'].append((ok, yielded, round(latency, 3)))
+        
+        if ok and yielded > 0:
+            if state['state'] != CLOSED:
+                logger.info(f"소스 복구: {source_key}")
+            state.update(state=CLOSED, failures=0, trips=0, open_until=0.0)
+        else:
+            state['failures'] += 1
+            if state['state'] == HALF_OPEN or state['failures'] >= self.failure_threshold:
+                self._trip(source_key, state)
+        
+        if self.conn:
+            self._dirty.add(source_key)
+    
+    def _trip(self, source_key: str, state: Dict):
+        """소스 차단 (차단할 때마다 차단 시간 두 배)"""
+        backoff = min(self.max_backoff, self.base_backoff * 2 ** state['trips'])
+        state.update(state=OPEN, trips=state['trips'] + 1, open_until=time.time() + backoff)
+        logger.warning(f"소스 차단: {source_key} (연속 실패 {state['failures']}회, {backoff / 60:.0f}분 후 다시 확인)")
+    
+    async def flush(self):
+        """record()로 바뀐 소스 상태를 트랜잭션 하나로 저장 (SQLite 쓰기는 스레드에서 실행)"""
+        if not self._dirty:
+            return
+        
+        # 이벤트 루프에서 현재 상태를 복사한 뒤 저장 (저장 중에 바뀐 상태는 다음 flush에서 저장)
+        rows = []
+        for source_key in self._dirty:
+            state = self._states[source_key]
+            rows.append((source_key, OPEN if state['state'] == HALF_OPEN else state['state'], state['failures'],
+                         state['trips'], state['open_until'], json.dumps(list(state['history']))))
+        self._dirty.clear()
+        await asyncio.to_thread(self._save, rows)
+    
+    def _save(self, rows: List[Tuple]):
+        with self._lock, transaction(self.conn):
+            self.conn.executemany(
+                'INSERT OR REPLACE INTO source_health (source_key, state, failures, trips, open_until, history) '
+                'VALUES (?, ?, ?, ?, ?, ?)',
+                rows
+            )
+    
+    def summary(self, source_key: str) -> Dict:
+        """소스 상태 요약 (최근 수집 기준 평균 기사 수, 오류율, 평균 시간)"""
+        state = self._state(source_key)
+        history: List[Tuple] = list(state['history'])
+        runs = len(history)
+        
+        return {
+            'state': state['state'],
+            'runs': runs,
+            'avg_yield': sum(yielded for _, yielded, _ in history) / runs if runs else 0.0,
+            'error_rate': sum(1 for ok, _, _ in history if not ok) / runs if runs else 0.0,
+            'empty_rate': sum(1 for ok, yielded, _ in history if ok and not yielded) / runs if runs else 0.0,
+            'avg_latency': sum(latency for _, _, latency in history) / runs if runs else 0.0,
+            'failures': state['failures'],
+            'open_until': state['open_until'] if state['state'] != CLOSED else None
+        }
+    
+    def close(self):
+        """데이터베이스 연결 종료"""
+        if self.conn:
+            with self._lock:
+                self.conn.close()
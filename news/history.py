@@ -0,0 +1,78 @@
+import time
+import logging
+import threading
+from typing import Dict, Iterable, List, Set
+
+from utils.storage import connect, transaction
+from news.article import Article
+
+logger = logging.getLogger(__name__)
+
+class SentHistory:
+    """채널별로 전송한 기사 기록 (SQLite, 정규화 URL 해시 기준)
+    
+    보관 기간이 지난 기록은 새 기록을 저장할 때 자동으로 삭제합니다.
+    
+    조회/저장은 SQLite 쿼리를 하므로 이벤트 루프에서는 asyncio.to_thread로 호출합니다.
+    (연결 하나를 여러 스레드가 쓰므로 메서드마다 잠금)
+    """
+    
+    def __init__(self, path: str, retention_days: int = 7):
+        self.retention_seconds = retention_days * 24 * 60 * 60
+        self._lock = threading.Lock()
+        
+        self.conn = connect(path)
+        self.conn.execute('''
+            CREATE TABLE IF NOT EXISTS sent_articles (
+                channel_id INTEGER NOT NULL,
+                url_hash TEXT NOT NULL,
+                sent_at REAL NOT NULL,
+                PRIMARY KEY (channel_id, url_hash)
+            )
+        ''')
+        self.conn.execute('CREATE INDEX IF NOT EXISTS idx_sent_articles_sent_at ON sent_articles (sent_at)')
+    
+    def load_sent(self, channel_id: int) -> Set[str]:
+        """보관 기간 내에 채널로 전송한 기사의 URL 해시 목록 (쿼리 1회)"""
+        cutoff = time.time() - self.retention_seconds
+        with self._lock:
+            rows = self.conn.execute(
+                'SELECT url_hash FROM sent_articles WHERE channel_id = ? AND sent_at >= ?',
+                (channel_id, cutoff)
+            ).fetchall()
+        return {row['url_hash'] for row in rows}
+    
+    def record(self, channel_id: int, categorized_news: Dict[str, List[Article]]):
+        """전송한 기사 기록 (오래된 기록 삭제까지 트랜잭션 하나로 커밋)"""
+        now = time.time()
+        hashes = self._hashes(article for articles in categorized_news.values() for article in articles)
+        
+        with self._lock, transaction(self.conn):
+            self.conn.executemany(
+                'INSERT OR REPLACE INTO sent_articles (channel_id, url_hash, sent_at) VALUES (?, ?, ?)',
+                [(channel_id, value, now) for value in hashes]
+            )
+            self._prune()
+        
+        logger.info(f"전송 기록 저장: {len(hashes)}개 (채널: {channel_id})")
+    
+    def prune(self) -> int:
+        """보관 기간이 지난 기록 삭제"""
+        with self._lock:
+            return self._prune()
+    
+    def _prune(self) -> int:
+        """prune()과 같지만 잠금을 이미 잡은 상태에서 호출 (저장 트랜잭션 안에서 함께 삭제)"""
+        cutoff = time.time() - self.retention_seconds
+        deleted = self.conn.execute('DELETE FROM sent_articles WHERE sent_at < ?', (cutoff,)).rowcount
+        if deleted:
+            logger.info(f"오래된 전송 기록 삭제: {deleted}개")
+        return deleted
+    
+    def _hashes(self, articles: Iterable[Article]) -> Set[str]:
+        return {article.url_hash for article in articles if article.url}
+    
+    def close(self):
+        """데이터베이스 연결 종료"""
+        with self._lock:
+            self.conn.close()
@@ -0,0 +1,247 @@
+import asyncio
+import html
+import importlib
+import logging
+import multiprocessing
+import re
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from html.parser import HTMLParser
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
+
+logger = logging.getLogger(__name__)
+
+# 아래 함수들은 프로세스 풀에서 실행되므로 모듈 최상위에 두고,
+# 입력과 출력은 피클 가능한 기본 타입(bytes, str, dict)만 사용합니다.
+
+def preload_parsers() -> None:
+    """파서 모듈을 미리 불러옴 (워커 프로세스 예열용)"""
+    importlib.import_module('feedparser')
+
+def parse_feed(body: bytes, description_field: str = 'description') -> List[Dict]:
+    """RSS 본문을 파싱하여 엔트리 딕셔너리 목록으로 변환"""
+    import feedparser  # 시작 시간을 줄이기 위해 처음 파싱할 때 불러옴
+    
+    feed = feedparser.parse(body)
+    entries = []
+    
+    for entry in feed.entries:
+        entries.append({
+            'title': entry.get('title', '제목 없음'),
+            'description': entry.get(description_field, ''),
+            'link': entry.get('link', ''),
+            'published': entry.get('published', ''),
+            'source': entry.get('source', {}).get('title', '')
+        })
+    
+    return entries
+
+def parse_feed_batch(items: Sequence[Tuple[bytes, str]]) -> List[List[Dict]]:
+    """(본문, 설명 필드) 묶음을 한 번에 파싱"""
+    results = []
+    for body, description_field in items:
+        try:
+            results.append(parse_feed(body, description_field))
+        except Exception as e:
+            logger.error(f"피드 파싱 중 오류: {e}")
+            results.append([])
+    return results
+
+_WHITESPACE = re.compile(r'\s+')
+_LONG_TOKEN = re.compile(r'\S{50,}')  # URL 같은 긴 문자열 (50자 이상의 연속 문자)
+_SENTENCE_END = re.compile(r'[.?!。…](?=\s)|[다요죠음됨함]\.(?=\s|$)')
+_TAG = re.compile(r'<[^>]*(?:>|$)')  # 태그 (끝나지 않은 태그 포함)
+_SKIP_TAGS = frozenset(('script', 'style'))
+_BREAK_TAGS = frozenset(('br', 'p', 'div', 'li', 'ol', 'ul', 'tr', 'td', 'h1', 'h2', 'h3', 'h4'))
+
+class _TextExtractor(HTMLParser):
+    """태그를 버리고 텍스트만 모으는 파서 (엔티티는 html.parser가 변환)
+    
+    구글 뉴스 설명처럼 링크 목록인 경우를 구분하기 위해 <a> 안의 텍스트와
+    <font> 안의 언론사 이름을 따로 모읍니다.
+    """
+    
+    def __init__(self):
+        super().__init__(convert_charrefs=True)
+        self.parts: List[str] = []
+        self.links: List[List[str]] = []  # [링크 텍스트, 언론사 이름]
+        self.link_chars = 0
+        self._skip = 0
+        self._in_link = False
+        self._in_font = False
+    
+    def handle_starttag(self, tag, attrs):
+        if tag in _SKIP_TAGS:
+            self._skip += 1
+        elif tag == 'a':
+            self._in_link = True
+            self.links.append(['', ''])
+        elif tag == 'font':
+            self._in_font = True
+        elif tag in _BREAK_TAGS:
+            self.parts.append(' ')
+    
+    def handle_endtag(self, tag):
+        if tag in _SKIP_TAGS:
+            self._skip = max(0, self._skip - 1)
+        elif tag == 'a':
+            self._in_link = False
+        elif tag == 'font':
+            self._in_font = False
+        elif tag not in _BREAK_TAGS:
+            return  # <b>, <span> 등 글자 사이 태그는 띄어쓰기 없이 이어 붙임
+        self.parts.append(' ')
+    
+    def handle_data(self, data):
+        if self._skip:
+            return
+        self.parts.append(data)
+        if self._in_link:
+            self.links[-1][0] += data
+            self.link_chars += len(data.strip())
+        elif self._in_font and self.links:
+            self.links[-1][1] += data
+
+def _normalize(text: str) -> str:
+    """공백 정리 후 긴 문자열 제거"""
+    return _LONG_TOKEN.sub('', _WHITESPACE.sub(' ', text)).strip()
+
+def _link_list_text(links: List[List[str]], title: str) -> str:
+    """링크 목록(구글 뉴스 설명)을 '제목 (언론사) · ...' 형태로 변환
+    
+    기사 제목과 같은 첫 링크는 빼고 관련 기사만 남기며, 남는 것이 없으면 첫 링크 텍스트를 사용합니다.
+    """
+    title = _WHITESPACE.sub(' ', title).strip()
+    items = []
+    for text, press in links:
+        text = _WHITESPACE.sub(' ', text).strip()
+        press = _WHITESPACE.sub(' ', press).strip()
+        if not text or (title and title.startswith(text)):
+            continue
+        items.append(f"{text} ({press})" if press else text)
+    if not items:
+        return _WHITESPACE.sub(' ', links[0][0]).strip()
+    return ' · '.join(items)
+
+def clean_description(description: str, title: str = '') -> str:
+    """HTML 태그와 불필요한 긴 문자열을 제거한 설명 텍스트 반환
+    
+    태그가 없으면 정규식 정리만, 엔티티만 있으면 변환 후 정리하고, 태그가 있을 때만 HTML을 파싱합니다.
+    텍스트 대부분이 링크인 설명(구글 뉴스의 관련 기사 목록)은 링크 목록으로 정리합니다.
+    
+    Args:
+        title: 기사 제목 (링크 목록에서 제목과 같은 링크를 빼는 데 사용)
+    """
+    if not description:
+        return ''
+    
+    if '<' not in description:
+        if '&' in description:
+            description = html.unescape(description)
+        return _normalize(description)
+    
+    parser = _TextExtractor()
+    try:
+        parser.feed(description)
+        parser.close()
+    except Exception:
+        # 깨진 HTML은 태그 모양만 지우고 사용
+        return _normalize(html.unescape(_TAG.sub(' ', description)))
+    
+    # 끝나지 않은 태그는 텍스트로 남으므로 제거
+    text = _WHITESPACE.sub(' ', _TAG.sub(' ', ''.join(parser.parts))).strip()
+    if parser.links and parser.link_chars >= len(text.replace(' ', '')) * 0.6:
+        return _normalize(_link_list_text(parser.links, title))
+    return _normalize(text)
+
+def truncate_text(text: str, max_length: int, suffix: str = '...') -> str:
+    """max_length 글자 안에서 문장 또는 단어 경계로 자르기
+    
+    앞쪽 60% 이후에 문장이 끝나는 곳이 있으면 그 문장까지, 없으면 마지막 공백에서 자르고 suffix를 붙입니다.
+    (단어가 너무 길어 경계가 없으면 글자 수로 자름)
+    """
+    if len(text) <= max_length:
+        return text
+    
+    head = text[:max_length + 1]
+    floor = int(max_length * 0.6)
+    
+    sentence_end = 0
+    for match in _SENTENCE_END.finditer(head, floor):
+        if match.end() <= max_length:
+            sentence_end = match.end()
+    if sentence_end:
+        return head[:sentence_end]
+    
+    space = head.rfind(' ', floor)
+    cut = head[:space] if space > 0 else head[:max_length]
+    return cut.rstrip(' ,·:;-([{\'"') + suffix
+
+def clean_description_batch(items: Sequence) -> List[str]:
+    """설명 묶음을 한 번에 정리 (항목은 설명 문자열 또는 (설명, 제목))"""
+    return [
+        clean_description(*item) if isinstance(item, tuple) else clean_description(item)
+        for item in items
+    ]
+
+class ParsePool:
+    """CPU 작업(피드 파싱, HTML 정리)을 묶음 단위로 프로세스 풀에 보내는 클래스
+    
+    프로세스 풀을 사용하지 않도록 설정했거나 풀이 깨진 경우에는
+    현재 프로세스의 스레드에서 같은 작업을 실행합니다.
+    """
+    
+    def __init__(self, max_workers: int = 2, use_processes: bool = True, batch_size: int = 16):
+        self.max_workers = max_workers
+        self.use_processes = use_processes and max_workers > 0
+        self.batch_size = max(1, batch_size)
+        self._executor: Optional[ProcessPoolExecutor] = None
+    
+    def _get_executor(self) -> Optional[ProcessPoolExecutor]:
+        """프로세스 풀 반환 (최초 호출 시 생성)"""
+        if not self.use_processes:
+            return None
+        
+        if self._executor is None:
+            # 이벤트 루프/스레드가 있는 프로세스를 fork하지 않도록 forkserver 사용
+            methods = multiprocessing.get_all_start_methods()
+            context = multiprocessing.get_context('forkserver' if 'forkserver' in methods else 'spawn')
+            self._executor = ProcessPoolExecutor(max_workers=self.max_workers, mp_context=context)
+            logger.info(f"파싱 프로세스 풀 시작 (워커: {self.max_workers}개)")
+        return self._executor
+    
+    async def map(self, batch_func: Callable[[Sequence], List], items: Sequence) -> List:
+        """items를 batch_size 단위로 나눠 batch_func를 실행하고 결과를 순서대로 합쳐 반환"""
+        if not items:
+            return []
+        
+        loop = asyncio.get_running_loop()
+        batches = [list(items[i:i + self.batch_size]) for i in range(0, len(items), self.batch_size)]
+        
+        try:
+            executor = self._get_executor()
+            results = await asyncio.gather(*(
+                loop.run_in_executor(executor, batch_func, batch) for batch in batches
+            ))
+        except BrokenProcessPool as e:
+            logger.error(f"프로세스 풀 오류, 현재 프로세스에서 처리합니다: {e}")
+            self.shutdown()
+            self.use_processes = False
+            results = await asyncio.gather(*(
+                loop.run_in_executor(None, batch_func, batch) for batch in batches
+            ))
+        
+        return [item for batch_result in results for item in batch_result]
+    
+    async def warm_up(self):
+        """워커 프로세스를 미리 띄우고 파서 모듈을 불러옴 (첫 리포트가 프로세스 시작을 기다리지 않도록)"""
+        loop = asyncio.get_running_loop()
+        executor = self._get_executor()
+        workers = self.max_workers if executor else 1
+        await asyncio.gather(*(loop.run_in_executor(executor, preload_parsers) for _ in range(workers)))
+    
+    def shutdown(self):
+        """프로세스 풀 종료"""
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
@@ -0,0 +1,190 @@
+from typing import Dict, List, Optional
+
+from news.article import Article
+
+# Discord 메시지/임베드 제한
+MESSAGE_LIMIT = 2000  # 일반 메시지 길이
+EMBEDS_PER_MESSAGE = 10  # 메시지당 임베드 수
+EMBED_TOTAL_LIMIT = 6000  # 메시지 하나의 임베드 전체 글자 수
+EMBED_TITLE_LIMIT = 256
+EMBED_FIELDS_LIMIT = 25
+FIELD_NAME_LIMIT = 256
+FIELD_VALUE_LIMIT = 1024
+FOOTER_LIMIT = 2048
+
+REPORT_TITLE = "📰 **오늘의 뉴스 브리핑** 📰"
+REPORT_FOOTER = "📅 매일 아침 최신 뉴스를 전달해드립니다!"
+BREAKING_TITLE = "🚨 **주요 뉴스 속보** 🚨"
+BREAKING_FOOTER = "🔔 구독한 카테고리의 주요 키워드 기사를 바로 전달해드립니다."
+EMBED_COLOR = 0x2B6CB0
+
+def clip(text: str, limit: int) -> str:
+    """limit 글자를 넘으면 잘라서 말줄임표 추가"""
+    return text if len(text) <= limit else text[:limit - 1] + '…'
+
+def split_lines(text: str, limit: int) -> List[str]:
+    """긴 텍스트를 줄 단위로 limit 이하 조각으로 분할 (한 줄이 limit보다 길면 글자 단위로 자름)"""
+    parts = []
+    current = []
+    size = 0
+    
+    for line in text.split('\n'):
+        pieces = [line[i:i + limit - 1] for i in range(0, len(line), limit - 1)] or ['']
+        for piece in pieces:
+            if current and size + len(piece) + 1 > limit:
+                parts.append('\n'.join(current))
+                current, size = [], 0
+            current.append(piece)
+            size += len(piece) + 1
+    
+    if current:
+        parts.append('\n'.join(current))
+    return parts
+
+def pack_blocks(blocks: List[str], limit: int = MESSAGE_LIMIT) -> List[str]:
+    """순서를 지키며 텍스트 블록을 limit 이하 메시지로 최소 개수가 되게 묶음
+    
+    순서를 바꿀 수 없는 묶음에서는 가능한 한 많이 채운 뒤 넘기는 방식이 메시지 수가 가장 적습니다.
+    limit보다 긴 블록은 줄 단위로 나눈 뒤 묶습니다.
+    """
+    messages = []
+    current = []
+    size = 0
+    
+    for block in blocks:
+        for piece in (split_lines(block, limit) if len(block) > limit else [block]):
+            if current and size + len(piece) > limit:
+                messages.append(''.join(current))
+                current, size = [], 0
+            current.append(piece)
+            size += len(piece)
+    
+    if current:
+        messages.append(''.join(current))
+    return messages
+
+def category_text_blocks(category_name: str, articles: List[Article], emoji: str,
+                         summaries: List[str]) -> List[str]:
+    """카테고리 하나를 텍스트 블록(머리말, 기사별 블록, 구분선) 목록으로 변환"""
+    if not articles:
+        return [f"{emoji} **{category_name} 뉴스**\n오늘은 {category_name} 관련 뉴스가 없습니다.\n\n"]
+    
+    blocks = [f"{emoji} **{category_name} 뉴스 TOP {len(articles)}**\n{'─' * 40}\n\n"]
+    for idx, (article, description) in enumerate(zip(articles, summaries), 1):
+        lines = [
+            f"**{idx}. {article.title or '제목 없음'}**",
+            f"📌 {description}",
+            f"🔗 출처: {article.source}"
+        ]
+        if article.url:
+            lines.append(f"링크: <{article.url}>")
+        blocks.append('\n'.join(lines) + '\n\n')
+    blocks.append(f"{'─' * 40}\n\n")
+    return blocks
+
+class ReportRenderer:
+    """뉴스 리포트를 Discord 메시지(payload) 목록으로 변환하는 클래스
+    
+    payload는 {'content': str} 또는 {'content': str|None, 'embeds': [임베드 딕셔너리]} 형태입니다.
+    임베드 모드는 카테고리별 임베드를 메시지당 여러 개씩 제한 안에서 최대한 채워 보내고,
+    텍스트 모드는 카테고리/기사 블록을 2000자 메시지에 최대한 채워 보냅니다.
+    
+    Args:
+        use_embeds: False면 텍스트 모드 (임베드 링크 권한이 없는 채널 등)
+    """
+    
+    def __init__(self, use_embeds: bool = True, title: str = REPORT_TITLE, footer: str = REPORT_FOOTER):
+        self.use_embeds = use_embeds
+        self.title = title
+        self.footer = footer
+    
+    def render(self, categorized_news: Dict[str, List[Article]], category_emojis: Dict[str, str],
+               summaries: Dict[str, List[str]], use_embeds: Optional[bool] = None,
+               notes: Optional[List[str]] = None) -> List[Dict]:
+        """카테고리별 기사와 요약으로 payload 목록 생성
+        
+        Args:
+            notes: 리포트 끝(푸터 앞)에 덧붙일 안내 문구 (제외된 소스 등)
+        """
+        notes = notes or []
+        if self.use_embeds if use_embeds is None else use_embeds:
+            return self._render_embeds(categorized_news, category_emojis, summaries, notes)
+        return [
+            {'content': message}
+            for message in self._render_text(categorized_news, category_emojis, summaries, notes)
+        ]
+    
+    def _render_text(self, categorized_news: Dict[str, List[Article]], category_emojis: Dict[str, str],
+                     summaries: Dict[str, List[str]], notes: List[str]) -> List[str]:
+        blocks = [f"{self.title}\n{'=' * 40}\n\n"]
+        for category_name, articles in categorized_news.items():
+            blocks.extend(category_text_blocks(category_name, articles, category_emojis.get(category_name, '📰'),
+                                               summaries.get(category_name, [])))
+        blocks.append(''.join(f"{note}\n" for note in notes) + f"{'=' * 40}\n{self.footer}")
+        return pack_blocks(blocks)
+    
+    def _render_embeds(self, categorized_news: Dict[str, List[Article]], category_emojis: Dict[str, str],
+                       summaries: Dict[str, List[str]], notes: List[str]) -> List[Dict]:
+        footer = clip('\n'.join(notes + [self.footer]), FOOTER_LIMIT)
+        capacity = EMBED_TOTAL_LIMIT - len(footer)  # 마지막 임베드에 붙일 푸터 몫을 미리 빼둠
+        messages: List[List[Dict]] = [[]]
+        used = 0
+        
+        def open_embed(title: str, reserve: int) -> Dict:
+            """새 임베드 추가 (제목과 첫 내용(reserve)이 들어갈 자리가 없으면 다음 메시지로)"""
+            nonlocal used
+            title = clip(title, EMBED_TITLE_LIMIT)
+            if len(messages[-1]) >= EMBEDS_PER_MESSAGE or used + len(title) + reserve > capacity:
+                messages.append([])
+                used = 0
+            embed = {'title': title, 'color': EMBED_COLOR, 'fields': []}
+            messages[-1].append(embed)
+            used += len(title)
+            return embed
+        
+        for category_name, articles in categorized_news.items():
+            emoji = category_emojis.get(category_name, '📰')
+            
+            if not articles:
+                description = f"오늘은 {category_name} 관련 뉴스가 없습니다."
+                embed = open_embed(f"{emoji} {category_name} 뉴스", len(description))
+                embed['description'] = description
+                used += len(description)
+                continue
+            
+            title = f"{emoji} {category_name} 뉴스 TOP {len(articles)}"
+            fields = [
+                self._article_field(idx, article, description)
+                for idx, (article, description) in enumerate(zip(articles, summaries.get(category_name, [])), 1)
+            ]
+            
+            embed = None
+            for name, value in fields:
+                size = len(name) + len(value)
+                if embed is None:
+                    embed = open_embed(title, size)
+                elif len(embed['fields']) >= EMBED_FIELDS_LIMIT or used + size > capacity:
+                    # 필드 수나 메시지 전체 글자 수를 넘으면 이어지는 임베드로 넘김
+                    embed = open_embed(f"{title} (계속)", size)
+                embed['fields'].append({'name': name, 'value': value, 'inline': False})
+                used += size
+        
+        messages = [embeds for embeds in messages if embeds]
+        if not messages:
+            return [{'content': self.title}]
+        
+        messages[-1][-1]['footer'] = {'text': footer}
+        payloads = [{'embeds': embeds} for embeds in messages]
+        payloads[0]['content'] = self.title
+        return payloads
+    
+    def _article_field(self, idx: int, article: Article, description: str):
+        """기사 하나를 임베드 필드 (이름, 값)으로 변환"""
+        name = clip(f"{idx}. {article.title or '제목 없음'}", FIELD_NAME_LIMIT)
+        
+        source = article.source.replace('[', '(').replace(']', ')')
+        url = article.url
+        link = f"🔗 [{source}]({url.replace(')', '%29')})" if url else f"🔗 {source}"
+        
+        value = f"{clip(description, FIELD_VALUE_LIMIT - len(link) - 1)}\n{link}" if description else link
+        return name, clip(value, FIELD_VALUE_LIMIT)
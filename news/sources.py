@@ -0,0 +1,219 @@
+import asyncio
+import logging
+from collections import Counter
+from typing import AsyncIterator, Dict, Iterable, List, Optional, Tuple
+from urllib.parse import quote
+
+from news.article import Article, parse_published
+from utils.metrics import counter
+
+logger = logging.getLogger(__name__)
+
+FEED_QUERIES = counter('newsbot_feed_queries_total', '검색 피드 요청 수 (reused: 같은 수집에서 받은 결과 재사용)',
+                       ['source', 'result'])
+
+class SourceUnavailable(Exception):
+    """소스의 모든 요청이 실패한 경우"""
+
+class QueryPlan:
+    """수집 한 번(리포트 생성, 백그라운드 수집)에서 카테고리들이 함께 쓰는 검색 요청 계획
+    
+    여러 카테고리에 있는 키워드는 다른 키워드와 묶지 않고 따로 검색하여 결과를 공유하고,
+    같은 검색 URL은 수집 한 번에 한 번만 요청/파싱합니다. (파싱 중인 URL은 먼저 시작한 파싱을 함께 기다림)
+    
+    Args:
+        keyword_sets: 카테고리별 키워드 목록
+    """
+    
+    def __init__(self, keyword_sets: Iterable[List[str]] = ()):
+        counts = Counter(keyword for keywords in keyword_sets for keyword in set(keywords))
+        self.shared = frozenset(keyword for keyword, count in counts.items() if count > 1)
+        self._requests: Dict[str, asyncio.Task] = {}
+        self._waiters: Dict[str, int] = {}
+        self._parses: Dict[str, Tuple[asyncio.Task, int]] = {}  # URL별 (파싱 작업, 작업 결과 안의 위치)
+    
+    def fetch(self, fetcher, source: 'FeedSource', url: str) -> asyncio.Future:
+        """피드 요청 (같은 URL을 이미 요청했으면 그 응답을 함께 기다림)"""
+        request = self._requests.get(url)
+        if request is None:
+            request = self._requests[url] = asyncio.ensure_future(fetcher.fetch_feed(source.key, url))
+            FEED_QUERIES.inc(source=source.key, result='fetched')
+        else:
+            FEED_QUERIES.inc(source=source.key, result='reused')
+        self._waiters[url] = self._waiters.get(url, 0) + 1
+        return asyncio.shield(request)
+    
+    def release(self, url: str):
+        """요청 결과를 더 기다리지 않음 (기다리는 곳이 없고 아직 진행 중이면 요청 취소)"""
+        self._waiters[url] -= 1
+        if self._waiters[url] == 0 and not self._requests[url].done():
+            self._requests.pop(url).cancel()
+    
+    def parse(self, fetcher, source: 'FeedSource', results: List[Tuple[str, Tuple]]):
+        """받은 피드들을 한 번에 파싱 시작 (이미 파싱 중이거나 파싱한 URL은 제외)
+        
+        파싱 작업은 시작한 카테고리가 중단되어도 끝까지 실행되어, 같은 URL을 기다리는 다른 카테고리가 결과를 받습니다.
+        """
+        pending = [(url, result) for url, result in results if url not in self._parses]
+        if pending:
+            task = asyncio.ensure_future(fetcher.complete_feeds(source, pending))
+            for index, (url, _) in enumerate(pending):
+                self._parses[url] = (task, index)
+    
+    async def parsed(self, url: str) -> List[Dict]:
+        """파싱한 엔트리 (파싱 중이면 끝날 때까지 기다림)"""
+        task, index = self._parses[url]
+        return (await asyncio.shield(task))[index]
+
+class FeedSource:
+    """뉴스 소스 기본 클래스
+    
+    각 소스는 키워드 목록을 받아 정규화된 기사(Article)를 비동기 제너레이터로 내보냅니다.
+    호출자가 필요한 개수를 채우고 제너레이터를 닫으면 진행 중인 요청은 취소됩니다.
+    """
+    
+    def __init__(self, key: str, name: str, label: str):
+        self.key = key
+        self.name = name  # 기사에 표시할 출처 이름
+        self.label = label  # 로그에 표시할 이름
+    
+    def stream(self, fetcher, keywords: List[str], limit: int = 10,
+               plan: Optional[QueryPlan] = None) -> AsyncIterator[Article]:
+        """키워드로 기사를 수집하여 하나씩 반환 (최대 limit개, plan을 주면 같은 수집의 요청 결과 공유)"""
+        raise NotImplementedError
+    
+    def __repr__(self):
+        return f"{self.__class__.__name__}({self.key!r})"
+
+class RSSFeedSource(FeedSource):
+    """키워드 검색 RSS 소스 (네이버, 다음, 구글 등)
+    
+    query_operator를 지정하면 키워드를 최대 max_query_keywords개씩 OR 검색 하나로 묶어 요청 수를 줄입니다.
+    """
+    
+    def __init__(self, key: str, name: str, label: str, url: str, description_field: str = 'description',
+                 use_entry_source: bool = False, query_operator: Optional[str] = None,
+                 max_query_keywords: int = 1, max_parallel: int = 3):
+        super().__init__(key, name, label)
+        self.url = url
+        self.description_field = description_field
+        self.use_entry_source = use_entry_source  # 엔트리의 언론사 이름을 출처로 사용 (구글 뉴스)
+        self.query_operator = query_operator  # 검색어 OR 연산자 (예: ' OR '), None이면 키워드마다 요청
+        self.max_query_keywords = max(1, max_query_keywords) if query_operator else 1
+        self.max_parallel = max(1, max_parallel)  # 동시에 보낼 요청 수 (나머지는 기사가 모자랄 때만 요청)
+    
+    def plan_queries(self, keywords: List[str], shared: Iterable[str] = ()) -> List[List[str]]:
+        """키워드를 검색 요청 단위로 묶음 (shared의 키워드는 다른 카테고리와 결과를 공유하도록 따로 검색)"""
+        keywords = list(dict.fromkeys(keywords))
+        shared = set(shared)
+        merged = [keyword for keyword in keywords if keyword not in shared]
+        queries = [merged[i:i + self.max_query_keywords] for i in range(0, len(merged), self.max_query_keywords)]
+        return queries + [[keyword] for keyword in keywords if keyword in shared]
+    
+    def query_text(self, keywords: List[str]) -> str:
+        """검색어 문자열 (키워드가 여러 개면 OR 검색)"""
+        return (self.query_operator or ' ').join(keywords)
+    
+    def build_url(self, keywords: List[str]) -> str:
+        """키워드 검색 RSS URL 생성"""
+        return self.url.format(keyword=quote(self.query_text(keywords)))
+    
+    def to_article(self, entry: Dict) -> Article:
+        """파싱된 RSS 엔트리를 기사로 변환"""
+        return Article(
+            title=entry['title'],
+            description=entry['description'],
+            url=entry['link'],
+            source=entry['source'] if self.use_entry_source and entry['source'] else self.name,
+            published=parse_published(entry['published'])
+        )
+    
+    async def stream(self, fetcher, keywords: List[str], limit: int = 10,
+                     plan: Optional[QueryPlan] = None) -> AsyncIterator[Article]:
+        """검색 요청을 max_parallel개씩 먼저 보내고, 요청 순서대로 기사를 반환"""
+        plan = plan or QueryPlan()
+        queries = self.plan_queries(keywords, plan.shared)
+        urls = [self.build_url(query) for query in queries]
+        tasks = []
+        
+        seen_urls = set()
+        count = 0
+        failed = 0
+        next_index = 0
+        
+        try:
+            while next_index < len(urls):
+                # 앞선 요청으로 기사가 채워지면 뒤쪽 요청은 보내지 않음
+                while len(tasks) < min(len(urls), next_index + self.max_parallel):
+                    tasks.append(plan.fetch(fetcher, self, urls[len(tasks)]))
+                
+                # 다음 요청 결과를 기다린 뒤, 이미 도착한 뒤쪽 결과까지 묶어서 파싱
+                await asyncio.wait([tasks[next_index]])
+                ready = []
+                while next_index < len(tasks) and tasks[next_index].done():
+                    ready.append(next_index)
+                    next_index += 1
+                
+                # 다른 카테고리에서 이미 파싱했거나 파싱 중인 피드는 다시 파싱하지 않음
+                plan.parse(fetcher, self, [(urls[i], tasks[i].result()) for i in ready])
+                
+                # 응답도 캐시도 없는 요청 수 (모든 요청이 실패하면 소스 오류로 처리)
+                failed += sum(1 for i in ready if tasks[i].result() == (None, None))
+                
+                for i in ready:
+                    taken = 0
+                    for entry in (await plan.parsed(urls[i]))[:limit]:
+                        article = self.to_article(entry)
+                        
+                        # 중복 제거 (같은 URL이 있으면 스킵)
+                        if article.url in seen_urls:
+                            continue
+                        seen_urls.add(article.url)
+                        
+                        count += 1
+                        taken += 1
+                        yield article
+                        
+                        if count >= limit:
+                            break
+                    
+                    # 검색어 하나에서 가져온 기사 수 (앞선 검색어와 겹친 기사 제외)
+                    logger.info(f"{self.label} RSS 수집: {taken}개 (키워드: {', '.join(queries[i])})")
+                    if count >= limit:
+                        return
+            
+            if urls and failed == len(urls):
+                raise SourceUnavailable(f"{self.label} RSS 요청이 모두 실패했습니다.")
+        finally:
+            # 필요한 개수를 채웠거나 호출자가 중단한 경우 남은 요청 취소 (다른 카테고리가 기다리는 요청은 유지)
+            for url, task in zip(urls, tasks):
+                task.cancel()
+                plan.release(url)
+
+class NewsAPISource(FeedSource):
+    """NewsAPI 키워드 검색 소스"""
+    
+    def __init__(self, key: str, name: str, label: str, language: str = 'ko'):
+        super().__init__(key, name, label)
+        self.language = language
+    
+    async def stream(self, fetcher, keywords: List[str], limit: int = 10,
+                     plan: Optional[QueryPlan] = None) -> AsyncIterator[Article]:
+        """키워드를 OR 조건으로 묶어 한 번에 검색"""
+        articles = await fetcher.fetch_news_by_keywords_async(keywords, language=self.language, page_size=limit)
+        for item in articles[:limit]:
+            yield Article.from_newsapi(item)
+
+SOURCE_TYPES = {
+    'rss': RSSFeedSource,
+    'newsapi': NewsAPISource
+}
+
+def build_sources(source_configs: List[Dict]) -> List[FeedSource]:
+    """설정(Config.NEWS_SOURCES)으로부터 소스 인스턴스 목록 생성"""
+    sources = []
+    for source_config in source_configs:
+        options = dict(source_config)
+        source_type = options.pop('type', 'rss')
+        sources.append(SOURCE_TYPES[source_type](**options))
+    return sources
@@ -0,0 +1,91 @@
+import json
+import time
+import logging
+import threading
+from typing import Dict, List
+
+from utils.storage import connect, transaction
+from news.article import Article
+
+logger = logging.getLogger(__name__)
+
+class ArticleStore:
+    """백그라운드 수집으로 모은 기사 저장소 (SQLite, 카테고리별 정규화 URL 해시 기준)
+    
+    리포트를 만들 때는 네트워크 요청 대신 최근 수집된 기사를 조회합니다.
+    보관 기간이 지난 기사는 새 기사를 저장할 때 자동으로 삭제합니다.
+    
+    조회/저장은 SQLite 쿼리와 JSON 변환을 하므로 이벤트 루프에서는 asyncio.to_thread로 호출합니다.
+    (연결 하나를 여러 스레드가 쓰므로 메서드마다 잠금)
+    """
+    
+    def __init__(self, path: str, retention_hours: float = 48):
+        self.retention_seconds = retention_hours * 60 * 60
+        self._lock = threading.Lock()
+        
+        self.conn = connect(path)
+        self.conn.execute('''
+            CREATE TABLE IF NOT EXISTS articles (
+                category TEXT NOT NULL,
+                url_hash TEXT NOT NULL,
+                source_key TEXT NOT NULL,
+                fetched_at REAL NOT NULL,
+                data TEXT NOT NULL,
+                PRIMARY KEY (category, url_hash)
+            )
+        ''')
+        self.conn.execute('CREATE INDEX IF NOT EXISTS idx_articles_fetched_at ON articles (category, fetched_at)')
+    
+    def add_many(self, category: str, source_key: str, articles: List[Article]) -> List[Article]:
+        """기사 저장 후 처음 본 기사만 반환 (이미 저장된 기사는 무시, 오래된 기사 삭제까지 트랜잭션 하나로 커밋)"""
+        now = time.time()
+        rows = [(article, json.dumps(article.to_dict(), ensure_ascii=False)) for article in articles]
+        new_articles = []
+        with self._lock, transaction(self.conn):
+            for article, data in rows:
+                inserted = self.conn.execute(
+                    'INSERT OR IGNORE INTO articles (category, url_hash, source_key, fetched_at, data) '
+                    'VALUES (?, ?, ?, ?, ?)',
+                    (category, article.url_hash, source_key, now, data)
+                ).rowcount
+                if inserted:
+                    new_articles.append(article)
+            self._prune()
+        
+        if new_articles:
+            logger.info(f"새 기사 저장: {category} {len(new_articles)}개 ({source_key})")
+        return new_articles
+    
+    def recent(self, category: str, max_age: float, limit: int = 100) -> List[Article]:
+        """max_age초 안에 수집된 카테고리 기사 (최근 수집 순, 같은 수집 안에서는 소스가 준 순서)"""
+        with self._lock:
+            rows = self.conn.execute(
+                'SELECT data FROM articles WHERE category = ? AND fetched_at >= ? '
+                'ORDER BY fetched_at DESC, rowid LIMIT ?',
+                (category, time.time() - max_age, limit)
+            ).fetchall()
+        return [Article.from_dict(json.loads(row['data'])) for row in rows]
+    
+    def counts(self) -> Dict[str, int]:
+        """카테고리별 저장된 기사 수"""
+        with self._lock:
+            rows = self.conn.execute('SELECT category, COUNT(*) AS count FROM articles GROUP BY category').fetchall()
+        return {row['category']: row['count'] for row in rows}
+    
+    def prune(self) -> int:
+        """보관 기간이 지난 기사 삭제"""
+        with self._lock:
+            return self._prune()
+    
+    def _prune(self) -> int:
+        """prune()과 같지만 잠금을 이미 잡은 상태에서 호출 (저장 트랜잭션 안에서 함께 삭제)"""
+        cutoff = time.time() - self.retention_seconds
+        deleted = self.conn.execute('DELETE FROM articles WHERE fetched_at < ?', (cutoff,)).rowcount
+        if deleted:
+            logger.info(f"오래된 기사 삭제: {deleted}개")
+        return deleted
+    
+    def close(self):
+        """데이터베이스 연결 종료"""
+        with self._lock:
+            self.conn.close()
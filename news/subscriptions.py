@@ -0,0 +1,94 @@
+import json
+import time
+import logging
+import threading
+from typing import Dict, List, Optional
+
+from utils.storage import connect
+
+logger = logging.getLogger(__name__)
+
+class SubscriptionStore:
+    """서버(길드)별 뉴스 구독 정보 저장소 (SQLite)
+    
+    구독 하나는 채널 하나에 대응하며, 받을 카테고리와 전송 시간을 가집니다.
+    
+    조회/저장은 SQLite 쿼리를 하므로 이벤트 루프에서는 asyncio.to_thread로 호출합니다.
+    (연결 하나를 여러 스레드가 쓰므로 메서드마다 잠금)
+    """
+    
+    def __init__(self, path: str):
+        self._lock = threading.Lock()
+        self.conn = connect(path)
+        self.conn.execute('''
+            CREATE TABLE IF NOT EXISTS subscriptions (
+                channel_id INTEGER PRIMARY KEY,
+                guild_id INTEGER NOT NULL,
+                categories TEXT NOT NULL,
+                send_time TEXT NOT NULL,
+                created_at REAL NOT NULL
+            )
+        ''')
+        self.conn.execute('CREATE INDEX IF NOT EXISTS idx_subscriptions_send_time ON subscriptions (send_time)')
+    
+    def subscribe(self, guild_id: int, channel_id: int, categories: List[str], send_time: str):
+        """채널 구독 등록 (이미 있으면 변경)"""
+        with self._lock:
+            self.conn.execute(
+                'INSERT OR REPLACE INTO subscriptions (channel_id, guild_id, categories, send_time, created_at) '
+                'VALUES (?, ?, ?, ?, ?)',
+                (channel_id, guild_id, json.dumps(categories, ensure_ascii=False), send_time, time.time())
+            )
+        logger.info(f"구독 등록: 채널 {channel_id} ({send_time}, {', '.join(categories)})")
+    
+    def unsubscribe(self, channel_id: int) -> bool:
+        """채널 구독 해제 (구독이 없었으면 False)"""
+        with self._lock:
+            deleted = self.conn.execute('DELETE FROM subscriptions WHERE channel_id = ?', (channel_id,)).rowcount
+        if deleted:
+            logger.info(f"구독 해제: 채널 {channel_id}")
+        return bool(deleted)
+    
+    def get(self, channel_id: int) -> Optional[Dict]:
+        """채널 구독 정보 조회"""
+        with self._lock:
+            row = self.conn.execute('SELECT * FROM subscriptions WHERE channel_id = ?', (channel_id,)).fetchone()
+        return self._to_dict(row) if row else None
+    
+    def list_all(self, guild_id: Optional[int] = None) -> List[Dict]:
+        """구독 목록 (guild_id를 지정하면 해당 서버만)"""
+        with self._lock:
+            if guild_id is None:
+                rows = self.conn.execute('SELECT * FROM subscriptions ORDER BY send_time, channel_id').fetchall()
+            else:
+                rows = self.conn.execute(
+                    'SELECT * FROM subscriptions WHERE guild_id = ? ORDER BY send_time, channel_id', (guild_id,)
+                ).fetchall()
+        return [self._to_dict(row) for row in rows]
+    
+    def by_send_time(self, send_time: str) -> List[Dict]:
+        """특정 전송 시간의 구독 목록"""
+        with self._lock:
+            rows = self.conn.execute(
+                'SELECT * FROM subscriptions WHERE send_time = ? ORDER BY channel_id', (send_time,)
+            ).fetchall()
+        return [self._to_dict(row) for row in rows]
+    
+    def send_times(self) -> List[str]:
+        """구독에 사용 중인 전송 시간 목록"""
+        with self._lock:
+            rows = self.conn.execute('SELECT DISTINCT send_time FROM subscriptions ORDER BY send_time').fetchall()
+        return [row['send_time'] for row in rows]
+    
+    def _to_dict(self, row) -> Dict:
+        return {
+            'channel_id': row['channel_id'],
+            'guild_id': row['guild_id'],
+            'categories': json.loads(row['categories']),
+            'send_time': row['send_time']
+        }
+    
+    def close(self):
+        """데이터베이스 연결 종료"""
+        with self._lock:
+            self.conn.close()
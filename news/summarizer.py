@@ -1,16 +1,51 @@
-from typing import List, Dict
+from typing import List, Dict, Optional
+import asyncio
+import json
+import random
 import logging
-from bs4 import BeautifulSoup
-import re
+
+from news.article import Article
+from news.parsing import ParsePool, clean_description, clean_description_batch, truncate_text
+from news.cache import SummaryCache
+from news.renderer import ReportRenderer, category_text_blocks
+from utils.metrics import counter, histogram
 
 logger = logging.getLogger(__name__)
 
+SUMMARIZE_SECONDS = histogram('newsbot_summarize_seconds', '캐시에 없는 기사 묶음 요약 시간', ['mode'])
+SUMMARY_LOOKUPS = counter('newsbot_summary_cache_lookups_total', '요약 캐시 조회 수', ['result'])
+SUMMARY_FALLBACKS = counter('newsbot_summary_fallbacks_total', 'OpenAI 요약 실패/기한 초과로 기본 요약을 사용한 기사 수')
+
+# 기본 요약 방식이 바뀌면 올려서 이전 방식으로 캐시된 요약을 사용하지 않게 함
+BASIC_SUMMARY_VERSION = 2
+
+SYSTEM_PROMPT = "당신은 뉴스를 간결하게 요약하는 전문가입니다. 핵심 내용만 2-3문장으로 요약해주세요."
+BATCH_PROMPT = (
+    "다음 {count}개의 뉴스를 각각 2-3문장으로 요약해주세요.\n"
+    "다른 설명 없이 [{{\"id\": 번호, \"summary\": \"요약\"}}, ...] 형식의 JSON 배열로만 답해주세요.\n\n"
+    "{articles}"
+)
+
 class NewsSummarizer:
     """뉴스 요약 클래스"""
     
-    def __init__(self, openai_api_key: str = None):
+    def __init__(self, openai_api_key: str = None, parse_pool: Optional[ParsePool] = None,
+                 model: str = 'gpt-3.5-turbo', max_concurrency: int = 4, batch_size: int = 1,
+                 article_timeout: float = 15, max_retries: int = 3,
+                 summary_cache: Optional[SummaryCache] = None):
         self.openai_api_key = openai_api_key
         self.use_openai = bool(openai_api_key)
+        self.parse_pool = parse_pool or ParsePool(max_workers=0)
+        
+        # OpenAI 비동기 요약 설정
+        self.model = model
+        self.max_concurrency = max(1, max_concurrency)  # 동시 요청 수
+        self.batch_size = max(1, batch_size)  # 한 번의 요청에 묶을 기사 수 (1이면 기사별 요청)
+        self.article_timeout = article_timeout  # 기사당 기한(초), 넘기면 기본 요약 사용
+        self.max_retries = max_retries  # 요청 한도 초과 시 재시도 횟수
+        
+        # 요약 캐시 (지정하지 않으면 메모리에만 저장)
+        self.summary_cache = summary_cache or SummaryCache()
         
         if self.use_openai:
             try:
@@ -22,47 +57,54 @@ class NewsSummarizer:
                 logger.warning("OpenAI 라이브러리가 설치되지 않았습니다. 기본 요약을 사용합니다.")
                 self.use_openai = False
     
-    def summarize_article(self, article: Dict, max_length: int = 200) -> str:
+    def summarize_article(self, article: Article, max_length: int = 200) -> str:
         """단일 기사 요약"""
-        if self.use_openai:
-            return self._summarize_with_openai(article)
+        key = self._cache_key(article, max_length)
+        summary = self.summary_cache.get(key)
+        if summary is not None:
+            return summary
+        
+        if not self.use_openai:
+            summary = self._summarize_basic(article, max_length)
         else:
-            return self._summarize_basic(article, max_length)
+            summary = self._summarize_with_openai(article)
+            if summary is None:
+                # 실패한 기사는 기본 요약으로 대체하되 캐시하지 않음 (비동기 요약과 동일)
+                SUMMARY_FALLBACKS.inc()
+                return self._summarize_basic(article, max_length)
+        
+        self.summary_cache.put(key, summary)
+        return summary
+    
+    def _cache_key(self, article: Article, max_length: int) -> str:
+        """요약 방식/모델 + 기사 내용으로 캐시 키 생성"""
+        mode = f'openai:{self.model}' if self.use_openai else f'basic:{BASIC_SUMMARY_VERSION}'
+        return SummaryCache.make_key(mode, article.title, article.description, max_length)
     
-    def _summarize_basic(self, article: Dict, max_length: int = 200) -> str:
+    def _summarize_basic(self, article: Article, max_length: int = 200) -> str:
         """기본 요약 (OpenAI 미사용)"""
-        description = article.get('description', '')
-        
         # HTML 태그 제거
+        description = clean_description(article.description, article.title)
+        return self._truncate(description, max_length)
+    
+    def _truncate(self, description: str, max_length: int = 200) -> str:
+        """정리된 설명을 최대 길이에 맞춰 문장/단어 경계에서 자르기"""
         if description:
-            # BeautifulSoup로 HTML 파싱 및 텍스트 추출
-            soup = BeautifulSoup(description, 'html.parser')
-            description = soup.get_text(separator=' ', strip=True)
-            
-            # 여러 공백을 하나로
-            description = re.sub(r'\s+', ' ', description)
-            
-            # URL 같은 긴 문자열 제거 (50자 이상의 연속 문자)
-            description = re.sub(r'\S{50,}', '', description).strip()
-        
-        if description and len(description) > max_length:
-            return description[:max_length] + '...'
-        elif description:
-            return description
+            return truncate_text(description, max_length)
         else:
             return '요약 정보 없음'
     
-    def _summarize_with_openai(self, article: Dict) -> str:
-        """OpenAI를 사용한 요약"""
+    def _summarize_with_openai(self, article: Article) -> Optional[str]:
+        """OpenAI를 사용한 요약 (실패하면 None)"""
         try:
-            title = article.get('title', '')
-            description = article.get('description', '')
+            title = article.title
+            description = article.description
             content = f"{title}\n\n{description}"
             
             response = self.openai.ChatCompletion.create(
-                model="gpt-3.5-turbo",
+                model=self.model,
                 messages=[
-                    {"role": "system", "content": "당신은 뉴스를 간결하게 요약하는 전문가입니다. 핵심 내용만 2-3문장으로 요약해주세요."},
+                    {"role": "system", "content": SYSTEM_PROMPT},
                     {"role": "user", "content": f"다음 뉴스를 요약해주세요:\n\n{content}"}
                 ],
                 max_tokens=150,
@@ -71,86 +113,175 @@ class NewsSummarizer:
             
             summary = response.choices[0].message.content.strip()
             return summary
-            
+        
         except Exception as e:
             logger.error(f"OpenAI 요약 중 오류: {e}")
-            return self._summarize_basic(article)
+            return None
     
-    def create_news_summary(self, category_name: str, articles: List[Dict], emoji: str = '📰') -> str:
-        """카테고리별 뉴스 요약 생성"""
+    async def summarize_articles_async(self, articles: List[Article], max_length: int = 150,
+                                       time_budget: Optional[float] = None) -> List[str]:
+        """여러 기사를 동시에 요약 (입력 순서대로 반환)
+        
+        캐시에 있는 기사는 그대로 사용하고, 나머지만 요약합니다.
+        OpenAI 사용 시 batch_size개씩 묶어 최대 max_concurrency개 요청을 동시에 보내고,
+        기한(기사별 article_timeout, 전체 time_budget초)을 넘기거나 실패한 기사는
+        기본 요약으로 대체합니다. (대체된 요약은 캐시하지 않음)
+        """
         if not articles:
-            return f"{emoji} **{category_name} 뉴스**\n오늘은 {category_name} 관련 뉴스가 없습니다.\n"
+            return []
         
-        summary = f"{emoji} **{category_name} 뉴스 TOP {len(articles)}**\n"
-        summary += f"{'─' * 40}\n\n"
+        keys = [self._cache_key(article, max_length) for article in articles]
+        cached = await asyncio.to_thread(self.summary_cache.get_many, keys)
+        pending = [(key, article) for key, article in zip(keys, articles) if key not in cached]
+        SUMMARY_LOOKUPS.inc(len(articles) - len(pending), result='hit')
+        SUMMARY_LOOKUPS.inc(len(pending), result='miss')
         
-        for idx, article in enumerate(articles, 1):
-            title = article.get('title', '제목 없음')
-            url = article.get('url', '')
-            source = article.get('source', '출처 불명')
-            description = self.summarize_article(article, max_length=150)
+        if pending:
+            pending_articles = [article for _, article in pending]
+            with SUMMARIZE_SECONDS.time(mode='openai' if self.use_openai else 'basic'):
+                if self.use_openai:
+                    deadline = asyncio.get_running_loop().time() + time_budget if time_budget else None
+                    summaries = await self._summarize_with_openai_async(pending_articles, deadline)
+                else:
+                    cleaned = await self.parse_pool.map(
+                        clean_description_batch,
+                        [(article.description, article.title) for article in pending_articles]
+                    )
+                    summaries = [self._truncate(description, max_length) for description in cleaned]
             
-            summary += f"**{idx}. {title}**\n"
-            summary += f"📌 {description}\n"
-            summary += f"🔗 출처: {source}\n"
-            
-            if url:
-                summary += f"링크: <{url}>\n"
-            
-            summary += "\n"
+            SUMMARY_FALLBACKS.inc(sum(1 for summary in summaries if summary is None))
+            await asyncio.to_thread(self.summary_cache.put_many, {
+                key: summary for (key, _), summary in zip(pending, summaries) if summary is not None
+            })
+            for (key, article), summary in zip(pending, summaries):
+                cached[key] = summary if summary is not None else self._summarize_basic(article, max_length)
+        
+        stats = self.summary_cache.stats()
+        logger.info(f"기사 요약 완료: {len(articles)}개 (새로 요약: {len(pending)}개, "
+                    f"캐시 적중률: {stats['hit_rate']:.0%})")
+        return [cached[key] for key in keys]
+    
+    async def _summarize_with_openai_async(self, articles: List[Article],
+                                           deadline: Optional[float] = None) -> List[Optional[str]]:
+        """OpenAI로 여러 기사를 동시에 요약 (실패하거나 deadline(이벤트 루프 시각)을 넘긴 기사는 None)"""
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+        batches = [articles[i:i + self.batch_size] for i in range(0, len(articles), self.batch_size)]
+        results = await asyncio.gather(*(
+            self._summarize_batch_with_openai(batch, semaphore, deadline) for batch in batches
+        ))
+        return [summary for batch_summaries in results for summary in batch_summaries]
+    
+    async def _summarize_batch_with_openai(self, articles: List[Article], semaphore: asyncio.Semaphore,
+                                           deadline: Optional[float] = None) -> List[Optional[str]]:
+        """기사 묶음을 OpenAI로 요약 (기한 초과/실패한 기사는 None)"""
+        try:
+            async with semaphore:
+                # 기사별 기한과 전체 기한 중 먼저 오는 쪽까지만 기다림
+                # (묶인 기사들은 같은 응답을 기다리므로 묶음 크기와 관계없이 article_timeout초)
+                timeout = self.article_timeout
+                if deadline is not None:
+                    timeout = min(timeout, deadline - asyncio.get_running_loop().time())
+                    if timeout <= 0:
+                        raise asyncio.TimeoutError()
+                
+                if len(articles) == 1:
+                    content = f"{articles[0].title}\n\n{articles[0].description}"
+                    summary = await asyncio.wait_for(
+                        self._openai_chat_async(f"다음 뉴스를 요약해주세요:\n\n{content}", max_tokens=150),
+                        timeout=timeout
+                    )
+                    return [summary]
+                
+                listing = '\n\n'.join(
+                    f"[{idx}] {article.title}\n{article.description}"
+                    for idx, article in enumerate(articles, 1)
+                )
+                reply = await asyncio.wait_for(
+                    self._openai_chat_async(BATCH_PROMPT.format(count=len(articles), articles=listing),
+                                            max_tokens=150 * len(articles)),
+                    timeout=timeout
+                )
+                return self._parse_batch_reply(reply, len(articles))
         
-        summary += f"{'─' * 40}\n\n"
+        except asyncio.TimeoutError:
+            logger.warning(f"OpenAI 요약 기한 초과, 기본 요약 사용 ({len(articles)}개)")
+        except Exception as e:
+            logger.error(f"OpenAI 요약 중 오류: {e}")
         
-        return summary
+        return [None] * len(articles)
+    
+    def _parse_batch_reply(self, reply: str, count: int) -> List[Optional[str]]:
+        """묶음 요약 응답(JSON 배열)을 기사별 요약으로 변환 (빠진 기사는 None)"""
+        try:
+            start, end = reply.index('['), reply.rindex(']') + 1
+            items = json.loads(reply[start:end])
+            summaries = {int(item['id']): str(item['summary']).strip() for item in items}
+        except (ValueError, KeyError, TypeError) as e:
+            logger.error(f"OpenAI 묶음 요약 응답 파싱 오류: {e}")
+            summaries = {}
+        
+        return [summaries.get(idx) or None for idx in range(1, count + 1)]
     
-    def create_daily_news_report(self, categorized_news: Dict[str, List[Dict]], 
-                                 category_emojis: Dict[str, str]) -> List[str]:
-        """일일 뉴스 리포트 생성 (여러 메시지로 분할)"""
-        messages = []
-        
-        # 헤더
-        header = "📰 **오늘의 뉴스 브리핑** 📰\n"
-        header += f"{'=' * 40}\n\n"
-        messages.append(header)
-        
-        # 각 카테고리별로 메시지 생성
-        for category_name, articles in categorized_news.items():
-            emoji = category_emojis.get(category_name, '📰')
-            category_summary = self.create_news_summary(category_name, articles, emoji)
+    async def _openai_chat_async(self, prompt: str, max_tokens: int = 150) -> str:
+        """OpenAI 비동기 요청 (요청 한도 초과 시 지수 백오프로 재시도)"""
+        for attempt in range(self.max_retries + 1):
+            try:
+                response = await self.openai.ChatCompletion.acreate(
+                    model=self.model,
+                    messages=[
+                        {"role": "system", "content": SYSTEM_PROMPT},
+                        {"role": "user", "content": prompt}
+                    ],
+                    max_tokens=max_tokens,
+                    temperature=0.3
+                )
+                return response.choices[0].message.content.strip()
             
-            # Discord 메시지 길이 제한 (2000자) 고려
-            if len(category_summary) > 1900:
-                # 너무 길면 분할
-                parts = self._split_message(category_summary, 1900)
-                messages.extend(parts)
-            else:
-                messages.append(category_summary)
-        
-        # 푸터
-        footer = f"\n{'=' * 40}\n"
-        footer += "📅 매일 아침 최신 뉴스를 전달해드립니다!"
-        messages.append(footer)
-        
-        return messages
+            except self.openai.error.RateLimitError:
+                if attempt >= self.max_retries:
+                    raise
+                delay = 2 ** attempt + random.random()
+                logger.warning(f"OpenAI 요청 한도 초과, {delay:.1f}초 후 재시도 ({attempt + 1}/{self.max_retries})")
+                await asyncio.sleep(delay)
+    
+    def create_news_summary(self, category_name: str, articles: List[Article], emoji: str = '📰',
+                            summaries: Optional[List[str]] = None) -> str:
+        """카테고리별 뉴스 요약 생성 (summaries가 주어지면 기사별 요약으로 사용)"""
+        if summaries is None:
+            summaries = [self.summarize_article(article, max_length=150) for article in articles]
+        
+        return ''.join(category_text_blocks(category_name, articles, emoji, summaries))
+    
+    def create_daily_news_report(self, categorized_news: Dict[str, List[Article]], 
+                                 category_emojis: Dict[str, str],
+                                 summaries: Optional[Dict[str, List[str]]] = None) -> List[str]:
+        """일일 뉴스 리포트 생성 (텍스트 메시지를 2000자에 최대한 채워 분할)"""
+        if summaries is None:
+            summaries = {
+                category_name: [self.summarize_article(article, max_length=150) for article in articles]
+                for category_name, articles in categorized_news.items()
+            }
+        
+        payloads = ReportRenderer(use_embeds=False).render(categorized_news, category_emojis, summaries)
+        return [payload['content'] for payload in payloads]
+    
+    async def summarize_report_async(self, categorized_news: Dict[str, List[Article]],
+                                     time_budget: Optional[float] = None) -> Dict[str, List[str]]:
+        """리포트에 들어갈 모든 기사를 한 번에 요약하여 카테고리별로 반환
+        
+        기본 요약은 프로세스 풀에서 묶음 처리, OpenAI 요약은 동시 요청하므로 이벤트 루프를 막지 않습니다.
+        """
+        all_articles = [article for articles in categorized_news.values() for article in articles]
+        summaries = iter(await self.summarize_articles_async(all_articles, max_length=150,
+                                                             time_budget=time_budget))
+        
+        return {
+            category_name: [next(summaries) for _ in articles]
+            for category_name, articles in categorized_news.items()
+        }
     
-    def _split_message(self, message: str, max_length: int = 1900) -> List[str]:
-        """긴 메시지를 여러 개로 분할"""
-        if len(message) <= max_length:
-            return [message]
-        
-        parts = []
-        lines = message.split('\n')
-        current_part = ""
-        
-        for line in lines:
-            if len(current_part) + len(line) + 1 <= max_length:
-                current_part += line + '\n'
-            else:
-                if current_part:
-                    parts.append(current_part)
-                current_part = line + '\n'
-        
-        if current_part:
-            parts.append(current_part)
-        
-        return parts
+    async def create_daily_news_report_async(self, categorized_news: Dict[str, List[Article]],
+                                             category_emojis: Dict[str, str]) -> List[str]:
+        """일일 뉴스 리포트 비동기 생성 (텍스트)"""
+        summaries = await self.summarize_report_async(categorized_news)
+        return self.create_daily_news_report(categorized_news, category_emojis, summaries)
@@ -0,0 +1,71 @@
+import random
+
+from news.dedup import DedupIndex, hamming_distance, normalize_title, normalize_url, simhash
+
+TITLE = "삼성전자, 3분기 반도체 영업이익 10조원 돌파…시장 예상 웃돌아"
+
+def test_normalize_url_drops_tracking_and_host_variants():
+    assert normalize_url('https://www.news.com/a/1/?utm_source=x&id=3&fbclid=y#top') == 'news.com/a/1?id=3'
+    assert normalize_url('http://m.news.com/a/1') == normalize_url('https://news.com/a/1/')
+
+def test_normalize_title_strips_press_suffix_and_tags():
+    assert normalize_title(f"[단독] {TITLE} - 연합뉴스") == normalize_title(TITLE)
+    # 앞부분이 짧으면 꼬리표로 보지 않음
+    assert normalize_title("삼성 - 애플 분쟁") == '삼성애플분쟁'
+
+def test_same_url_is_duplicate():
+    index = DedupIndex()
+    assert index.add_if_new('https://news.com/a/1', TITLE)
+    assert not index.add_if_new('https://www.news.com/a/1/?utm_source=feed', '전혀 다른 제목')
+
+def test_same_story_from_other_press_is_duplicate():
+    index = DedupIndex()
+    index.add('https://a.com/1', f"{TITLE} - 연합뉴스")
+    assert index.is_duplicate('https://b.com/2', f"[종합] {TITLE} - 한겨레")
+    assert index.is_duplicate('https://b.com/3', TITLE.replace(',', '').replace('…', ' '))
+
+def test_near_duplicate_within_distance():
+    edited = TITLE.replace('웃돌아', '웃돌았다')
+    distance = hamming_distance(simhash(normalize_title(TITLE)), simhash(normalize_title(edited)))
+    
+    loose = DedupIndex(similarity=0.8)
+    loose.add('https://a.com/1', TITLE)
+    assert distance <= loose.max_distance
+    assert loose.is_duplicate('https://b.com/2', edited)
+    
+    exact = DedupIndex(similarity=1.0)
+    exact.add('https://a.com/1', TITLE)
+    assert not exact.is_duplicate('https://b.com/2', edited)
+
+def test_different_stories_are_not_duplicates():
+    index = DedupIndex()
+    index.add('https://a.com/1', TITLE)
+    assert not index.is_duplicate('https://b.com/2', "LG에너지솔루션, 북미 배터리 공장 증설 발표")
+    assert not index.is_duplicate('https://b.com/3', "삼성전자, 4분기 스마트폰 출하량 감소 전망")
+
+def test_bucket_lookup_matches_brute_force():
+    # 블록 버킷 조회가 모든 지문과 직접 비교한 결과와 같아야 함
+    rng = random.Random(7)
+    index = DedupIndex(similarity=0.85)
+    stored = []
+    for i in range(300):
+        fingerprint = rng.getrandbits(64)
+        if stored and i % 3 == 0:
+            # 기존 지문에서 몇 비트만 바꾼 가까운 지문
+            fingerprint = rng.choice(stored)
+            for bit in rng.sample(range(64), rng.randint(1, index.max_distance + 3)):
+                fingerprint ^= 1 << bit
+        
+        expected = any(hamming_distance(fingerprint, other) <= index.max_distance for other in stored)
+        assert (index._find_similar(fingerprint) is not None) == expected
+        if not expected:
+            index._insert(f'u{i}', f't{i}', fingerprint)
+            stored.append(fingerprint)
+
+def test_coverage_counts_distinct_sources():
+    index = DedupIndex()
+    index.add_if_new('https://a.com/1', f"{TITLE} - 연합뉴스", '연합뉴스')
+    index.add_if_new('https://b.com/2', f"{TITLE} - 한겨레", '한겨레')
+    index.add_if_new('https://a.com/1', TITLE, '연합뉴스')
+    assert index.coverage('https://c.com/3', TITLE) == 2
+    assert index.coverage('https://c.com/4', "다른 기사 제목입니다") == 0
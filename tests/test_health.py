@@ -0,0 +1,83 @@
+import asyncio
+
+import pytest
+
+from news import health
+from news.health import CLOSED, HALF_OPEN, OPEN, SourceHealth
+
+class Clock:
+    def __init__(self):
+        self.now = 1_000_000.0
+    
+    def __call__(self):
+        return self.now
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = Clock()
+    monkeypatch.setattr(health.time, 'time', clock)
+    return clock
+
+def test_opens_after_consecutive_failures(clock):
+    source_health = SourceHealth(failure_threshold=3, base_backoff=600)
+    source_health.record('naver', False, 0, 1.0)
+    source_health.record('naver', True, 0, 1.0)  # 기사 0개도 실패로 셈
+    assert source_health.allow('naver')
+    
+    source_health.record('naver', False, 0, 1.0)
+    assert source_health.summary('naver')['state'] == OPEN
+    assert not source_health.allow('naver')
+
+def test_success_resets_failure_count(clock):
+    source_health = SourceHealth(failure_threshold=3)
+    source_health.record('naver', False, 0, 1.0)
+    source_health.record('naver', False, 0, 1.0)
+    source_health.record('naver', True, 5, 1.0)
+    source_health.record('naver', False, 0, 1.0)
+    assert source_health.summary('naver')['state'] == CLOSED
+    assert source_health.summary('naver')['failures'] == 1
+
+def test_half_open_probe_closes_on_success(clock):
+    source_health = SourceHealth(failure_threshold=1, base_backoff=600)
+    source_health.record('google', False, 0, 1.0)
+    
+    clock.now += 599
+    assert not source_health.allow('google')
+    clock.now += 2
+    assert source_health.allow('google')
+    assert source_health.summary('google')['state'] == HALF_OPEN
+    assert not source_health.allow('google')  # 시험 수집은 하나만
+    
+    source_health.record('google', True, 3, 1.0)
+    assert source_health.summary('google')['state'] == CLOSED
+    assert source_health.allow('google')
+
+def test_half_open_probe_failure_doubles_backoff(clock):
+    source_health = SourceHealth(failure_threshold=1, base_backoff=600, max_backoff=1000)
+    source_health.record('daum', False, 0, 1.0)
+    clock.now += 601
+    assert source_health.allow('daum')
+    
+    source_health.record('daum', False, 0, 1.0)
+    assert source_health.summary('daum')['state'] == OPEN
+    assert source_health.summary('daum')['open_until'] == clock.now + 1000  # 1200초 대신 최대값
+    
+    # 끝나지 않은 시험 수집은 PROBE_TIMEOUT 뒤에 다시 허용
+    clock.now += 1001
+    assert source_health.allow('daum')
+    clock.now += SourceHealth.PROBE_TIMEOUT
+    assert source_health.allow('daum')
+
+def test_flush_persists_state(tmp_path, clock):
+    path = str(tmp_path / 'health.db')
+    source_health = SourceHealth(path, failure_threshold=1)
+    source_health.record('naver', False, 0, 1.5)
+    source_health.record('google', True, 4, 0.5)
+    asyncio.run(source_health.flush())
+    source_health.close()
+    
+    reloaded = SourceHealth(path, failure_threshold=1)
+    assert reloaded.summary('naver')['state'] == OPEN
+    assert not reloaded.allow('naver')
+    assert reloaded.summary('google')['avg_yield'] == 4
+    reloaded.close()
@@ -0,0 +1,49 @@
+from news.parsing import clean_description, clean_description_batch, truncate_text
+
+TEXT = "정부가 내년 예산안을 발표했다. 반도체 지원 예산이 크게 늘었다. 야당은 재정 건전성을 우려했다."
+
+GOOGLE_DESCRIPTION = (
+    '<ol><li><a href="https://news.google.com/1">삼성전자 실적 발표</a>&nbsp;&nbsp;'
+    '<font color="#6f6f6f">연합뉴스</font></li>'
+    '<li><a href="https://news.google.com/2">반도체 업황 회복세</a>&nbsp;&nbsp;'
+    '<font color="#6f6f6f">한겨레</font></li></ol>'
+)
+
+def test_truncate_keeps_short_text():
+    assert truncate_text(TEXT, 200) == TEXT
+
+def test_truncate_at_sentence_end():
+    result = truncate_text(TEXT, 40)
+    assert result == "정부가 내년 예산안을 발표했다. 반도체 지원 예산이 크게 늘었다."
+    assert len(result) <= 40
+
+def test_truncate_at_word_boundary_without_sentence_end():
+    text = "정부가 내년 예산안을 발표하면서 반도체와 인공지능 분야 지원을 대폭 늘리기로 했으며 야당은 반발했다"
+    result = truncate_text(text, 40)
+    assert result == "정부가 내년 예산안을 발표하면서 반도체와 인공지능 분야 지원을 대폭..."
+    assert text.startswith(result[:-3])
+
+def test_truncate_long_word_by_length():
+    assert truncate_text("가" * 100, 20) == "가" * 20 + "..."
+
+def test_clean_plain_text_and_entities():
+    assert clean_description("  AT&amp;T   실적 ") == "AT&T 실적"
+    assert clean_description("") == ""
+
+def test_clean_html_drops_tags_scripts_and_long_tokens():
+    description = ('<p>첫 문단 &amp; <b>강조</b>된 내용</p><script>var x = 1;</script>두번째 '
+                   'https://example.com/' + 'a' * 60)
+    assert clean_description(description) == "첫 문단 & 강조된 내용 두번째"
+
+def test_clean_google_link_list_skips_title_link():
+    # 기사 제목과 같은 첫 링크는 빼고 관련 기사만 '제목 (언론사)'로 남김
+    assert clean_description(GOOGLE_DESCRIPTION, "삼성전자 실적 발표 - 연합뉴스") == "반도체 업황 회복세 (한겨레)"
+    assert clean_description(GOOGLE_DESCRIPTION) == "삼성전자 실적 발표 (연합뉴스) · 반도체 업황 회복세 (한겨레)"
+
+def test_clean_google_link_list_with_only_title_link():
+    assert clean_description('<a href="https://news.google.com/1">제목만</a>', "제목만") == "제목만"
+
+def test_clean_batch_accepts_strings_and_pairs():
+    assert clean_description_batch(["<b>굵게</b>", (GOOGLE_DESCRIPTION, "삼성전자 실적 발표")]) == [
+        "굵게", "반도체 업황 회복세 (한겨레)"
+    ]
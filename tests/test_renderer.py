@@ -0,0 +1,88 @@
+from news.article import Article
+from news.renderer import (
+    EMBED_FIELDS_LIMIT, EMBED_TOTAL_LIMIT, EMBEDS_PER_MESSAGE, FIELD_VALUE_LIMIT, MESSAGE_LIMIT, REPORT_TITLE,
+    ReportRenderer, pack_blocks
+)
+
+def make_report(categories: int, articles: int, summary_length: int):
+    categorized = {
+        f"카테고리{c}": [
+            Article(title=f"기사 제목 {c}-{i}", description='', url=f"https://news.com/{c}/{i}", source='연합뉴스')
+            for i in range(articles)
+        ]
+        for c in range(categories)
+    }
+    summaries = {name: ['요약 ' * (summary_length // 3)] * len(items) for name, items in categorized.items()}
+    return categorized, summaries
+
+def embed_size(embed) -> int:
+    """Discord가 메시지 임베드 글자 수 제한에 세는 부분의 길이"""
+    size = len(embed.get('title', '')) + len(embed.get('description', ''))
+    size += sum(len(field['name']) + len(field['value']) for field in embed.get('fields', []))
+    return size + len(embed.get('footer', {}).get('text', ''))
+
+def check_embed_limits(payloads):
+    for payload in payloads:
+        assert 1 <= len(payload['embeds']) <= EMBEDS_PER_MESSAGE
+        assert sum(embed_size(embed) for embed in payload['embeds']) <= EMBED_TOTAL_LIMIT
+        for embed in payload['embeds']:
+            assert len(embed['fields']) <= EMBED_FIELDS_LIMIT
+            assert all(len(field['value']) <= FIELD_VALUE_LIMIT for field in embed['fields'])
+
+def test_embeds_split_at_ten_per_message():
+    categorized, summaries = make_report(categories=23, articles=1, summary_length=30)
+    payloads = ReportRenderer().render(categorized, {}, summaries)
+    
+    check_embed_limits(payloads)
+    assert [len(payload['embeds']) for payload in payloads] == [10, 10, 3]
+    assert payloads[0]['content'] == REPORT_TITLE
+    titles = [embed['title'] for payload in payloads for embed in payload['embeds']]
+    assert titles == [f"📰 카테고리{c} 뉴스 TOP 1" for c in range(23)]
+
+def test_embeds_split_at_6000_characters():
+    categorized, summaries = make_report(categories=3, articles=10, summary_length=900)
+    payloads = ReportRenderer().render(categorized, {}, summaries)
+    
+    check_embed_limits(payloads)
+    assert len(payloads) > 1
+    # 나눠진 카테고리는 이어지는 임베드로 계속되고 기사 순서가 유지됨
+    fields = [field['name'] for payload in payloads for embed in payload['embeds'] for field in embed['fields']]
+    assert fields == [f"{i + 1}. 기사 제목 {c}-{i}" for c in range(3) for i in range(10)]
+    assert any(embed['title'].endswith('(계속)') for payload in payloads for embed in payload['embeds'])
+
+def test_embed_footer_on_last_embed_only():
+    categorized, summaries = make_report(categories=12, articles=5, summary_length=200)
+    payloads = ReportRenderer().render(categorized, {}, summaries, notes=['제외된 소스: 구글'])
+    
+    check_embed_limits(payloads)
+    embeds = [embed for payload in payloads for embed in payload['embeds']]
+    assert [('footer' in embed) for embed in embeds] == [False] * (len(embeds) - 1) + [True]
+    assert embeds[-1]['footer']['text'].startswith('제외된 소스: 구글\n')
+
+def test_embeds_empty_category_and_empty_report():
+    renderer = ReportRenderer()
+    payloads = renderer.render({'IT': []}, {'IT': '💻'}, {})
+    assert payloads[0]['embeds'][0]['description'] == "오늘은 IT 관련 뉴스가 없습니다."
+    assert renderer.render({}, {}, {}) == [{'content': REPORT_TITLE}]
+
+def test_text_messages_fit_limit_and_keep_order():
+    categorized, summaries = make_report(categories=6, articles=10, summary_length=150)
+    messages = ReportRenderer(use_embeds=False).render(categorized, {}, summaries)
+    
+    contents = [payload['content'] for payload in messages]
+    assert all(len(content) <= MESSAGE_LIMIT for content in contents)
+    text = ''.join(contents)
+    positions = [text.index(f"기사 제목 {c}-{i}**") for c in range(6) for i in range(10)]
+    assert positions == sorted(positions)
+
+def test_pack_blocks_fills_messages_greedily():
+    assert pack_blocks(['a' * 800, 'b' * 800, 'c' * 800, 'd' * 300], limit=2000) == [
+        'a' * 800 + 'b' * 800, 'c' * 800 + 'd' * 300
+    ]
+
+def test_pack_blocks_splits_oversized_block_by_lines():
+    block = '\n'.join(f"{i:03d} " + 'x' * 95 for i in range(50))
+    messages = pack_blocks([block], limit=2000)
+    assert len(messages) > 1
+    assert all(len(message) <= 2000 for message in messages)
+    assert '\n'.join(messages) == block
@@ -0,0 +1,86 @@
+import time
+from datetime import datetime, timedelta, timezone
+from types import SimpleNamespace
+
+from utils.scheduler import CATCHUP_SUFFIX, NewsScheduler, stagger_offset
+
+JOB_ID = 'daily_news:123'
+
+async def callback():
+    pass
+
+def minutes_ago(minutes: int) -> str:
+    """UTC 기준 몇 분 전의 'HH:MM' (자정을 넘어가도 어제 같은 시각이 됨)"""
+    return (datetime.now(timezone.utc) - timedelta(minutes=minutes)).strftime('%H:%M')
+
+def job_ids(scheduler: NewsScheduler):
+    # 시작 전 스케줄러는 replace_existing으로 다시 등록한 작업도 대기 목록에 중복으로 보여줌
+    return sorted({job.id for job in scheduler.get_jobs()})
+
+def make_scheduler(tmp_path, misfire_grace: float = 900) -> NewsScheduler:
+    return NewsScheduler(state_path=str(tmp_path / 'scheduler.db'), misfire_grace=misfire_grace)
+
+def test_missed_run_within_grace_is_caught_up(tmp_path):
+    scheduler = make_scheduler(tmp_path)
+    scheduler._record_run(JOB_ID, time.time() - 86400)  # 마지막 실행은 어제
+    scheduler.schedule_daily_news(callback, minutes_ago(5), 'UTC', job_id=JOB_ID)
+    
+    assert job_ids(scheduler) == [JOB_ID, JOB_ID + CATCHUP_SUFFIX]
+    catch_up = scheduler.scheduler.get_job(JOB_ID + CATCHUP_SUFFIX)
+    assert catch_up.name.endswith('(놓친 실행)')
+
+def test_new_job_without_history_is_not_caught_up(tmp_path):
+    scheduler = make_scheduler(tmp_path)
+    scheduler.schedule_daily_news(callback, minutes_ago(5), 'UTC', job_id=JOB_ID)
+    assert job_ids(scheduler) == [JOB_ID]
+
+def test_run_already_done_is_not_caught_up(tmp_path):
+    scheduler = make_scheduler(tmp_path)
+    scheduler._record_run(JOB_ID, time.time())
+    scheduler.schedule_daily_news(callback, minutes_ago(5), 'UTC', job_id=JOB_ID)
+    assert job_ids(scheduler) == [JOB_ID]
+
+def test_missed_run_past_grace_is_skipped(tmp_path):
+    scheduler = make_scheduler(tmp_path, misfire_grace=60)
+    scheduler._record_run(JOB_ID, time.time() - 86400)
+    scheduler.schedule_daily_news(callback, minutes_ago(5), 'UTC', job_id=JOB_ID)
+    assert job_ids(scheduler) == [JOB_ID]
+
+def test_rescheduling_does_not_catch_up_twice(tmp_path):
+    scheduler = make_scheduler(tmp_path)
+    scheduler._record_run(JOB_ID, time.time() - 86400)
+    scheduler.schedule_daily_news(callback, minutes_ago(5), 'UTC', job_id=JOB_ID)
+    scheduler.remove_job(JOB_ID + CATCHUP_SUFFIX)
+    
+    # 구독 변경 등으로 같은 작업을 다시 등록해도 같은 예정 시각은 한 번만 다시 실행
+    scheduler.schedule_daily_news(callback, minutes_ago(5), 'UTC', job_id=JOB_ID)
+    assert job_ids(scheduler) == [JOB_ID]
+
+def test_catch_up_run_is_recorded_for_original_job(tmp_path):
+    scheduler = make_scheduler(tmp_path)
+    scheduled = datetime.now(timezone.utc) - timedelta(minutes=5)
+    scheduler._on_job_finished(SimpleNamespace(
+        job_id=JOB_ID + CATCHUP_SUFFIX, exception=None, scheduled_run_time=scheduled
+    ))
+    assert scheduler.last_run(JOB_ID) == scheduled.timestamp()
+    assert scheduler.last_run(JOB_ID + CATCHUP_SUFFIX) is None
+    
+    # 기록이 남아 있으면 재시작 뒤에도 같은 예정 시각을 다시 실행하지 않음
+    restarted = make_scheduler(tmp_path)
+    restarted.schedule_daily_news(callback, scheduled.strftime('%H:%M'), 'UTC', job_id=JOB_ID)
+    assert job_ids(restarted) == [JOB_ID]
+
+def test_remove_jobs_with_prefix_keeps_catch_up_of_kept_jobs(tmp_path):
+    scheduler = make_scheduler(tmp_path)
+    scheduler._record_run(JOB_ID, time.time() - 86400)
+    scheduler.schedule_daily_news(callback, minutes_ago(5), 'UTC', job_id=JOB_ID)
+    scheduler.schedule_daily_news(callback, minutes_ago(5), 'UTC', job_id='daily_news:456')
+    
+    scheduler.remove_jobs_with_prefix('daily_news:', keep=(JOB_ID,))
+    assert job_ids(scheduler) == [JOB_ID, JOB_ID + CATCHUP_SUFFIX]
+
+def test_stagger_offset_is_stable_and_in_window():
+    offsets = [stagger_offset(f'channel:{i}', 60) for i in range(50)]
+    assert offsets == [stagger_offset(f'channel:{i}', 60) for i in range(50)]
+    assert all(0 <= offset < 60 for offset in offsets)
+    assert stagger_offset('channel:1', 0) == 0
@@ -0,0 +1,251 @@
+import asyncio
+import heapq
+import itertools
+import logging
+import time
+from collections import deque
+from typing import Deque, Dict, List, Optional
+
+from utils.metrics import counter, gauge, histogram
+
+logger = logging.getLogger(__name__)
+
+SEND_SECONDS = histogram('newsbot_discord_send_seconds', 'Discord 메시지 전송 요청 시간',
+                         buckets=(0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10))
+SEND_WAIT_SECONDS = histogram('newsbot_discord_send_wait_seconds', '전송 요청 후 전송 시작까지 대기 시간')
+SEND_RESULTS = counter('newsbot_discord_messages_total', 'Discord 메시지 전송 결과', ['result'])
+QUEUE_DEPTH = gauge('newsbot_discord_queue_depth', '전송을 기다리는 메시지 묶음 수')
+
+# 우선순위 (작을수록 먼저 전송)
+PRIORITY_SCHEDULED = 0  # 예약된 뉴스 전송
+PRIORITY_MANUAL = 10  # !뉴스 등 수동 요청
+
+class TokenBucket:
+    """초당 rate개씩 채워지고 최대 capacity개까지 모이는 토큰 버킷"""
+    
+    def __init__(self, rate: float, capacity: float):
+        self.rate = rate
+        self.capacity = capacity
+        self.tokens = capacity
+        self.updated = time.monotonic()
+    
+    def _refill(self):
+        now = time.monotonic()
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+    
+    def delay(self) -> float:
+        """토큰 하나를 쓰기까지 기다려야 하는 시간(초, 0이면 바로 사용 가능)"""
+        self._refill()
+        return 0.0 if self.tokens >= 1 else (1 - self.tokens) / self.rate
+    
+    def consume(self):
+        self._refill()
+        self.tokens -= 1
+    
+    def pause(self, seconds: float):
+        """서버가 요청 한도 초과를 알려온 경우 일정 시간 토큰 사용 중지"""
+        self._refill()
+        self.tokens = min(self.tokens, 1 - seconds * self.rate)
+
+class MessageDispatcher:
+    """Discord 메시지 전송 디스패처
+    
+    채널별/전체 토큰 버킷으로 요청 한도 안에서 최대한 빠르게 보내고,
+    우선순위 큐로 예약 전송을 수동 요청보다 먼저 처리합니다.
+    한 번에 요청한 메시지 묶음은 순서대로 이어서 보내며, 같은 채널의 묶음끼리는
+    섞이지 않습니다. (같은 우선순위면 요청 순서대로)
+    
+    Args:
+        workers: 동시에 전송하는 채널 수
+        channel_rate / channel_burst: 채널별 초당 메시지 수 / 연속 전송 가능 수
+        global_rate / global_burst: 봇 전체 초당 메시지 수 / 연속 전송 가능 수
+        max_retries: 요청 한도 초과(429)나 서버 오류(5xx) 시 재시도 횟수
+    """
+    
+    def __init__(self, workers: int = 8, channel_rate: float = 1.0, channel_burst: int = 5,
+                 global_rate: float = 45.0, global_burst: int = 50, max_retries: int = 3,
+                 retry_base_delay: float = 1.0):
+        self.workers = max(1, workers)
+        self.channel_rate = channel_rate
+        self.channel_burst = channel_burst
+        self.max_retries = max_retries
+        self.retry_base_delay = retry_base_delay
+        
+        self._global_bucket = TokenBucket(global_rate, global_burst)
+        self._channel_buckets: Dict[int, TokenBucket] = {}
+        self._queue: Optional[asyncio.PriorityQueue] = None
+        self._pending: Dict[int, list] = {}  # 전송 중인 채널 → 대기 중인 묶음 (힙)
+        self._tasks: List[asyncio.Task] = []
+        self._sequence = itertools.count()
+        
+        # 통계
+        self._sent = 0
+        self._failed = 0
+        self._retries = 0
+        self._rate_limited = 0
+        self._latencies: Deque[float] = deque(maxlen=500)  # 메시지당 전송 요청 시간
+        self._waits: Deque[float] = deque(maxlen=500)  # 요청 후 전송 시작까지 대기 시간
+    
+    def start(self):
+        """전송 워커 시작"""
+        if self._tasks:
+            return
+        
+        self._queue = asyncio.PriorityQueue()
+        QUEUE_DEPTH.set_function(self.queue_depth)
+        self._tasks = [asyncio.create_task(self._worker()) for _ in range(self.workers)]
+        logger.info(f"메시지 디스패처 시작 (워커: {self.workers}개)")
+    
+    async def close(self):
+        """전송 워커 종료 (남은 요청은 취소)"""
+        jobs = [job for pending in self._pending.values() for job in pending]
+        while self._queue and not self._queue.empty():
+            jobs.append(self._queue.get_nowait())
+        
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks = []
+        
+        # 대기 중이던 요청자에게 취소 알림
+        for job in jobs:
+            job[4].cancel()
+    
+    async def send(self, channel, messages: List, priority: int = PRIORITY_MANUAL) -> int:
+        """메시지 묶음을 채널로 순서대로 전송하고 보낸 개수 반환
+        
+        메시지는 문자열 또는 channel.send 인자 딕셔너리(content, embeds 등)입니다.
+        전송에 실패하면 남은 메시지는 보내지 않고 예외를 다시 발생시킵니다.
+        """
+        if not self._tasks:
+            self.start()
+        
+        # (우선순위, 요청 순서)로 정렬되므로 뒤쪽 값은 비교되지 않음
+        future = asyncio.get_running_loop().create_future()
+        await self._queue.put((priority, next(self._sequence), time.monotonic(), channel, future, list(messages)))
+        return await future
+    
+    async def _worker(self):
+        while True:
+            job = await self._queue.get()
+            channel_id = job[3].id
+            
+            # 이미 다른 워커가 이 채널로 전송 중이면 그 워커가 이어서 처리
+            if channel_id in self._pending:
+                heapq.heappush(self._pending[channel_id], job)
+                continue
+            
+            self._pending[channel_id] = []
+            try:
+                while job:
+                    await self._run(job)
+                    pending = self._pending[channel_id]
+                    job = heapq.heappop(pending) if pending else None
+            finally:
+                del self._pending[channel_id]
+    
+    async def _run(self, job: tuple):
+        _, _, enqueued_at, channel, future, messages = job
+        if future.done():
+            return
+        
+        self._waits.append(time.monotonic() - enqueued_at)
+        SEND_WAIT_SECONDS.observe(self._waits[-1])
+        sent = 0
+        try:
+            for message in messages:
+                await self._send_one(channel, message)
+                sent += 1
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except Exception as e:
+            self._failed += len(messages) - sent
+            SEND_RESULTS.inc(len(messages) - sent, result='failed')
+            logger.error(f"메시지 전송 실패 (채널: {channel.id}, {sent}/{len(messages)}개 전송): {e}")
+            if not future.done():
+                future.set_exception(e)
+        else:
+            if not future.done():
+                future.set_result(sent)
+    
+    def _channel_bucket(self, channel_id: int) -> TokenBucket:
+        bucket = self._channel_buckets.get(channel_id)
+        if bucket is None:
+            bucket = self._channel_buckets[channel_id] = TokenBucket(self.channel_rate, self.channel_burst)
+        return bucket
+    
+    async def _acquire(self, bucket: TokenBucket):
+        """채널 버킷과 전체 버킷에서 토큰을 하나씩 얻을 때까지 대기"""
+        while True:
+            delay = max(bucket.delay(), self._global_bucket.delay())
+            if delay <= 0:
+                bucket.consume()
+                self._global_bucket.consume()
+                return
+            await asyncio.sleep(delay)
+    
+    async def _send_one(self, channel, message):
+        """메시지 하나 전송 (요청 한도 초과/서버 오류는 제한된 횟수만큼 재시도)"""
+        bucket = self._channel_bucket(channel.id)
+        
+        for attempt in range(self.max_retries + 1):
+            await self._acquire(bucket)
+            started = time.monotonic()
+            try:
+                if isinstance(message, dict):
+                    await channel.send(**message)
+                else:
+                    await channel.send(message)
+            except Exception as e:
+                # discord.RateLimited는 retry_after, HTTPException은 status를 가짐
+                status = getattr(e, 'status', None)
+                retry_after = getattr(e, 'retry_after', None)
+                rate_limited = status == 429 or retry_after is not None
+                if attempt >= self.max_retries or not (rate_limited or (status or 0) >= 500):
+                    raise
+                
+                delay = retry_after if retry_after is not None else self.retry_base_delay * 2 ** attempt
+                self._retries += 1
+                SEND_RESULTS.inc(result='retried')
+                logger.warning(f"메시지 전송 재시도 {attempt + 1}/{self.max_retries} "
+                               f"(채널: {channel.id}, {delay:.1f}초 후): {e}")
+                if rate_limited:
+                    # 채널 버킷을 멈춰 같은 채널의 다음 전송도 함께 기다리게 함
+                    self._rate_limited += 1
+                    bucket.pause(delay)
+                else:
+                    await asyncio.sleep(delay)
+            else:
+                self._latencies.append(time.monotonic() - started)
+                SEND_SECONDS.observe(self._latencies[-1])
+                SEND_RESULTS.inc(result='sent')
+                self._sent += 1
+                return
+    
+    def queue_depth(self) -> int:
+        """전송을 기다리는 메시지 묶음 수"""
+        queued = self._queue.qsize() if self._queue else 0
+        return queued + sum(len(pending) for pending in self._pending.values())
+    
+    def stats(self) -> Dict:
+        """큐 길이와 전송 지연 통계"""
+        latencies = sorted(self._latencies)
+        waits = sorted(self._waits)
+        
+        def percentile(values: List[float], ratio: float) -> float:
+            return values[min(len(values) - 1, int(len(values) * ratio))] if values else 0.0
+        
+        return {
+            'queue_depth': self.queue_depth(),
+            'active_channels': len(self._pending),
+            'sent': self._sent,
+            'failed': self._failed,
+            'retries': self._retries,
+            'rate_limited': self._rate_limited,
+            'latency_p50': percentile(latencies, 0.5),
+            'latency_p95': percentile(latencies, 0.95),
+            'wait_p50': percentile(waits, 0.5),
+            'wait_p95': percentile(waits, 0.95)
+        }
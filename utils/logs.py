@@ -0,0 +1,111 @@
+import json
+import logging
+import logging.handlers
+import queue
+import time
+import uuid
+from contextlib import contextmanager
+from contextvars import ContextVar
+from datetime import datetime, timezone
+from typing import Optional
+
+logger = logging.getLogger(__name__)
+
+TEXT_FORMAT = '%(asctime)s - %(name)s - %(levelname)s - [%(digest_id)s] %(message)s'
+
+# 리포트 한 번(수집 → 요약 → 전송)의 로그를 묶는 ID (asyncio 작업마다 따로 유지되고 하위 작업에 전달됨)
+digest_id: ContextVar[str] = ContextVar('digest_id', default='-')
+
+# LogRecord 기본 속성 (이 외의 속성은 extra로 넘긴 값으로 보고 JSON에 포함)
+_RECORD_ATTRS = set(vars(logging.LogRecord('', 0, '', 0, '', None, None))) | {'message', 'asctime', 'digest_id'}
+
+def new_digest_id(kind: str) -> str:
+    """현재 작업에 새 리포트 ID를 지정하고 반환 (예: daily-1a2b3c4d)"""
+    value = f"{kind}-{uuid.uuid4().hex[:8]}"
+    digest_id.set(value)
+    return value
+
+class DigestIdFilter(logging.Filter):
+    """로그 레코드에 현재 리포트 ID 추가 (로그를 남긴 작업에서 실행되어야 하므로 큐에 넣기 전에 적용)"""
+    
+    def filter(self, record):
+        record.digest_id = digest_id.get()
+        return True
+
+class JsonFormatter(logging.Formatter):
+    """한 줄에 하나씩 JSON 객체로 기록 (extra로 넘긴 span, duration_ms 등도 키로 포함)"""
+    
+    def format(self, record):
+        entry = {
+            'time': datetime.fromtimestamp(record.created, tz=timezone.utc).isoformat(timespec='milliseconds'),
+            'level': record.levelname,
+            'logger': record.name,
+            'digest_id': getattr(record, 'digest_id', '-'),
+            'message': record.getMessage()
+        }
+        entry.update((key, value) for key, value in vars(record).items() if key not in _RECORD_ATTRS)
+        if record.exc_info:
+            entry['exc_info'] = self.formatException(record.exc_info)
+        return json.dumps(entry, ensure_ascii=False, default=str)
+
+def setup_logging(path: str, level: str = 'INFO', json_format: bool = False, max_bytes: int = 10 * 1024 * 1024,
+                  backup_count: int = 5, when: str = '') -> logging.handlers.QueueListener:
+    """루트 로거가 큐에만 넣고, 별도 스레드(QueueListener)가 파일/콘솔에 쓰도록 설정
+    
+    이벤트 루프에서 로그를 남겨도 디스크 쓰기를 기다리지 않습니다.
+    
+    Args:
+        path: 로그 파일 경로
+        level: 로그 레벨
+        json_format: True면 파일에 JSON 한 줄씩 기록 (콘솔은 항상 텍스트)
+        max_bytes: 파일이 이 크기를 넘으면 교체 (when을 지정하면 무시)
+        backup_count: 보관할 이전 파일 수
+        when: 시간 기준 교체 주기 (예: 'midnight', 'H', 빈 문자열이면 크기 기준)
+    
+    Returns:
+        시작된 리스너 (종료 시 stop()으로 남은 로그를 모두 기록)
+    """
+    if when:
+        file_handler = logging.handlers.TimedRotatingFileHandler(path, when=when, backupCount=backup_count,
+                                                                 encoding='utf-8')
+    else:
+        file_handler = logging.handlers.RotatingFileHandler(path, maxBytes=max_bytes, backupCount=backup_count,
+                                                            encoding='utf-8')
+    file_handler.setFormatter(JsonFormatter() if json_format else logging.Formatter(TEXT_FORMAT))
+    
+    console_handler = logging.StreamHandler()
+    console_handler.setFormatter(logging.Formatter(TEXT_FORMAT))
+    
+    log_queue = queue.SimpleQueue()
+    queue_handler = logging.handlers.QueueHandler(log_queue)
+    queue_handler.addFilter(DigestIdFilter())
+    
+    root = logging.getLogger()
+    for handler in root.handlers[:]:
+        root.removeHandler(handler)
+    root.addHandler(queue_handler)
+    root.setLevel(level.upper())
+    
+    listener = logging.handlers.QueueListener(log_queue, file_handler, console_handler, respect_handler_level=True)
+    listener.start()
+    return listener
+
+@contextmanager
+def span(name: str, log: Optional[logging.Logger] = None, **fields):
+    """블록 실행 시간을 로그로 기록 (JSON 로그에는 span, duration_ms, status와 fields가 키로 남음)
+    
+    Args:
+        name: 단계 이름 (예: fetch, summarize, send)
+        log: 기록할 로거 (기본값: utils.logs)
+        fields: 함께 기록할 값 (예: channel_id)
+    """
+    log = log or logger
+    started = time.perf_counter()
+    status = 'error'
+    try:
+        yield
+        status = 'ok'
+    finally:
+        duration_ms = round((time.perf_counter() - started) * 1000, 1)
+        log.info(f"{name} {'완료' if status == 'ok' else '실패'} ({duration_ms:.0f}ms)",
+                 extra={'span': name, 'duration_ms': duration_ms, 'status': status, **fields})
@@ -0,0 +1,256 @@
+import asyncio
+import bisect
+import logging
+import time
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
+
+from aiohttp import web
+
+logger = logging.getLogger(__name__)
+
+# 기본 히스토그램 구간(초)
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60)
+
+def _escape(value) -> str:
+    return str(value).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+def _format_labels(names: Sequence[str], values: Tuple, extra: str = '') -> str:
+    pairs = [f'{name}="{_escape(value)}"' for name, value in zip(names, values)]
+    if extra:
+        pairs.append(extra)
+    return '{' + ','.join(pairs) + '}' if pairs else ''
+
+def _format_value(value: float) -> str:
+    return str(int(value)) if float(value).is_integer() else repr(float(value))
+
+class _Metric:
+    """레이블별 값을 가지는 지표 기본 클래스"""
+    
+    kind = ''
+    
+    def __init__(self, name: str, description: str, labels: Sequence[str] = ()):
+        self.name = name
+        self.description = description
+        self.labels = tuple(labels)
+        self._values: Dict[Tuple, object] = {}
+    
+    def _key(self, labels: Dict) -> Tuple:
+        return tuple(labels.get(name, '') for name in self.labels)
+    
+    def samples(self) -> List[Tuple[str, str, float]]:
+        """(이름 접미사, 레이블 문자열, 값) 목록"""
+        raise NotImplementedError
+    
+    def render(self) -> List[str]:
+        lines = [f'# HELP {self.name} {self.description}', f'# TYPE {self.name} {self.kind}']
+        for suffix, labels, value in self.samples():
+            lines.append(f'{self.name}{suffix}{labels} {_format_value(value)}')
+        return lines
+
+class Counter(_Metric):
+    """누적 카운터"""
+    
+    kind = 'counter'
+    
+    def inc(self, amount: float = 1, **labels):
+        key = self._key(labels)
+        self._values[key] = self._values.get(key, 0) + amount
+    
+    def value(self, **labels) -> float:
+        return self._values.get(self._key(labels), 0)
+    
+    def samples(self):
+        return [('', _format_labels(self.labels, key), value) for key, value in sorted(self._values.items())]
+
+class Gauge(_Metric):
+    """현재 값 (set으로 지정하거나, 수집할 때 함수를 호출해 계산)"""
+    
+    kind = 'gauge'
+    
+    def __init__(self, name: str, description: str, labels: Sequence[str] = ()):
+        super().__init__(name, description, labels)
+        self._functions: Dict[Tuple, Callable[[], float]] = {}
+    
+    def set(self, value: float, **labels):
+        self._values[self._key(labels)] = value
+    
+    def set_function(self, function: Callable[[], float], **labels):
+        self._functions[self._key(labels)] = function
+    
+    def value(self, **labels) -> float:
+        key = self._key(labels)
+        if key in self._functions:
+            return self._functions[key]()
+        return self._values.get(key, 0)
+    
+    def samples(self):
+        keys = sorted(set(self._values) | set(self._functions))
+        return [('', _format_labels(self.labels, key), self.value(**dict(zip(self.labels, key)))) for key in keys]
+
+class Histogram(_Metric):
+    """구간별 관측 횟수, 합계, 개수를 기록하는 히스토그램"""
+    
+    kind = 'histogram'
+    
+    def __init__(self, name: str, description: str, labels: Sequence[str] = (),
+                 buckets: Sequence[float] = DEFAULT_BUCKETS):
+        super().__init__(name, description, labels)
+        self.buckets = tuple(sorted(buckets))
+    
+    def observe(self, value: float, **labels):
+        key = self._key(labels)
+        data = self._values.get(key)
+        if data is None:
+            data = self._values[key] = {'counts': [0] * (len(self.buckets) + 1), 'sum': 0.0, 'count': 0, 'max': 0.0}
+        data['counts'][bisect.bisect_left(self.buckets, value)] += 1
+        data['sum'] += value
+        data['count'] += 1
+        data['max'] = max(data['max'], value)
+    
+    def time(self, **labels) -> '_Timer':
+        """with 블록의 실행 시간을 기록"""
+        return _Timer(self, labels)
+    
+    def label_values(self) -> List[Dict]:
+        return [dict(zip(self.labels, key)) for key in sorted(self._values)]
+    
+    def summary(self, **labels) -> Dict:
+        """개수, 평균, 최대값, p50/p95 추정치 (구간 안에서 선형 보간)"""
+        data = self._values.get(self._key(labels))
+        if not data or not data['count']:
+            return {'count': 0, 'avg': 0.0, 'max': 0.0, 'p50': 0.0, 'p95': 0.0}
+        return {
+            'count': data['count'],
+            'avg': data['sum'] / data['count'],
+            'max': data['max'],
+            'p50': self._quantile(data, 0.5),
+            'p95': self._quantile(data, 0.95)
+        }
+    
+    def _quantile(self, data: Dict, q: float) -> float:
+        rank = q * data['count']
+        cumulative = 0
+        lower = 0.0
+        for bound, count in zip(self.buckets + (data['max'],), data['counts']):
+            if count and cumulative + count >= rank:
+                upper = min(bound, data['max'])
+                return lower + (upper - lower) * (rank - cumulative) / count
+            cumulative += count
+            lower = bound
+        return data['max']
+    
+    def samples(self):
+        samples = []
+        for key, data in sorted(self._values.items()):
+            cumulative = 0
+            for bound, count in zip(self.buckets, data['counts']):
+                cumulative += count
+                samples.append(('_bucket', _format_labels(self.labels, key, f'le="{_format_value(bound)}"'),
+                                cumulative))
+            samples.append(('_bucket', _format_labels(self.labels, key, 'le="+Inf"'), data['count']))
+            samples.append(('_sum', _format_labels(self.labels, key), data['sum']))
+            samples.append(('_count', _format_labels(self.labels, key), data['count']))
+        return samples
+
+class _Timer:
+    def __init__(self, histogram: Histogram, labels: Dict):
+        self.histogram = histogram
+        self.labels = labels
+    
+    def __enter__(self):
+        self.started = time.monotonic()
+        return self
+    
+    def __exit__(self, *exc):
+        self.histogram.observe(time.monotonic() - self.started, **self.labels)
+        return False
+
+class MetricsRegistry:
+    """지표 모음 (같은 이름으로 다시 등록하면 기존 지표 반환)"""
+    
+    def __init__(self):
+        self._metrics: Dict[str, _Metric] = {}
+    
+    def _register(self, metric_class, name: str, *args, **kwargs):
+        metric = self._metrics.get(name)
+        if metric is None:
+            metric = self._metrics[name] = metric_class(name, *args, **kwargs)
+        return metric
+    
+    def counter(self, name: str, description: str, labels: Sequence[str] = ()) -> Counter:
+        return self._register(Counter, name, description, labels)
+    
+    def gauge(self, name: str, description: str, labels: Sequence[str] = ()) -> Gauge:
+        return self._register(Gauge, name, description, labels)
+    
+    def histogram(self, name: str, description: str, labels: Sequence[str] = (),
+                  buckets: Sequence[float] = DEFAULT_BUCKETS) -> Histogram:
+        return self._register(Histogram, name, description, labels, buckets)
+    
+    def render(self) -> str:
+        """Prometheus 텍스트 형식으로 변환"""
+        lines = []
+        for metric in self._metrics.values():
+            lines.extend(metric.render())
+        return '\n'.join(lines) + '\n'
+
+# 기본 지표 모음 (모듈 어디서나 같은 지표에 기록)
+REGISTRY = MetricsRegistry()
+counter = REGISTRY.counter
+gauge = REGISTRY.gauge
+histogram = REGISTRY.histogram
+
+class MetricsServer:
+    """Prometheus가 수집할 수 있는 /metrics HTTP 엔드포인트"""
+    
+    def __init__(self, host: str = '127.0.0.1', port: int = 9108, registry: MetricsRegistry = REGISTRY):
+        self.host = host
+        self.port = port
+        self.registry = registry
+        self._runner: Optional[web.AppRunner] = None
+    
+    async def _handle(self, request: web.Request) -> web.Response:
+        return web.Response(body=self.registry.render().encode('utf-8'),
+                            headers={'Content-Type': 'text/plain; version=0.0.4; charset=utf-8'})
+    
+    async def start(self):
+        app = web.Application()
+        app.router.add_get('/metrics', self._handle)
+        self._runner = web.AppRunner(app, access_log=None)
+        await self._runner.setup()
+        await web.TCPSite(self._runner, self.host, self.port).start()
+        logger.info(f"지표 엔드포인트 시작: http://{self.host}:{self.port}/metrics")
+    
+    async def close(self):
+        if self._runner:
+            await self._runner.cleanup()
+            self._runner = None
+
+class LoopLagMonitor:
+    """이벤트 루프 지연 측정 (interval초마다 깨어나 예정보다 늦은 시간을 기록)"""
+    
+    def __init__(self, interval: float = 0.5):
+        self.interval = interval
+        self.lag = histogram('newsbot_event_loop_lag_seconds', '이벤트 루프 지연',
+                             buckets=(0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5))
+        self.current = gauge('newsbot_event_loop_lag_current_seconds', '최근 이벤트 루프 지연')
+        self._task: Optional[asyncio.Task] = None
+    
+    def start(self):
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+    
+    async def _run(self):
+        loop = asyncio.get_running_loop()
+        while True:
+            started = loop.time()
+            await asyncio.sleep(self.interval)
+            lag = max(0.0, loop.time() - started - self.interval)
+            self.lag.observe(lag)
+            self.current.set(lag)
+    
+    async def close(self):
+        if self._task:
+            self._task.cancel()
+            await asyncio.gather(self._task, return_exceptions=True)
+            self._task = None
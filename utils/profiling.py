@@ -0,0 +1,113 @@
+import asyncio
+import cProfile
+import io
+import logging
+import pstats
+import sys
+import threading
+import time
+import traceback
+from typing import Awaitable, Optional, Tuple
+
+from utils.metrics import counter, histogram
+
+logger = logging.getLogger(__name__)
+
+LOOP_BLOCKS = counter('newsbot_event_loop_blocks_total', '임계값보다 오래 이벤트 루프를 막은 횟수')
+LOOP_BLOCK_SECONDS = histogram('newsbot_event_loop_block_seconds', '이벤트 루프를 막은 시간',
+                               buckets=(0.25, 0.5, 1, 2.5, 5, 10, 30, 60))
+
+async def profile_call(awaitable: Awaitable, top: int = 40) -> Tuple[object, str]:
+    """코루틴을 cProfile로 실행하고 (결과, 누적 시간/자체 시간 상위 함수 보고서) 반환
+    
+    프로파일러는 이벤트 루프 스레드 전체를 측정하므로 실행 중 함께 돈 다른 작업도 보고서에 포함됩니다.
+    """
+    profiler = cProfile.Profile()
+    started = time.perf_counter()
+    profiler.enable()
+    try:
+        result = await awaitable
+    finally:
+        profiler.disable()
+    elapsed = time.perf_counter() - started
+    
+    output = io.StringIO()
+    output.write(f"실행 시간: {elapsed:.3f}초\n\n")
+    stats = pstats.Stats(profiler, stream=output).strip_dirs()
+    for sort, title in (('cumulative', '누적 시간 상위'), ('tottime', '자체 시간 상위 (루프를 막는 후보)')):
+        output.write(f"===== {title} {top}개 =====\n")
+        stats.sort_stats(sort).print_stats(top)
+    return result, output.getvalue()
+
+class LoopBlockWatchdog:
+    """이벤트 루프가 threshold초 넘게 멈추면 그때 실행 중이던 스택을 로그로 남기는 감시자
+    
+    루프에서 interval초마다 신호를 갱신하고, 별도 스레드가 신호가 끊긴 시간을 확인합니다.
+    루프가 막힌 동안에는 루프 스레드의 현재 스택을 잡아 기록하므로 어떤 호출이 막았는지 알 수 있습니다.
+    (블록 한 번에 스택 로그 한 번, 풀린 뒤 전체 시간 기록)
+    
+    Args:
+        threshold: 막힘으로 판단할 시간(초)
+        interval: 신호 갱신 주기(초)
+    """
+    
+    def __init__(self, threshold: float = 0.5, interval: float = 0.1):
+        self.threshold = threshold
+        self.interval = interval
+        self.blocks = 0
+        self._heartbeat = time.monotonic()
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._loop_thread_id: Optional[int] = None
+        self._handle: Optional[asyncio.TimerHandle] = None
+        self._thread: Optional[threading.Thread] = None
+        self._stop = threading.Event()
+    
+    def start(self):
+        if self._thread is not None:
+            return
+        
+        self._loop = asyncio.get_running_loop()
+        self._loop_thread_id = threading.get_ident()
+        self._stop.clear()
+        self._beat()
+        self._thread = threading.Thread(target=self._watch, name='loop-watchdog', daemon=True)
+        self._thread.start()
+        logger.info(f"이벤트 루프 감시 시작 (기준: {self.threshold:.2f}초)")
+    
+    def _beat(self):
+        self._heartbeat = time.monotonic()
+        self._handle = self._loop.call_later(self.interval, self._beat)
+    
+    def _watch(self):
+        reported = None  # 이미 스택을 기록한 막힘의 시작 신호
+        while not self._stop.wait(self.interval):
+            heartbeat = self._heartbeat
+            if reported is not None and reported != heartbeat:
+                # 막힘이 풀림 (다시 들어온 신호까지가 막힌 시간)
+                duration = heartbeat - reported - self.interval
+                self._loop.call_soon_threadsafe(self._record_block, duration)
+                logger.warning(f"이벤트 루프 막힘 해제 ({duration:.2f}초)")
+                reported = None
+            
+            stalled = time.monotonic() - heartbeat - self.interval
+            if stalled >= self.threshold and reported is None:
+                reported = heartbeat
+                frame = sys._current_frames().get(self._loop_thread_id)
+                stack = ''.join(traceback.format_stack(frame)) if frame else '(스택 없음)\n'
+                logger.warning(f"이벤트 루프가 {stalled:.2f}초째 멈춰 있습니다. 실행 중인 스택:\n{stack}")
+    
+    def _record_block(self, duration: float):
+        """막힌 시간을 지표에 기록 (/metrics 응답과 같은 루프 스레드에서 실행되도록 감시 스레드가 예약)"""
+        self.blocks += 1
+        LOOP_BLOCKS.inc()
+        LOOP_BLOCK_SECONDS.observe(duration)
+    
+    async def close(self):
+        if self._thread is None:
+            return
+        
+        self._stop.set()
+        if self._handle:
+            self._handle.cancel()
+        await asyncio.to_thread(self._thread.join)
+        self._thread = None
@@ -1,55 +1,241 @@
 from apscheduler.schedulers.asyncio import AsyncIOScheduler
 from apscheduler.triggers.cron import CronTrigger
-from datetime import datetime
+from apscheduler.events import EVENT_JOB_SUBMITTED, EVENT_JOB_EXECUTED, EVENT_JOB_ERROR, EVENT_JOB_MISSED
+from datetime import datetime, timedelta
+from typing import Optional
 from zoneinfo import ZoneInfo
+import hashlib
+import time
 import logging
 
+from utils.metrics import counter, histogram
+from utils.storage import connect
+
 logger = logging.getLogger(__name__)
 
+JOB_SECONDS = histogram('newsbot_job_duration_seconds', '예약 작업 실행 시간', ['job'],
+                        buckets=(0.1, 0.5, 1, 2.5, 5, 10, 30, 60, 120, 300))
+JOB_RUNS = counter('newsbot_job_runs_total', '예약 작업 실행 결과 (missed: 유예 시간이 지나 건너뜀)', ['job', 'result'])
+
+CATCHUP_SUFFIX = ':catchup'  # 놓친 실행을 다시 하는 일회성 작업 ID 꼬리표
+
+def stagger_offset(key: str, window: float) -> float:
+    """key마다 0~window초 사이의 고정된 지연 시간 (재시작해도 같은 값)"""
+    if window <= 0:
+        return 0.0
+    digest = hashlib.sha1(key.encode('utf-8')).digest()
+    return int.from_bytes(digest[:4], 'big') / 2 ** 32 * window
+
 class NewsScheduler:
-    """뉴스 전송 스케줄러"""
+    """뉴스 전송 스케줄러
     
-    def __init__(self):
-        self.scheduler = AsyncIOScheduler()
+    작업은 메모리에 두고, state_path를 지정하면 매일 작업의 마지막 실행 시각을 SQLite에 기록합니다.
+    재시작 등으로 예정 시각을 놓쳤더라도 misfire_grace초가 지나지 않았으면 작업을 등록할 때 바로 한 번 실행합니다.
+    실행 중에 밀린 실행도 유예 시간 안이면 실행하고, 여러 번 밀렸으면 한 번으로 합칩니다.
+    
+    Args:
+        state_path: 마지막 실행 기록 파일 경로 (None이면 놓친 실행을 다시 하지 않음)
+        misfire_grace: 예정 시각이 지나도 실행할 최대 지연 시간(초)
+    """
+    
+    def __init__(self, state_path: Optional[str] = None, misfire_grace: float = 900):
+        self.misfire_grace = misfire_grace
+        self.scheduler = AsyncIOScheduler(job_defaults={
+            'misfire_grace_time': int(misfire_grace),
+            'coalesce': True
+        })
+        self._started_at = {}
+        self._caught_up = set()  # 이미 다시 실행하도록 등록한 (작업 ID, 예정 시각)
+        
+        self.conn = None
+        if state_path:
+            self.conn = connect(state_path)
+            self.conn.execute('''
+                CREATE TABLE IF NOT EXISTS job_runs (
+                    job_id TEXT PRIMARY KEY,
+                    scheduled_at REAL NOT NULL,
+                    finished_at REAL NOT NULL
+                )
+            ''')
         
+        # 작업 실행 시간/마지막 실행 기록
+        self.scheduler.add_listener(self._on_job_submitted, EVENT_JOB_SUBMITTED)
+        self.scheduler.add_listener(self._on_job_finished, EVENT_JOB_EXECUTED | EVENT_JOB_ERROR)
+        self.scheduler.add_listener(self._on_job_missed, EVENT_JOB_MISSED)
+    
     def start(self):
-        """스케줄러 시작"""
+        """스케줄러 시작 (이미 실행 중이면 무시)"""
+        if self.scheduler.running:
+            return
         self.scheduler.start()
         logger.info("스케줄러가 시작되었습니다.")
     
+    def _on_job_submitted(self, event):
+        self._started_at[event.job_id] = time.monotonic()
+    
+    def _on_job_finished(self, event):
+        started = self._started_at.pop(event.job_id, None)
+        if started is not None:
+            JOB_SECONDS.observe(time.monotonic() - started, job=event.job_id)
+        JOB_RUNS.inc(job=event.job_id, result='error' if event.exception else 'success')
+        
+        # 놓친 실행을 다시 한 경우에도 원래 작업의 실행으로 기록
+        job_id = event.job_id.removesuffix(CATCHUP_SUFFIX)
+        self._record_run(job_id, event.scheduled_run_time.timestamp())
+    
+    def _on_job_missed(self, event):
+        JOB_RUNS.inc(job=event.job_id, result='missed')
+        logger.warning(f"작업 '{event.job_id}'의 예정 시각({event.scheduled_run_time})이 유예 시간을 넘겨 건너뜁니다.")
+    
+    def _record_run(self, job_id: str, scheduled_at: float):
+        if self.conn is None:
+            return
+        self.conn.execute(
+            'INSERT OR REPLACE INTO job_runs (job_id, scheduled_at, finished_at) VALUES (?, ?, ?)',
+            (job_id, scheduled_at, time.time())
+        )
+    
+    def last_run(self, job_id: str) -> Optional[float]:
+        """작업의 마지막 실행 예정 시각 (유닉스 시각, 기록이 없으면 None)"""
+        if self.conn is None:
+            return None
+        row = self.conn.execute('SELECT scheduled_at FROM job_runs WHERE job_id = ?', (job_id,)).fetchone()
+        return row['scheduled_at'] if row else None
+    
     def shutdown(self):
-        """스케줄러 종료"""
+        """스케줄러 종료 (실행 중이 아니면 무시)"""
+        if not self.scheduler.running:
+            return
         self.scheduler.shutdown()
         logger.info("스케줄러가 종료되었습니다.")
     
-    def schedule_daily_news(self, callback, time_str: str = "09:00", timezone_name: str = "Asia/Seoul"):
+    def schedule_daily_news(self, callback, time_str: str = "09:00", timezone_name: str = "Asia/Seoul",
+                            job_id: str = 'daily_news', args: tuple = (), stagger: float = 0):
         """매일 정해진 시간에 뉴스 전송 스케줄링
         
         Args:
             callback: 실행할 비동기 함수
             time_str: 실행 시간 (HH:MM 형식)
             timezone_name: 타임존 이름 (예: Asia/Seoul)
+            job_id: 작업 ID (채널/전송 시간별로 따로 등록할 때 사용)
+            args: callback에 전달할 인자
+            stagger: 작업 ID마다 고정된 0~stagger초 지연을 더해 같은 시간 작업이 한꺼번에 실행되지 않게 함
+        """
+        self._schedule_daily(callback, time_str, timezone_name, job_id, f'일일 뉴스 전송 ({time_str})', args,
+                             offset=stagger_offset(job_id, stagger))
+        logger.info(f"매일 {time_str} ({timezone_name})에 뉴스 전송이 스케줄되었습니다. ({job_id})")
+    
+    def schedule_prefetch(self, callback, time_str: str = "09:00", minutes_before: int = 5,
+                          timezone_name: str = "Asia/Seoul", job_id: str = 'prefetch_news', args: tuple = (),
+                          stagger: float = 0):
+        """뉴스 전송 시간보다 minutes_before분 먼저 리포트를 준비하도록 스케줄링
+        
+        Args:
+            callback: 실행할 비동기 함수
+            time_str: 뉴스 전송 시간 (HH:MM 형식)
+            minutes_before: 몇 분 먼저 실행할지
+            timezone_name: 타임존 이름 (예: Asia/Seoul)
+            job_id: 작업 ID
+            args: callback에 전달할 인자
+            stagger: 작업 ID마다 고정된 0~stagger초 지연 (minutes_before분보다 짧게)
+        """
+        hour, minute = self._parse_time(time_str)
+        total = (hour * 60 + minute - minutes_before) % (24 * 60)
+        prefetch_time = f"{total // 60:02d}:{total % 60:02d}"
+        
+        self._schedule_daily(callback, prefetch_time, timezone_name, job_id,
+                             f'뉴스 리포트 미리 준비 ({time_str} 전송분)', args,
+                             offset=stagger_offset(job_id, stagger))
+        logger.info(f"매일 {prefetch_time} ({timezone_name})에 뉴스 리포트를 미리 준비합니다.")
+    
+    def schedule_interval(self, callback, seconds: float, job_id: str, name: str, args: tuple = (),
+                          start_delay: float = 0, jitter: float = 0):
+        """seconds초마다 실행되는 작업 등록 (이전 실행이 아직 끝나지 않았으면 이번 실행은 건너뜀)
+        
+        Args:
+            callback: 실행할 비동기 함수
+            seconds: 실행 주기(초)
+            job_id: 작업 ID
+            name: 작업 이름
+            args: callback에 전달할 인자
+            start_delay: 첫 실행까지 기다릴 시간(초)
+            jitter: 실행마다 0~jitter초 사이의 무작위 지연을 더함
         """
+        self.scheduler.add_job(
+            callback,
+            'interval',
+            seconds=seconds,
+            jitter=int(jitter) or None,
+            args=args,
+            id=job_id,
+            name=name,
+            next_run_time=datetime.now().astimezone() + timedelta(seconds=start_delay),
+            replace_existing=True,
+            max_instances=1,
+            coalesce=True
+        )
+    
+    def _parse_time(self, time_str: str):
+        """HH:MM 문자열을 (시, 분)으로 변환"""
         try:
-            hour, minute = map(int, time_str.split(':'))
-            
-            # Cron 표현식으로 매일 특정 시간에 실행
-            trigger = CronTrigger(hour=hour, minute=minute, timezone=ZoneInfo(timezone_name))
-            
-            self.scheduler.add_job(
-                callback,
-                trigger=trigger,
-                id='daily_news',
-                name='일일 뉴스 전송',
-                replace_existing=True
-            )
-            
-            logger.info(f"매일 {time_str} ({timezone_name})에 뉴스 전송이 스케줄되었습니다.")
-            
-        except ValueError as e:
+            return tuple(map(int, time_str.split(':')))
+        except ValueError:
             logger.error(f"시간 형식이 올바르지 않습니다: {time_str}")
             raise
     
+    def _schedule_daily(self, callback, time_str: str, timezone_name: str, job_id: str, name: str,
+                        args: tuple = (), offset: float = 0):
+        """매일 특정 시간(+offset초)에 실행되는 작업 등록"""
+        hour, minute = self._parse_time(time_str)
+        seconds = (hour * 3600 + minute * 60 + int(offset)) % (24 * 3600)
+        
+        # Cron 표현식으로 매일 특정 시간에 실행
+        trigger = CronTrigger(hour=seconds // 3600, minute=seconds // 60 % 60, second=seconds % 60,
+                              timezone=ZoneInfo(timezone_name))
+        
+        self.scheduler.add_job(
+            callback,
+            trigger=trigger,
+            args=args,
+            id=job_id,
+            name=name,
+            replace_existing=True,
+            max_instances=1
+        )
+        self._catch_up(callback, trigger, job_id, name, args)
+    
+    def _catch_up(self, callback, trigger: CronTrigger, job_id: str, name: str, args: tuple):
+        """가장 최근 예정 시각에 실행하지 못했고 유예 시간 안이면 지금 한 번 실행
+        
+        실행 기록이 없는 작업(새로 등록한 작업)은 다시 실행하지 않습니다.
+        """
+        last_run = self.last_run(job_id)
+        if last_run is None:
+            return
+        
+        now = datetime.now(trigger.timezone)
+        previous = trigger.get_next_fire_time(None, now - timedelta(days=1, seconds=-1))
+        if previous is None or previous > now or previous.timestamp() <= last_run:
+            return
+        if (job_id, previous) in self._caught_up:
+            return
+        if (now - previous).total_seconds() > self.misfire_grace:
+            logger.warning(f"작업 '{job_id}'의 예정 시각({previous})을 놓쳤지만 유예 시간이 지나 건너뜁니다.")
+            return
+        
+        logger.warning(f"작업 '{job_id}'의 예정 시각({previous})을 놓쳐 지금 실행합니다.")
+        self._caught_up.add((job_id, previous))
+        self.scheduler.add_job(
+            callback,
+            'date',
+            run_date=now,
+            args=args,
+            id=job_id + CATCHUP_SUFFIX,
+            name=f'{name} (놓친 실행)',
+            replace_existing=True,
+            misfire_grace_time=None
+        )
+    
     def schedule_test_news(self, callback, seconds: int = 10):
         """테스트용 스케줄링 (몇 초 후 실행)
         
@@ -77,6 +263,12 @@ class NewsScheduler:
         except Exception as e:
             logger.error(f"작업 제거 중 오류: {e}")
     
+    def remove_jobs_with_prefix(self, prefix: str, keep: tuple = ()):
+        """ID가 prefix로 시작하는 작업 제거 (keep에 있는 ID와 그 작업의 놓친 실행은 유지)"""
+        for job in self.get_jobs():
+            if job.id.startswith(prefix) and job.id.removesuffix(CATCHUP_SUFFIX) not in keep:
+                self.remove_job(job.id)
+    
     def get_jobs(self):
         """현재 스케줄된 작업 목록 반환"""
         return self.scheduler.get_jobs()
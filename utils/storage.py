@@ -0,0 +1,37 @@
+import os
+import sqlite3
+import logging
+from contextlib import contextmanager
+
+logger = logging.getLogger(__name__)
+
+def connect(path: str) -> sqlite3.Connection:
+    """로컬 SQLite 데이터베이스 연결 (WAL 모드)
+    
+    Args:
+        path: 데이터베이스 파일 경로 (상위 폴더가 없으면 생성)
+    """
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    
+    conn = sqlite3.connect(path, timeout=5, check_same_thread=False, isolation_level=None)
+    conn.row_factory = sqlite3.Row
+    
+    # 읽기와 쓰기가 서로를 막지 않도록 WAL 모드 사용
+    conn.execute('PRAGMA journal_mode=WAL')
+    conn.execute('PRAGMA synchronous=NORMAL')
+    
+    logger.info(f"로컬 저장소 연결: {path}")
+    return conn
+
+@contextmanager
+def transaction(conn: sqlite3.Connection):
+    """여러 쓰기를 한 번에 커밋 (connect()의 연결은 자동 커밋 모드라 문장마다 커밋되므로 명시적으로 BEGIN/COMMIT)"""
+    conn.execute('BEGIN')
+    try:
+        yield conn
+    except BaseException:
+        conn.execute('ROLLBACK')
+        raise
+    conn.execute('COMMIT')